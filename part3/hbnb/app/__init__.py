@@ -2,35 +2,55 @@ from flask import Flask
 from flask_restx import Api
 from app.extensions import bcrypt, jwt, db
 from flask_cors import CORS
+from app.startup import StartupTimer
 
 # Import models to ensure they are registered with SQLAlchemy
 import app.models
 
 HBnB_FACADE = None
+# Response headers browsers may read on cross-origin requests
+CORS_EXPOSE_HEADERS = ['X-Next-Cursor', 'ETag', 'Last-Modified']
 
 def create_app(config_class="config.DevelopmentConfig"):
     """App Factory function to create and configure the Flask application"""
     global HBnB_FACADE
+    timer = StartupTimer()
     
     # 1. Initialize Flask application
     app = Flask(__name__)
-    CORS(app)
+    CORS(app, expose_headers=CORS_EXPOSE_HEADERS)
 
     # 2. Load configuration from the provided config class
-    app.config.from_object(config_class)
+    with timer.phase('config'):
+        app.config.from_object(config_class)
 
     # 3. Initialize extensions
-    jwt.init_app(app)
-    bcrypt.init_app(app)
-    db.init_app(app)
-
-    # create database tables
-    with app.app_context():
-        db.create_all()
-        
+    with timer.phase('extensions'):
+        jwt.init_app(app)
+        bcrypt.init_app(app)
+        db.init_app(app)
+
+        # Importing it registers the revoked token check on jwt, once
+        from app.api.v2 import security  # noqa: F401
+
+    # No DDL at startup: the schema is managed by migrations (flask --app run db-upgrade)
+    with timer.phase('facade'), app.app_context():
+        from .persistence.engine import configure_engine
+        from .persistence.soft_delete import hide_deleted_rows
+        configure_engine(app)
+        hide_deleted_rows()
+
         if HBnB_FACADE is None:
             from .services.facade import HBnBFacade
-            HBnB_FACADE = HBnBFacade()
+            from .persistence.cache import build_cache
+            from .services.passwords import PasswordVerifier
+            from .jobs import BackgroundWorker
+            HBnB_FACADE = HBnBFacade(
+                cache=build_cache(app.config),
+                password_verifier=PasswordVerifier.from_config(app.config),
+                log_rounds=app.config.get('BCRYPT_LOG_ROUNDS', 12),
+                job_runner=BackgroundWorker.from_config(app.config)
+            )
 
     # 4. Define Swagger Authorizations
     authorizations = {
@@ -43,30 +63,49 @@ def create_app(config_class="config.DevelopmentConfig"):
     }
 
     # 5. Initialize Flask-RESTX API with Swagger config
-    api = Api(
-        app,
-        version='2.0',
-        title='HBnB API',
-        description='HBnB Application API',
-        doc='/api/v2/docs',
-        authorizations=authorizations,
-        security='jwt'
-    )
+    # API_DOCS off skips the Swagger UI and swagger.json (built on first request anyway)
+    docs = app.config.get('API_DOCS', True)
+    with timer.phase('api'):
+        api = Api(
+            version='2.0',
+            title='HBnB API',
+            description='HBnB Application API',
+            doc='/api/v2/docs' if docs else False,
+            authorizations=authorizations,
+            security='jwt'
+        )
+        # add_specs given to the constructor is reset by init_app
+        api.init_app(app, add_specs=docs)
 
     # 6. Register API namespaces (blueprints)
-    from app.api.v2.users import users_ns
-    from app.api.v2.places import places_ns
-    from app.api.v2.reviews import reviews_ns
-    from app.api.v2.amenities import amenities_ns
-    from app.api.v2.auth import auth_ns
-
-    # Add namespaces with prefix
-    api.add_namespace(users_ns, path='/api/v2/users')
-    api.add_namespace(places_ns, path='/api/v2/places')
-    api.add_namespace(reviews_ns, path='/api/v2/reviews')
-    api.add_namespace(amenities_ns, path='/api/v2/amenities')
-    api.add_namespace(auth_ns, path='/api/v2/auth')
+    with timer.phase('namespaces'):
+        from app.api.v2.users import users_ns
+        from app.api.v2.places import places_ns
+        from app.api.v2.reviews import reviews_ns
+        from app.api.v2.amenities import amenities_ns
+        from app.api.v2.auth import auth_ns
+        from app.api.v2.imports import import_ns
+        from app.api.v2.export import export_ns
+
+        # Add namespaces with prefix
+        api.add_namespace(users_ns, path='/api/v2/users')
+        api.add_namespace(places_ns, path='/api/v2/places')
+        api.add_namespace(reviews_ns, path='/api/v2/reviews')
+        api.add_namespace(amenities_ns, path='/api/v2/amenities')
+        api.add_namespace(auth_ns, path='/api/v2/auth')
+        api.add_namespace(import_ns, path='/api/v2/import')
+        api.add_namespace(export_ns, path='/api/v2/export')
+
+    # 7. One commit per write request (unit of work)
+    from app.persistence.unit_of_work import register_unit_of_work
+    register_unit_of_work(app)
+
+    # 8. Register CLI maintenance commands
+    with timer.phase('commands'):
+        from app.commands import register_commands
+        register_commands(app)
 
+    timer.report(app)
     return app
 
 def get_facade():
@@ -1,23 +1,15 @@
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Resource, fields
+from app.api.v2.namespace import Namespace
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from app import HBnB_FACADE
+from app.api.v2.security import admin_required
+from app.models import Amenity
+from app.api.v2.conditional import conditional, expected_version, if_match
+from app.api.v2.serializers import RowSerializer
 
 facade = HBnB_FACADE
 amenities_ns = Namespace('amenities', description='Amenity operations')
 
-# Decorator admin_required
-def admin_required():
-    """Custom decorator to ensure the authenticated user has Admin privilege."""
-    def wrapper(fn):
-        @jwt_required()
-        def decorated_view(*args, **kwargs):
-            claims = get_jwt()
-            if claims.get("is_admin", False) is not True:
-                amenities_ns.abort(403, message="Access forbidden: Admin privilege required.")
-            return fn(*args, **kwargs)
-        return decorated_view
-    return wrapper
-
 # Input model
 amenity_model = amenities_ns.model('Amenity', {
     'name': fields.String(required=True, description='Amenity name')
@@ -35,15 +27,22 @@ error_model = amenities_ns.model('Error', {
     'message': fields.String(description='Error message'),
 })
 
+# The list is encoded from column rows (see app.api.v2.serializers)
+amenity_rows = RowSerializer(amenity_response_model, {
+    'id': Amenity.id,
+    'name': Amenity.name,
+    'created_at': Amenity.created_at,
+    'updated_at': Amenity.updated_at,
+})
+
 @amenities_ns.route('/')
 class AmenityList(Resource):
     @amenities_ns.doc('list_amenities')
-    @amenities_ns.marshal_list_with(amenity_response_model)
-    @amenities_ns.response(200, 'List of amenities retrieved successfully')
+    @conditional(lambda: facade.get_collection_version(Amenity), collection=True)
+    @amenities_ns.response(200, 'List of amenities retrieved successfully', [amenity_response_model])
     def get(self):
         """Retrieve all amenities (Public)"""
-        amenities = facade.get_all_amenities()
-        return [amenity.to_dict() for amenity in amenities], 200
+        return amenity_rows.response(facade.get_amenity_rows(amenity_rows.columns))
 
     @amenities_ns.doc('create_amenity', security='jwt')
     @amenities_ns.expect(amenity_model, validate=True)
@@ -68,6 +67,7 @@ class AmenityList(Resource):
 @amenities_ns.route('/<amenity_id>')
 class AmenityResource(Resource):
     @amenities_ns.doc('get_amenity')
+    @conditional(lambda amenity_id: facade.get_entity_version(Amenity, amenity_id))
     @amenities_ns.marshal_with(amenity_response_model)
     @amenities_ns.response(200, 'Amenity details retrieved successfully')
     @amenities_ns.response(404, 'Amenity not found', error_model)
@@ -81,27 +81,25 @@ class AmenityResource(Resource):
 
     @amenities_ns.doc('update_amenity', security='jwt')
     @amenities_ns.expect(amenity_model, validate=True)
-    @amenities_ns.marshal_with(amenity_response_model)
-    @amenities_ns.response(200, 'Amenity updated successfully')
+    @amenities_ns.response(200, 'Amenity updated successfully', amenity_response_model)
     @amenities_ns.response(404, 'Amenity not found', error_model)
     @amenities_ns.response(400, 'Invalid input data', error_model)
     @amenities_ns.response(403, 'Forbidden: Admin required', error_model)
     @amenities_ns.response(409, 'Amenity name already exists', error_model)
+    @amenities_ns.response(412, 'Precondition failed: the amenity changed since If-Match', error_model)
     @admin_required()
+    @if_match(lambda amenity_id: facade.get_entity_version(Amenity, amenity_id))
     def put(self, amenity_id):
         """Update an amenity (Admin only)"""
-        amenity = facade.get_amenity(amenity_id)
-        if not amenity:
-            amenities_ns.abort(404, message='Amenity not found')
-
         amenity_data = amenities_ns.payload
 
         try:
-            updated_amenity = facade.update_amenity(amenity_id, amenity_data)
-            if not updated_amenity:
+            row = facade.update_amenity(amenity_id, amenity_data, amenity_rows.columns,
+                                        expected_version=expected_version())
+            if row is None:
                 amenities_ns.abort(404, message='Amenity not found')
-            
-            return updated_amenity.to_dict(), 200
+
+            return amenity_rows.one(row), 200
             
         except ValueError as e:
             if "already exists" in str(e).lower():
@@ -0,0 +1,112 @@
+"""
+Async versions of the read-heavy v2 endpoints, served by app.asgi.
+
+They run the facade's own queries on an AsyncSession and encode with the
+namespaces' serializers and response models, so both entry points answer the
+same way (ETag/Last-Modified, 304, X-Next-Cursor, 400 on bad parameters).
+Lists are read as column rows and place details eager-loaded: lazy loads are
+not available on async sessions.
+"""
+from functools import wraps
+from typing import Callable, Dict, Optional
+
+from flask_restx import marshal
+from werkzeug.http import parse_date, parse_etags
+
+from app import HBnB_FACADE
+from app.api.v2.amenities import amenity_rows
+from app.api.v2.conditional import matches, validators
+from app.api.v2.places import place_list_args, place_response_model, place_rows
+from app.api.v2.reviews import review_rows
+from app.asgi import NotFound, ReadRequest
+from app.extensions import db
+from app.models import Amenity, Place, Review
+from app.persistence.cache import InMemoryCache
+from app.persistence.repository import chunked
+from app.services.facade import (
+    PLACE_ONLY, collection_version_query, entity_version_query, group_by_parent,
+    place_amenity_rows_query, place_query, place_reviews_version_query, review_rows_query, split_page
+)
+
+facade = HBnB_FACADE
+
+
+def conditional(version: Callable, collection: bool = False):
+    """Async counterpart of app.api.v2.conditional.conditional."""
+    def wrapper(handler):
+        @wraps(handler)
+        async def decorated(session, request: ReadRequest, **kwargs):
+            result = await session.execute(version(**kwargs))
+            current = result.one_or_none()
+            if current is None:
+                return await handler(session, request, **kwargs)
+
+            etag, last_modified, headers = validators(request.path, tuple(current), collection,
+                                                      request.query_string)
+            if matches(etag, last_modified, parse_etags(request.headers.get('If-None-Match')),
+                       parse_date(request.headers.get('If-Modified-Since'))):
+                return None, 304, headers
+
+            data, code, extra = await handler(session, request, **kwargs)
+            extra.update(headers)
+            return data, code, extra
+        return decorated
+    return wrapper
+
+
+@conditional(lambda: collection_version_query(Place), collection=True)
+async def list_places(session, request: ReadRequest):
+    """PlaceList.get"""
+    filters, limit = place_list_args(request.args)
+    query, limit = facade.places_page_query(
+        limit=limit,
+        cursor=request.args.get('cursor'),
+        filters=filters,
+        columns=place_rows.columns
+    )
+    rows, next_cursor = split_page((await session.execute(query)).all(), limit)
+
+    amenities = {}
+    amenity_columns = place_rows.collections['amenities'].columns
+    for ids in chunked(row.id for row in rows):
+        amenities.update(group_by_parent(await session.execute(place_amenity_rows_query(amenity_columns, ids))))
+
+    headers = {}
+    if next_cursor:
+        headers['X-Next-Cursor'] = next_cursor
+    return place_rows.dumps(rows, {'amenities': amenities}), 200, headers
+
+
+@conditional(lambda place_id: entity_version_query(Place, place_id))
+async def get_place(session, request: ReadRequest, place_id: str):
+    """PlaceResource.get"""
+    # Only the in-process cache: a Redis round trip would block the event loop
+    cache = facade.cache if isinstance(facade.cache, InMemoryCache) else None
+    key = facade.place_details_key(place_id)
+    data: Optional[Dict] = cache.get(key) if cache is not None else None
+    if data is None:
+        place = (await session.execute(place_query(place_id))).unique().scalar_one_or_none()
+        if not place:
+            raise NotFound(f"Place with ID {place_id} not found.")
+        data = place.to_dict()
+        if cache is not None:
+            cache.set(key, data)
+    return marshal(data, place_response_model), 200, {}
+
+
+@conditional(lambda place_id: place_reviews_version_query(place_id), collection=True)
+async def list_place_reviews(session, request: ReadRequest, place_id: str):
+    """PlaceReviewList.get"""
+    place = (await session.execute(place_query(place_id, PLACE_ONLY))).scalar_one_or_none()
+    if not place:
+        raise NotFound(f"Place with ID '{place_id}' not found")
+
+    rows = (await session.execute(review_rows_query(review_rows.columns, place_id))).all()
+    return review_rows.dumps(rows), 200, {}
+
+
+@conditional(lambda: collection_version_query(Amenity), collection=True)
+async def list_amenities(session, request: ReadRequest):
+    """AmenityList.get"""
+    rows = (await session.execute(db.select(*amenity_rows.columns).select_from(Amenity))).all()
+    return amenity_rows.dumps(rows), 200, {}
@@ -1,7 +1,12 @@
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Resource, fields
+from app.api.v2.namespace import Namespace
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity, get_jwt
 from datetime import timedelta
-from app.services import facade
+from app import HBnB_FACADE
+from app.services.passwords import PasswordVerifierBusy
+from app.api.v2.security import token_registry
+
+facade = HBnB_FACADE
 
 auth_ns = Namespace('auth', description='Authentication operations')
 
@@ -24,6 +29,7 @@ class Login(Resource):
     @auth_ns.response(200, 'Login successful')
     @auth_ns.response(401, 'Invalid credentials')
     @auth_ns.response(400, 'Bad request')
+    @auth_ns.response(503, 'Too many concurrent logins')
     def post(self):
         """Authenticate user and return JWT token"""
         credentials = auth_ns.payload
@@ -32,11 +38,13 @@ class Login(Resource):
         if not credentials.get('email') or not credentials.get('password'):
             auth_ns.abort(400, message='Email and password are required')
 
-        # Retrieve user by email
-        user = facade.get_user_by_email(credentials['email'])
-
         # Verify user exists and password is correct
-        if not user or not user.verify_password(credentials['password']):
+        try:
+            user = facade.authenticate(credentials['email'], credentials['password'])
+        except PasswordVerifierBusy as e:
+            auth_ns.abort(503, message=str(e))
+
+        if not user:
             auth_ns.abort(401, message='Invalid credentials')
 
         # Create JWT token with user ID and admin status
@@ -48,6 +56,18 @@ class Login(Resource):
 
         return {'access_token': access_token}, 200
 
+@auth_ns.route('/logout')
+class Logout(Resource):
+    @auth_ns.doc('user_logout', security='jwt')
+    @auth_ns.response(204, 'Token revoked')
+    @auth_ns.response(401, 'Unauthorized')
+    @jwt_required()
+    def post(self):
+        """Revoke the current JWT token"""
+        claims = get_jwt()
+        token_registry.revoke_token(claims['jti'], claims['exp'])
+        return None, 204
+
 @auth_ns.route('/protected')
 class ProtectedResource(Resource):
     @auth_ns.doc('protected_endpoint', security='jwt')
@@ -0,0 +1,130 @@
+import hashlib
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Callable, Dict, Optional, Tuple
+
+from flask import Response, g, request
+from sqlalchemy.orm.exc import StaleDataError
+from werkzeug.datastructures import ETags
+from werkzeug.http import http_date, quote_etag
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag from the values identifying one version of a representation."""
+    raw = ':'.join('' if part is None else str(part) for part in parts)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def validators(path: str, current, collection: bool = False,
+               query_string: str = '') -> Tuple[str, Optional[datetime], Dict[str, str]]:
+    """ETag and Last-Modified of a resource version, and the headers announcing them."""
+    if collection:
+        last_modified, count = current
+        etag = make_etag(path, last_modified, count, query_string)
+    else:
+        last_modified, version = current
+        etag = make_etag(path, last_modified, version)
+
+    headers = {'ETag': quote_etag(etag)}
+    if last_modified is not None:
+        headers['Last-Modified'] = http_date(last_modified.replace(tzinfo=timezone.utc))
+    return etag, last_modified, headers
+
+
+def matches(etag: str, last_modified: Optional[datetime], if_none_match: ETags,
+            if_modified_since: Optional[datetime]) -> bool:
+    """Check If-None-Match, falling back to If-Modified-Since when it is absent."""
+    if if_none_match:
+        return if_none_match.contains(etag)
+    if last_modified is not None and if_modified_since is not None:
+        return last_modified.replace(microsecond=0, tzinfo=timezone.utc) <= if_modified_since
+    return False
+
+
+def is_not_modified(etag: str, last_modified: Optional[datetime]) -> bool:
+    """Whether the current request's validators match (see matches())."""
+    return matches(etag, last_modified, request.if_none_match, request.if_modified_since)
+
+
+def conditional(version: Callable, collection: bool = False):
+    """
+    Serve 304 Not Modified before the view runs (and marshals) when the client
+    already has the current representation.
+
+    version(**view_kwargs) returns the version of the resource:
+    - an (updated_at, version) tuple for a single entity (None if it does not exist)
+    - a (max_updated_at, row_count) tuple for a collection
+    Collection ETags also cover the query string, which selects the rows sent.
+    The versions only read the resource's own table: a change to an embedded row
+    (owner, author, amenity, place title) bumps the rows embedding it instead
+    (see HBnBFacade._touch_rows).
+    Must be placed above marshal_with so the 304 skips marshalling.
+    """
+    def wrapper(fn):
+        @wraps(fn)
+        def decorated_view(*args, **kwargs):
+            current = version(**kwargs)
+            if current is None:
+                return fn(*args, **kwargs)
+
+            etag, last_modified, headers = validators(
+                request.path, current, collection, request.query_string.decode()
+            )
+            if is_not_modified(etag, last_modified):
+                return Response(status=304, headers=headers)
+
+            resp = fn(*args, **kwargs)
+            if isinstance(resp, Response):
+                resp.headers.extend(headers)
+                return resp
+            if not isinstance(resp, tuple):
+                resp = (resp, 200)
+            data, code = resp[0], resp[1]
+            extra = dict(resp[2]) if len(resp) > 2 else {}
+            extra.update(headers)
+            return data, code, extra
+        return decorated_view
+    return wrapper
+
+
+def precondition_failed() -> Response:
+    return Response('{"message": "The resource was modified since you read it: fetch it again and retry."}\n',
+                    status=412, mimetype='application/json')
+
+
+def if_match(version: Callable):
+    """
+    Optimistic concurrency for PUT and DELETE of one entity.
+
+    With an If-Match header, the view only runs if it carries the entity's
+    current ETag (412 Precondition Failed otherwise), and expected_version()
+    gives the version the view must pass down to the facade: the write then
+    only applies to that version, without any row lock, and a concurrent
+    writer getting there first makes it fail with 412 too.
+    version(**view_kwargs) returns (updated_at, version) like for conditional().
+    Without If-Match writes are unconditional (last writer wins).
+    """
+    def wrapper(fn):
+        @wraps(fn)
+        def decorated_view(*args, **kwargs):
+            g.expected_version = None
+            if request.if_match:
+                current = version(**kwargs)
+                # Without a current representation even If-Match: * fails
+                if current is None:
+                    return precondition_failed()
+                etag, _, _ = validators(request.path, current)
+                if not request.if_match.contains(etag):
+                    return precondition_failed()
+                g.expected_version = current[1]
+            try:
+                return fn(*args, **kwargs)
+            except StaleDataError:
+                return precondition_failed()
+        return decorated_view
+    return wrapper
+
+
+def expected_version() -> Optional[int]:
+    """The entity version matched by If-Match in the current request (None without the header)."""
+    return g.get('expected_version')
@@ -0,0 +1,41 @@
+from datetime import datetime, timezone
+from flask import Response, request, stream_with_context
+from flask_restx import Resource, fields
+from app.api.v2.namespace import Namespace
+from app import HBnB_FACADE
+from app.api.v2.security import admin_required
+from app.services.exporter import EXPORT_KINDS, to_ndjson
+
+facade = HBnB_FACADE
+export_ns = Namespace('export', description='Catalog export operations (Admin only)')
+
+error_model = export_ns.model('Error', {
+    'message': fields.String(description='Error message'),
+})
+
+@export_ns.route('/<string:kind>.ndjson')
+@export_ns.param('kind', f"One of: {', '.join(EXPORT_KINDS)}")
+class Export(Resource):
+    @export_ns.doc('export_ndjson', security='jwt', params={
+        'since': 'ISO 8601 timestamp: only rows updated at or after it (incremental export)'
+    })
+    @export_ns.produces(['application/x-ndjson'])
+    @export_ns.response(200, 'One JSON object per line, ordered by updated_at')
+    @export_ns.response(400, 'Invalid export request', error_model)
+    @export_ns.response(403, 'Forbidden: Admin required', error_model)
+    @admin_required()
+    def get(self, kind):
+        """Stream a table as NDJSON (Admin only)"""
+        since = request.args.get('since')
+        try:
+            since = datetime.fromisoformat(since) if since else None
+            if since is not None and since.tzinfo is not None:
+                # Timestamps are stored as naive UTC
+                since = since.astimezone(timezone.utc).replace(tzinfo=None)
+            rows = facade.export_rows(kind, since=since)
+        except ValueError as e:
+            export_ns.abort(400, message=str(e))
+
+        # The generator runs after the view returns, keep the app context for the session
+        lines = (to_ndjson(row) for row in rows)
+        return Response(stream_with_context(lines), mimetype='application/x-ndjson')
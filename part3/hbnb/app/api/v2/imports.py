@@ -0,0 +1,51 @@
+from flask import request
+from flask_restx import Resource, fields
+from app.api.v2.namespace import Namespace
+from app import HBnB_FACADE
+from app.api.v2.security import admin_required
+from app.services.importer import IMPORT_KINDS, DEFAULT_CHUNK_SIZE, read_rows, text_stream
+
+facade = HBnB_FACADE
+import_ns = Namespace('import', description='Bulk import operations (Admin only)')
+
+import_error_model = import_ns.model('ImportRowError', {
+    'line': fields.Integer(description='Line of the rejected row'),
+    'error': fields.String(description='Why the row was rejected')
+})
+
+import_report_model = import_ns.model('ImportReport', {
+    'kind': fields.String(description='Imported entity kind'),
+    'processed': fields.Integer(description='Rows read'),
+    'created': fields.Integer(description='Rows inserted'),
+    'failed': fields.Integer(description='Rows rejected'),
+    'errors': fields.List(fields.Nested(import_error_model), description='Rejected rows (first 1000)')
+})
+
+error_model = import_ns.model('Error', {
+    'message': fields.String(description='Error message'),
+})
+
+@import_ns.route('/<string:kind>')
+@import_ns.param('kind', f"One of: {', '.join(IMPORT_KINDS)}")
+class BulkImport(Resource):
+    @import_ns.doc('bulk_import', security='jwt', params={
+        'format': "'ndjson' or 'csv' (default: from Content-Type, text/csv or NDJSON)",
+        'chunk_size': f'Rows inserted per transaction (default {DEFAULT_CHUNK_SIZE})'
+    })
+    @import_ns.marshal_with(import_report_model)
+    @import_ns.response(200, 'Import finished, see the report for rejected rows')
+    @import_ns.response(400, 'Invalid import request', error_model)
+    @import_ns.response(403, 'Forbidden: Admin required', error_model)
+    @admin_required()
+    def post(self, kind):
+        """Import rows from an NDJSON or CSV request body (Admin only)"""
+        fmt = request.args.get('format') or ('csv' if request.mimetype == 'text/csv' else 'ndjson')
+        chunk_size = request.args.get('chunk_size', DEFAULT_CHUNK_SIZE, type=int)
+
+        try:
+            rows = read_rows(text_stream(request.stream), fmt)
+            report = facade.bulk_import(kind, rows, chunk_size=chunk_size)
+        except ValueError as e:
+            import_ns.abort(400, message=str(e))
+
+        return report, 200
@@ -0,0 +1,54 @@
+from flask.views import http_method_funcs
+from flask_restx import Namespace as RestxNamespace
+from flask_restx.model import RawModel
+from flask_restx.namespace import unshortcut_params_description, handle_deprecations
+
+
+def _copy_doc(value):
+    """Copy the dicts and lists of an __apidoc__, sharing models and fields."""
+    if isinstance(value, RawModel):
+        return value
+    if isinstance(value, dict):
+        return {key: _copy_doc(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_copy_doc(item) for item in value)
+    return value
+
+
+def merge_docs(first, second):
+    """flask_restx.utils.merge without deep-copying the models it holds."""
+    if not isinstance(second, dict):
+        return second
+    result = _copy_doc(first)
+    for key, value in second.items():
+        if key in result and isinstance(result[key], dict) and not isinstance(result[key], RawModel):
+            result[key] = merge_docs(result[key], value)
+        else:
+            result[key] = _copy_doc(value)
+    return result
+
+
+class Namespace(RestxNamespace):
+    """
+    Namespace whose documentation decorators (doc, expect, response, marshal_with)
+    stop deep-copying every model they reference. Models are never mutated once
+    declared, and those copies were most of the time spent importing the API.
+    _build_doc is private to flask-restx, hence the pinned version in
+    requirements.txt and the comparison with the stock Namespace in
+    app/test/test_startup.py.
+    """
+
+    def _build_doc(self, cls, doc):
+        if doc is False:
+            return False
+        unshortcut_params_description(doc)
+        handle_deprecations(doc)
+        for http_method in http_method_funcs:
+            if http_method in doc:
+                if doc[http_method] is False:
+                    continue
+                unshortcut_params_description(doc[http_method])
+                handle_deprecations(doc[http_method])
+                if "expect" in doc[http_method] and not isinstance(doc[http_method]["expect"], (list, tuple)):
+                    doc[http_method]["expect"] = [doc[http_method]["expect"]]
+        return merge_docs(getattr(cls, "__apidoc__", {}), doc)
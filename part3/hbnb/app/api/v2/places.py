@@ -1,22 +1,21 @@
+import math
+from typing import Dict, Optional, Tuple
+
 from flask import request
-from flask_restx import Resource, Namespace, fields
+from flask_restx import Resource, fields
+from app.api.v2.namespace import Namespace
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from app import HBnB_FACADE
+from app.services.facade import PLACE_ONLY, related_value
+from app.models import Place, User, Amenity
+from sqlalchemy.orm.exc import StaleDataError
+from app.api.v2.conditional import conditional, expected_version, if_match
+from app.api.v2.serializers import RowSerializer
+from app.api.v2.security import known_user_id
 
 facade = HBnB_FACADE
 places_ns = Namespace('places', description='Place operations')
 
-def admin_required():
-    def wrapper(fn):
-        @jwt_required()
-        def decorated_view(*args, **kwargs):
-            claims = get_jwt()
-            if claims.get("is_admin", False) is not True:
-                places_ns.abort(403, message="Access forbidden: Admin privilege required.")
-            return fn(*args, **kwargs)
-        return decorated_view
-    return wrapper
-
 user_model = places_ns.model('PlaceUser', {
     'id': fields.String(),
     'first_name': fields.String(),
@@ -56,34 +55,134 @@ place_response_model = places_ns.model('PlaceResponse', {
     'longitude': fields.Float(),
     'owner': fields.Nested(user_model),
     'amenities': fields.List(fields.Nested(amenity_model)),
+    'review_count': fields.Integer(),
+    'avg_rating': fields.Float(),
     'created_at': fields.String(),
     'updated_at': fields.String()
 })
 
+place_nearby_model = places_ns.inherit('PlaceNearby', place_response_model, {
+    'distance_km': fields.Float(description='Distance from the search point in kilometers')
+})
+
 error_model = places_ns.model('Error', {
     'message': fields.String(),
 })
 
+# Listing pages are encoded from column rows (see app.api.v2.serializers)
+place_rows = RowSerializer(place_response_model, {
+    'id': Place.id,
+    'title': Place.title,
+    'description': Place.description,
+    'price': Place.price,
+    'latitude': Place.latitude,
+    'longitude': Place.longitude,
+    'owner.id': User.id,
+    'owner.first_name': User.first_name,
+    'owner.last_name': User.last_name,
+    'owner.email': User.email,
+    'review_count': Place.review_count,
+    'avg_rating': Place.avg_rating,
+    'created_at': Place.created_at,
+    'updated_at': Place.updated_at,
+}, collections={
+    'amenities': RowSerializer(amenity_model, {'id': Amenity.id, 'name': Amenity.name}),
+})
+
+# PUT renders the row of the UPDATE ... RETURNING: the owner comes from subqueries
+owned_by = User.id == Place.owner_id
+updated_place_rows = RowSerializer(place_response_model, {
+    'id': Place.id,
+    'title': Place.title,
+    'description': Place.description,
+    'price': Place.price,
+    'latitude': Place.latitude,
+    'longitude': Place.longitude,
+    'owner.id': Place.owner_id,
+    'owner.first_name': related_value(User.first_name, owned_by),
+    'owner.last_name': related_value(User.last_name, owned_by),
+    'owner.email': related_value(User.email, owned_by),
+    'review_count': Place.review_count,
+    'avg_rating': Place.avg_rating,
+    'created_at': Place.created_at,
+    'updated_at': Place.updated_at,
+}, collections=place_rows.collections)
+
+def number_arg(args, name: str, cast=float):
+    """Optional numeric query parameter: None when absent, ValueError when it is not a number."""
+    value = args.get(name)
+    if value is None:
+        return None
+    try:
+        number = cast(value)
+    except ValueError:
+        number = None
+    if number is None or not math.isfinite(number):
+        raise ValueError(f"{name} must be {'an integer' if cast is int else 'a number'}.")
+    return number
+
+
+def place_list_args(args) -> Tuple[Dict, Optional[int]]:
+    """Filters and page size of a place listing (ValueError on a malformed parameter)."""
+    amenities = [
+        name.strip()
+        for value in args.getlist('amenities')
+        for name in value.split(',') if name.strip()
+    ]
+    filters = {
+        'min_price': number_arg(args, 'min_price'),
+        'max_price': number_arg(args, 'max_price'),
+        'amenities': amenities,
+        'min_rating': number_arg(args, 'min_rating')
+    }
+    return filters, number_arg(args, 'limit', cast=int)
+
+
 @places_ns.route('/')
 class PlaceList(Resource):
     
-    @places_ns.doc('list_places')
-    @places_ns.marshal_list_with(place_response_model)
+    @places_ns.doc('list_places', params={
+        'limit': 'Maximum number of places to return (default 20, max 100)',
+        'cursor': 'Opaque cursor taken from the X-Next-Cursor header of the previous page',
+        'min_price': 'Minimum price per night',
+        'max_price': 'Maximum price per night',
+        'amenities': 'Comma-separated amenity names; places must have all of them',
+        'min_rating': 'Minimum average review rating'
+    })
+    @conditional(lambda: facade.get_collection_version(Place), collection=True)
+    @places_ns.response(200, 'Success', [place_response_model])
+    @places_ns.response(400, 'Invalid pagination or filter parameters', error_model)
     def get(self):
-        places = facade.get_all_places()
-        return [place for place in places], 200
+        """List places, filtered server-side and one keyset-paginated page at a time"""
+        try:
+            filters, limit = place_list_args(request.args)
+            rows, next_cursor = facade.get_place_rows_page(
+                place_rows.columns,
+                limit=limit,
+                cursor=request.args.get('cursor'),
+                filters=filters
+            )
+        except ValueError as e:
+            places_ns.abort(400, message=str(e))
+
+        amenities = facade.get_place_amenity_rows(
+            place_rows.collections['amenities'].columns, [row.id for row in rows]
+        )
+        headers = {}
+        if next_cursor:
+            headers['X-Next-Cursor'] = next_cursor
+        return place_rows.response(rows, {'amenities': amenities}, headers=headers)
 
     @jwt_required()
     @places_ns.doc('create_place')
     @places_ns.expect(place_input_model)
     @places_ns.marshal_with(place_response_model, code=201)
     def post(self):
-        current_user_id = get_jwt_identity()
         place_data = places_ns.payload
-        place_data['owner_id'] = current_user_id
+        place_data['owner_id'] = known_user_id(facade)
 
         try:
-            new_place = facade.create_place(place_data)
+            new_place = facade.create_place(place_data, known_user=True)
             return new_place, 201
         
         except ValueError as e:
@@ -92,12 +191,43 @@ class PlaceList(Resource):
             places_ns.abort(500, message="An unexpected error occurred during place creation.")
 
 
+@places_ns.route('/nearby')
+class PlaceNearbyList(Resource):
+    @places_ns.doc('list_places_nearby', params={
+        'lat': 'Latitude of the search point',
+        'lng': 'Longitude of the search point',
+        'radius_km': 'Search radius in kilometers (max 500)',
+        'limit': 'Maximum number of places to return (default 20, max 100)'
+    })
+    @conditional(lambda: facade.get_collection_version(Place), collection=True)
+    @places_ns.marshal_list_with(place_nearby_model)
+    @places_ns.response(400, 'Invalid search parameters', error_model)
+    def get(self):
+        """List places within a radius of a point, closest first"""
+        latitude = request.args.get('lat', type=float)
+        longitude = request.args.get('lng', type=float)
+        radius_km = request.args.get('radius_km', type=float)
+        if latitude is None or longitude is None or radius_km is None:
+            places_ns.abort(400, message="lat, lng and radius_km are required numbers.")
+
+        try:
+            matches = facade.get_places_nearby(
+                latitude, longitude, radius_km,
+                limit=number_arg(request.args, 'limit', cast=int)
+            )
+        except ValueError as e:
+            places_ns.abort(400, message=str(e))
+
+        return [dict(place.to_dict(), distance_km=round(distance, 3)) for place, distance in matches], 200
+
+
 @places_ns.route('/<string:place_id>')
 class PlaceResource(Resource):
     @places_ns.doc('get_place')
+    @conditional(lambda place_id: facade.get_entity_version(Place, place_id))
     @places_ns.marshal_with(place_response_model)
     def get(self, place_id):
-        place = facade.get_place(place_id)
+        place = facade.get_place_details(place_id)
         if not place:
             places_ns.abort(404, f"Place with ID {place_id} not found.")
         return place, 200
@@ -106,7 +236,9 @@ class PlaceResource(Resource):
     @jwt_required()
     @places_ns.doc('update_place')
     @places_ns.expect(place_update_model)
-    @places_ns.marshal_with(place_response_model)
+    @places_ns.response(412, 'Precondition failed: the place changed since If-Match', error_model)
+    @if_match(lambda place_id: facade.get_entity_version(Place, place_id))
+    @places_ns.response(200, 'Place updated successfully', place_response_model)
     def put(self, place_id):
         current_user_id = get_jwt_identity()
         claims = get_jwt()
@@ -114,37 +246,44 @@ class PlaceResource(Resource):
         place_data = places_ns.payload
         
         place_data.pop('owner_id', None)
-        
-        try:
-            place = facade.get_place(place_id)
-            
-            if not place:
-                places_ns.abort(404, f"Place with ID {place_id} not found.")
 
-            if place.owner_id != current_user_id and not is_admin:
-                places_ns.abort(403, "You do not have permission to update this place.")
+        # Only the owner id is read: the response renders the row the UPDATE returns
+        owner_id = facade.get_owner_id(Place, place_id)
+        if owner_id is None:
+            places_ns.abort(404, f"Place with ID {place_id} not found.")
 
-            updated_place = facade.update_place(place_id, place_data)
+        if owner_id != current_user_id and not is_admin:
+            places_ns.abort(403, "You do not have permission to update this place.")
 
-            return updated_place, 200
-            
+        try:
+            row = facade.update_place(place_id, place_data, updated_place_rows.columns,
+                                      expected_version=expected_version())
         except ValueError as e:
             places_ns.abort(400, message=str(e))
+        except StaleDataError:
+            raise  # 412, see if_match
         except Exception as e:
             print(f"Error: {e}")
             places_ns.abort(500, message="An unexpected error occurred during place update.")
 
+        if row is None:
+            places_ns.abort(404, f"Place with ID {place_id} not found.")
+        amenities = facade.get_place_amenity_rows(updated_place_rows.collections['amenities'].columns, [place_id])
+        return updated_place_rows.one(row, {'amenities': amenities}), 200
+
     @jwt_required()
     @places_ns.doc('delete_place')
+    @places_ns.response(412, 'Precondition failed: the place changed since If-Match', error_model)
+    @if_match(lambda place_id: facade.get_entity_version(Place, place_id))
     def delete(self, place_id):
         current_user_id = get_jwt_identity()
         
-        place_to_delete = facade.get_place(place_id)
+        place_to_delete = facade.get_place(place_id, projection=PLACE_ONLY)
         if not place_to_delete:
             places_ns.abort(404, f"Place with ID {place_id} not found.")
 
         if place_to_delete.owner_id != current_user_id:
             places_ns.abort(403, "You do not have permission to delete this place.")
 
-        facade.delete_place(place_id)
+        facade.delete_place(place_id, expected_version=expected_version())
         return '', 204
\ No newline at end of file
@@ -1,6 +1,12 @@
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Resource, fields
+from app.api.v2.namespace import Namespace
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from app import HBnB_FACADE
+from app.services.facade import PLACE_ONLY, related_value
+from app.models import Review, User, Place
+from app.api.v2.conditional import conditional, expected_version, if_match
+from app.api.v2.serializers import RowSerializer
+from app.api.v2.security import known_user_id
 
 facade = HBnB_FACADE
 reviews_ns = Namespace('reviews', description='Review operations')
@@ -36,6 +42,36 @@ review_response_model = reviews_ns.model('ReviewResponse', {
     'updated_at': fields.String(description='Last update date')
 })
 
+# Lists are encoded from column rows (see app.api.v2.serializers)
+review_rows = RowSerializer(review_response_model, {
+    'id': Review.id,
+    'text': Review.text,
+    'rating': Review.rating,
+    'user.id': User.id,
+    'user.first_name': User.first_name,
+    'user.email': User.email,
+    'place.id': Place.id,
+    'place.title': Place.title,
+    'created_at': Review.created_at,
+    'updated_at': Review.updated_at,
+})
+
+# PUT renders the row of the UPDATE ... RETURNING: author and place come from subqueries
+written_by = User.id == Review.user_id
+reviewed_place = Place.id == Review.place_id
+updated_review_rows = RowSerializer(review_response_model, {
+    'id': Review.id,
+    'text': Review.text,
+    'rating': Review.rating,
+    'user.id': Review.user_id,
+    'user.first_name': related_value(User.first_name, written_by),
+    'user.email': related_value(User.email, written_by),
+    'place.id': Review.place_id,
+    'place.title': related_value(Place.title, reviewed_place),
+    'created_at': Review.created_at,
+    'updated_at': Review.updated_at,
+})
+
 # Update model
 review_update_model = reviews_ns.model('ReviewUpdate', {
     'text': fields.String(required=False, description='Review content'),
@@ -61,15 +97,12 @@ class ReviewList(Resource):
         # Security: ensure user_id matches authenticated user
         if review_data.get('user_id') != user_id:
             reviews_ns.abort(403, message="Unauthorized: Review must be created by authenticated user.")
-        
-        place_id = review_data.get('place_id')
 
-        # Verify user and place exist
-        user = facade.get_user(user_id)
-        place = facade.get_place(place_id)
+        # Verify user (from the token registry) and place exist
+        known_user_id(facade)
+        place_id = review_data.get('place_id')
+        place = facade.get_place(place_id, projection=PLACE_ONLY)
 
-        if not user:
-            reviews_ns.abort(404, message=f"User with ID '{user_id}' not found")
         if not place:
             reviews_ns.abort(404, message=f"Place with ID '{place_id}' not found")
 
@@ -82,7 +115,7 @@ class ReviewList(Resource):
             reviews_ns.abort(409, message="Conflict: You have already reviewed this place.")
         
         try:
-            new_review = facade.create_review(review_data)
+            new_review = facade.create_review(review_data, known_user=True)
             return new_review.to_dict(), 201
         except ValueError as e:
             reviews_ns.abort(400, message=str(e))
@@ -90,16 +123,16 @@ class ReviewList(Resource):
             reviews_ns.abort(500, message=f"Internal error: {str(e)}")
 
     @reviews_ns.doc('list_reviews')
-    @reviews_ns.marshal_list_with(review_response_model)
-    @reviews_ns.response(200, 'List of reviews retrieved successfully')
+    @conditional(lambda: facade.get_collection_version(Review), collection=True)
+    @reviews_ns.response(200, 'List of reviews retrieved successfully', [review_response_model])
     def get(self):
         """Retrieve all reviews"""
-        reviews = facade.get_all_reviews()
-        return [review.to_dict() for review in reviews], 200
+        return review_rows.response(facade.get_review_rows(review_rows.columns))
 
 @reviews_ns.route('/<string:review_id>')
 class ReviewResource(Resource):
     @reviews_ns.doc('get_review')
+    @conditional(lambda review_id: facade.get_entity_version(Review, review_id))
     @reviews_ns.marshal_with(review_response_model)
     @reviews_ns.response(200, 'Review details retrieved successfully')
     @reviews_ns.response(404, 'Review not found')
@@ -113,12 +146,13 @@ class ReviewResource(Resource):
 
     @reviews_ns.doc('update_review', security='jwt')
     @reviews_ns.expect(review_update_model, validate=True)
-    @reviews_ns.marshal_with(review_response_model)
-    @reviews_ns.response(200, 'Review updated successfully')
+    @jwt_required()
+    @if_match(lambda review_id: facade.get_entity_version(Review, review_id))
+    @reviews_ns.response(200, 'Review updated successfully', review_response_model)
     @reviews_ns.response(404, 'Review not found')
     @reviews_ns.response(400, 'Invalid input data')
     @reviews_ns.response(403, 'Unauthorized')
-    @jwt_required()
+    @reviews_ns.response(412, 'Precondition failed: the review changed since If-Match')
     def put(self, review_id):
         """Update a review (Author or Admin only)"""
         user_id = get_jwt_identity()
@@ -127,30 +161,32 @@ class ReviewResource(Resource):
         
         review_data = reviews_ns.payload
 
-        review = facade.get_review(review_id)
-        if not review:
+        # Only the author id is read: the response renders the row the UPDATE returns
+        author_id = facade.get_owner_id(Review, review_id)
+        if author_id is None:
             reviews_ns.abort(404, message=f"Review with ID '{review_id}' not found")
 
         # Authorization: author or admin
-        if review.user_id != user_id and not is_admin:
+        if author_id != user_id and not is_admin:
             reviews_ns.abort(403, message="Unauthorized: You can only update your own reviews.")
 
         try:
-            updated_review = facade.update_review(review_id, review_data)
-            
-            if not updated_review:
-                reviews_ns.abort(404, message=f"Review with ID '{review_id}' not found")
-                
-            return updated_review.to_dict(), 200
-            
+            row = facade.update_review(review_id, review_data, updated_review_rows.columns,
+                                       expected_version=expected_version())
         except ValueError as e:
             reviews_ns.abort(400, message=str(e))
 
+        if row is None:
+            reviews_ns.abort(404, message=f"Review with ID '{review_id}' not found")
+        return updated_review_rows.one(row), 200
+
     @reviews_ns.doc('delete_review', security='jwt')
+    @jwt_required()
+    @if_match(lambda review_id: facade.get_entity_version(Review, review_id))
     @reviews_ns.response(204, 'Review deleted successfully')
     @reviews_ns.response(404, 'Review not found')
     @reviews_ns.response(403, 'Unauthorized')
-    @jwt_required()
+    @reviews_ns.response(412, 'Precondition failed: the review changed since If-Match')
     def delete(self, review_id):
         """Delete a review (Author or Admin only)"""
         user_id = get_jwt_identity()
@@ -166,7 +202,7 @@ class ReviewResource(Resource):
         if review.user_id != user_id and not is_admin:
             reviews_ns.abort(403, message="Unauthorized: You can only delete your own reviews.")
         
-        is_deleted = facade.delete_review(review_id)
+        is_deleted = facade.delete_review(review_id, expected_version=expected_version())
         
         if not is_deleted:
             reviews_ns.abort(404, message=f"Review with ID '{review_id}' not found")
@@ -176,14 +212,14 @@ class ReviewResource(Resource):
 @reviews_ns.route('/places/<string:place_id>/reviews')
 class PlaceReviewList(Resource):
     @reviews_ns.doc('list_place_reviews')
-    @reviews_ns.marshal_list_with(review_response_model)
-    @reviews_ns.response(200, 'List of reviews for the place retrieved successfully')
+    # No version for a missing place: the view's 404 runs instead of a 304
+    @conditional(lambda place_id: facade.get_place_reviews_version(place_id), collection=True)
+    @reviews_ns.response(200, 'List of reviews for the place retrieved successfully', [review_response_model])
     @reviews_ns.response(404, 'Place not found')
     def get(self, place_id):
         """Get all reviews for a specific place"""
-        place = facade.get_place(place_id)
+        place = facade.get_place(place_id, projection=PLACE_ONLY)
         if not place:
             reviews_ns.abort(404, message=f"Place with ID '{place_id}' not found")
-        
-        reviews = facade.get_reviews_by_place(place_id)
-        return [review.to_dict() for review in reviews], 200
\ No newline at end of file
+
+        return review_rows.response(facade.get_review_rows(review_rows.columns, place_id=place_id))
\ No newline at end of file
@@ -0,0 +1,110 @@
+import threading
+import time
+from functools import wraps
+from typing import Callable, Dict
+
+from flask_restx import abort
+from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
+
+from app.extensions import jwt
+from app.persistence.cache import InMemoryCache
+
+# Access tokens are issued for 3 hours, revocations never need to outlive them
+TOKEN_LIFETIME = 3 * 3600
+# Short: other workers keep trusting a deleted user's tokens for this long
+KNOWN_USER_TTL = 10
+KNOWN_USER_MAX_ENTRIES = 10000
+
+
+class TokenRegistry:
+    """
+    In-process authorization state: users known to exist and revoked tokens.
+    Known users are remembered for KNOWN_USER_TTL seconds, so a burst of
+    authenticated writes looks their user up once instead of on every request.
+    Revocations are kept for the token lifetime; as the registry is local to
+    the worker, other workers see a deleted user only once their entry expires,
+    hence the short TTL.
+    """
+
+    def __init__(self, ttl: float = KNOWN_USER_TTL, max_entries: int = KNOWN_USER_MAX_ENTRIES):
+        self._known_users = InMemoryCache(max_entries=max_entries, ttl=ttl)
+        self._revoked_tokens: Dict[str, float] = {}
+        self._revoked_users: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def is_known_user(self, user_id: str, exists: Callable[[str], bool]) -> bool:
+        """Whether user_id exists, asking exists() only when the registry does not know yet."""
+        if user_id in self._revoked_users:
+            return False
+        if self._known_users.get(user_id) is not None:
+            return True
+        if not exists(user_id):
+            return False
+        self._known_users.set(user_id, {'known': True})
+        return True
+
+    def is_revoked(self, jwt_payload: Dict) -> bool:
+        if jwt_payload.get('jti') in self._revoked_tokens:
+            return True
+        revoked_at = self._revoked_users.get(jwt_payload.get('sub'))
+        return revoked_at is not None and jwt_payload.get('iat', 0) <= revoked_at
+
+    def revoke_token(self, jti: str, expires_at: float) -> None:
+        with self._lock:
+            self._purge()
+            self._revoked_tokens[jti] = expires_at
+
+    def revoke_user(self, user_id: str) -> None:
+        """Reject every token issued so far to user_id (e.g. after deleting the user)."""
+        with self._lock:
+            self._purge()
+            self._revoked_users[user_id] = time.time()
+        self._known_users.delete(user_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._revoked_tokens.clear()
+            self._revoked_users.clear()
+        self._known_users.clear()
+
+    def _purge(self) -> None:
+        now = time.time()
+        for jti in [jti for jti, expires_at in self._revoked_tokens.items() if expires_at <= now]:
+            del self._revoked_tokens[jti]
+        for user_id in [u for u, revoked_at in self._revoked_users.items() if revoked_at + TOKEN_LIFETIME <= now]:
+            del self._revoked_users[user_id]
+
+
+token_registry = TokenRegistry()
+
+
+# Registered once on the shared JWTManager, at import, however many apps create_app builds
+@jwt.token_in_blocklist_loader
+def token_is_revoked(jwt_header, jwt_payload) -> bool:
+    """Make flask-jwt-extended reject revoked tokens (checked in memory, no DB query)."""
+    return token_registry.is_revoked(jwt_payload)
+
+
+def admin_required():
+    """Custom decorator to ensure the authenticated user has Admin privilege."""
+    def wrapper(fn):
+        @wraps(fn)
+        @jwt_required()
+        def decorated_view(*args, **kwargs):
+            claims = get_jwt()
+            if claims.get("is_admin", False) is not True:
+                abort(403, message="Access forbidden: Admin privilege required.")
+            return fn(*args, **kwargs)
+        return decorated_view
+    return wrapper
+
+
+def known_user_id(facade) -> str:
+    """
+    Identity of the current token, checked against the registry rather than
+    the database. Aborts with 404 when the user no longer exists.
+    """
+    user_id = get_jwt_identity()
+    if not token_registry.is_known_user(user_id, facade.user_exists):
+        abort(404, message=f"User with ID '{user_id}' not found")
+    return user_id
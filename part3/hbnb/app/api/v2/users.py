@@ -1,24 +1,17 @@
 from flask import request
-from flask_restx import Resource, Namespace, fields
+from flask_restx import Resource, fields
+from app.api.v2.namespace import Namespace
 from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
 from app import HBnB_FACADE
+from app.api.v2.security import admin_required, token_registry
+from app.api.v2.conditional import expected_version, if_match
+from app.api.v2.serializers import RowSerializer
+from sqlalchemy.orm.exc import StaleDataError
+from app.models import User
 
 facade = HBnB_FACADE
 users_ns = Namespace('users', description='User management operations')
 
-# Decorator admin_required
-def admin_required():
-    """Custom decorator to ensure the authenticated user has Admin privilege."""
-    def wrapper(fn): 
-        @jwt_required()
-        def decorated_view(*args, **kwargs):
-            claims = get_jwt()
-            if claims.get("is_admin", False) is not True:
-                users_ns.abort(403, message="Access forbidden: Admin privilege required.")
-            return fn(*args, **kwargs)
-        return decorated_view
-    return wrapper
-
 # Input model for creating users
 user_model = users_ns.model('User', {
     'first_name': fields.String(required=True, description='First name', example='John'),
@@ -53,6 +46,17 @@ user_response_model = users_ns.model('UserResponse', {
     'updated_at': fields.String(readOnly=True, description='Last update timestamp')
 })
 
+# Updates render the row returned by the UPDATE (see app.api.v2.serializers)
+user_rows = RowSerializer(user_response_model, {
+    'id': User.id,
+    'first_name': User.first_name,
+    'last_name': User.last_name,
+    'email': User.email,
+    'is_admin': User.is_admin,
+    'created_at': User.created_at,
+    'updated_at': User.updated_at,
+})
+
 # Error model
 error_model = users_ns.model('Error', {
     'message': fields.String(description='Error message'),
@@ -118,12 +122,13 @@ class UserResource(Resource):
     @users_ns.doc('update_user', security='jwt')
     @jwt_required()
     @users_ns.expect(user_update_model, validate=True)
-    @users_ns.marshal_with(user_response_model)
-    @users_ns.response(200, 'User updated successfully')
+    @users_ns.response(200, 'User updated successfully', user_response_model)
     @users_ns.response(400, 'Invalid input data', error_model)
     @users_ns.response(404, 'User not found', error_model)
     @users_ns.response(401, 'Unauthorized', error_model)
     @users_ns.response(403, 'Forbidden', error_model)
+    @users_ns.response(412, 'Precondition failed: the user changed since If-Match', error_model)
+    @if_match(lambda user_id: facade.get_entity_version(User, user_id))
     def put(self, user_id):
         """Update user profile (Own profile only)"""
         current_user_id = get_jwt_identity()
@@ -138,10 +143,10 @@ class UserResource(Resource):
             users_ns.abort(400, message="You can only modify first name and last name.")
         
         try:
-            updated_user = facade.update_user(user_id, user_data)
-            if updated_user is None:
+            row = facade.update_user(user_id, user_data, user_rows.columns, expected_version=expected_version())
+            if row is None:
                 users_ns.abort(404, message=f"User with ID {user_id} not found")
-            return updated_user.to_dict(), 200
+            return user_rows.one(row), 200
         except ValueError as e:
             users_ns.abort(400, message=str(e))
 
@@ -150,6 +155,8 @@ class UserResource(Resource):
     @users_ns.response(204, 'User deleted successfully')
     @users_ns.response(404, 'User not found', error_model)
     @users_ns.response(403, 'Forbidden: Admin required', error_model)
+    @users_ns.response(412, 'Precondition failed: the user changed since If-Match', error_model)
+    @if_match(lambda user_id: facade.get_entity_version(User, user_id))
     def delete(self, user_id):
         """Delete a user (Admin only)"""
         claims = get_jwt()
@@ -163,11 +170,12 @@ class UserResource(Resource):
         if user_id == current_user_id:
             users_ns.abort(403, message="Cannot delete your own admin account.")
 
-        is_deleted = facade.delete_user(user_id)
+        is_deleted = facade.delete_user(user_id, expected_version=expected_version())
         
         if not is_deleted:
             users_ns.abort(404, message=f"User with ID {user_id} not found")
 
+        token_registry.revoke_user(user_id)
         return None, 204
 
 @users_ns.route('/<string:user_id>/admin')
@@ -175,13 +183,14 @@ class UserResource(Resource):
 class UserAdminResource(Resource):
     @users_ns.doc('update_user_by_admin', security='jwt')
     @users_ns.expect(user_admin_update_model, validate=True)
-    @users_ns.marshal_with(user_response_model)
     @admin_required()
-    @users_ns.response(200, 'User updated successfully')
+    @users_ns.response(200, 'User updated successfully', user_response_model)
     @users_ns.response(404, 'User not found', error_model)
     @users_ns.response(403, 'Forbidden: Admin required', error_model)
     @users_ns.response(400, 'Invalid input', error_model)
     @users_ns.response(409, 'Email already exists', error_model)
+    @users_ns.response(412, 'Precondition failed: the user changed since If-Match', error_model)
+    @if_match(lambda user_id: facade.get_entity_version(User, user_id))
     def put(self, user_id):
         """Update user (Admin only - can modify all fields)"""
         user_data = users_ns.payload
@@ -190,15 +199,18 @@ class UserAdminResource(Resource):
             users_ns.abort(400, message="No data provided")
         
         try:
-            updated_user = facade.update_user_by_admin(user_id, user_data)
-            if updated_user is None:
-                users_ns.abort(404, message=f"User with ID {user_id} not found")
-            
-            return updated_user.to_dict(), 200
-            
+            row = facade.update_user_by_admin(user_id, user_data, user_rows.columns,
+                                              expected_version=expected_version())
         except ValueError as e:
             users_ns.abort(400, message=str(e))
+        except StaleDataError:
+            raise  # 412, see if_match
         except Exception as e:
             if "already exists" in str(e).lower():
                 users_ns.abort(409, message=str(e))
-            users_ns.abort(400, message=str(e))
\ No newline at end of file
+            users_ns.abort(400, message=str(e))
+
+        # Outside the try: the generic handler above would turn the 404 into a 400
+        if row is None:
+            users_ns.abort(404, message=f"User with ID {user_id} not found")
+        return user_rows.one(row), 200
\ No newline at end of file
@@ -0,0 +1,134 @@
+import json
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from a2wsgi import WSGIMiddleware
+from werkzeug.datastructures import Headers, MultiDict
+
+from app import create_app, CORS_EXPOSE_HEADERS
+
+
+class ReadRequest:
+    """What an async read handler needs from an ASGI request."""
+
+    def __init__(self, path: str, query_string: str, headers: Headers):
+        self.path = path
+        self.query_string = query_string
+        self.args = MultiDict(parse_qsl(query_string, keep_blank_values=True))
+        self.headers = headers
+
+
+class NotFound(Exception):
+    """Raised by an async read handler when the entity does not exist (404)."""
+
+
+class AsyncReadApp:
+    """
+    ASGI application serving the read-heavy routes with async handlers
+    (app.api.v2.async_reads) and every other request with the Flask app,
+    run on a pool of wsgi_workers threads. A request waiting on the database
+    in an async handler holds no thread.
+    """
+
+    def __init__(self, flask_app, session_factory, routes: List[Tuple[str, str, Callable]],
+                 wsgi_workers: int = 10):
+        self.flask_app = flask_app
+        self.session_factory = session_factory
+        self.routes = [(method, re.compile(pattern), handler) for method, pattern, handler in routes]
+        self.wsgi = WSGIMiddleware(flask_app, workers=wsgi_workers)
+        self.json_settings = flask_app.config.get('RESTX_JSON', {})
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+            return
+        route = self.match(scope) if scope['type'] == 'http' else None
+        if route is None:
+            await self.wsgi(scope, receive, send)
+            return
+        handler, kwargs = route
+        await self.serve(handler, kwargs, scope, send)
+
+    def match(self, scope) -> Optional[Tuple[Callable, Dict[str, str]]]:
+        for method, pattern, handler in self.routes:
+            if scope['method'] != method:
+                continue
+            found = pattern.match(scope['path'])
+            if found:
+                return handler, found.groupdict()
+        return None
+
+    async def serve(self, handler, kwargs, scope, send) -> None:
+        headers = Headers([(name.decode('latin-1'), value.decode('latin-1'))
+                           for name, value in scope['headers']])
+        request = ReadRequest(scope['path'], scope['query_string'].decode('latin-1'), headers)
+        try:
+            async with self.session_factory() as session:
+                data, status, extra = await handler(session, request, **kwargs)
+        except NotFound as e:
+            data, status, extra = {'message': str(e)}, 404, {}
+        except ValueError as e:
+            data, status, extra = {'message': str(e)}, 400, {}
+        except Exception:
+            # Same body as Flask-RESTX gives for an unhandled error, and still the CORS
+            # headers, so a browser client sees the 500 rather than a CORS failure
+            self.flask_app.logger.exception("Unhandled error on %s %s", scope['method'], scope['path'])
+            data, status, extra = {'message': "Internal Server Error"}, 500, {}
+
+        response_headers = Headers(extra)
+        body = b''
+        if status != 304:
+            # Lists come already encoded by their serializer
+            if isinstance(data, bytes):
+                body = data
+            else:
+                body = (json.dumps(data, **self.json_settings) + "\n").encode('utf-8')
+            response_headers['Content-Type'] = 'application/json'
+        response_headers['Content-Length'] = str(len(body))
+        origin = headers.get('Origin')
+        if origin:
+            # Same answer as flask-cors gives on the Flask routes
+            response_headers['Access-Control-Allow-Origin'] = origin
+            response_headers['Access-Control-Expose-Headers'] = ', '.join(sorted(CORS_EXPOSE_HEADERS))
+            response_headers['Vary'] = 'Origin'
+
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                        for name, value in response_headers.items()],
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.session_factory.kw['bind'].dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+
+def create_asgi_app(config_class="config.DevelopmentConfig") -> AsyncReadApp:
+    """ASGI counterpart of create_app: same configuration, facade and routes."""
+    flask_app = create_app(config_class)
+
+    # The handlers import the namespaces, which need the facade create_app built
+    from app.api.v2 import async_reads
+    from app.persistence.async_engine import create_async_session_factory
+
+    with flask_app.app_context():
+        session_factory = create_async_session_factory(flask_app)
+
+    routes = [
+        ('GET', r'^/api/v2/places/$', async_reads.list_places),
+        # /places/nearby stays on its own (sync) route, as in Flask
+        ('GET', r'^/api/v2/places/(?!nearby$)(?P<place_id>[^/]+)$', async_reads.get_place),
+        ('GET', r'^/api/v2/reviews/places/(?P<place_id>[^/]+)/reviews$', async_reads.list_place_reviews),
+        ('GET', r'^/api/v2/amenities/$', async_reads.list_amenities),
+    ]
+    return AsyncReadApp(flask_app, session_factory, routes,
+                        wsgi_workers=flask_app.config.get('ASGI_WSGI_WORKERS', 10))
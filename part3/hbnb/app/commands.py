@@ -0,0 +1,104 @@
+import click
+from flask import Flask
+
+from app.services.importer import IMPORT_KINDS, DEFAULT_CHUNK_SIZE, read_rows
+from app.services.purge import DEFAULT_PURGE_BATCH_SIZE
+
+
+def register_commands(app: Flask):
+    """Register the maintenance commands on the Flask CLI (flask --app run <command>)"""
+
+    @app.cli.command('repair-ratings')
+    def repair_ratings():
+        """Recompute review_count, rating_sum and avg_rating of every place."""
+        from app import get_facade
+        updated = get_facade().recompute_rating_aggregates()
+        click.echo(f"Rating aggregates recomputed for {updated} place(s).")
+
+    @app.cli.command('purge-deleted')
+    @click.option('--batch-size', default=DEFAULT_PURGE_BATCH_SIZE, show_default=True,
+                  help='Rows deleted per statement and per transaction.')
+    def purge_deleted(batch_size):
+        """Hard-delete the soft-deleted users, places and reviews and what depends on them."""
+        from app import get_facade
+        purged = get_facade().purge_deleted(batch_size)
+        click.echo(", ".join(f"{count} {table}" for table, count in purged.items()) + " row(s) purged.")
+
+    @app.cli.command('jobs-worker')
+    @click.option('--once', is_flag=True, help='Run the jobs due now, then exit.')
+    def jobs_worker(once):
+        """Run the queued background jobs (app.jobs), retrying failures with backoff."""
+        from app.jobs import Worker
+        worker = Worker.from_config(app.config)
+        if once:
+            counts = worker.run_pending()
+            click.echo(f"{counts['done']} job(s) done, {counts['retried']} to retry, {counts['failed']} failed.")
+            return
+        click.echo("Waiting for jobs, Ctrl+C to stop.")
+        try:
+            worker.run_forever()
+        except KeyboardInterrupt:
+            pass
+
+    @app.cli.command('jobs-enqueue')
+    @click.argument('name')
+    @click.option('--payload', default='{}', show_default=True,
+                  help='JSON object of the job arguments, e.g. \'{"place_ids": ["..."]}\'.')
+    def jobs_enqueue(name, payload):
+        """Queue a background job (purge_deleted, recompute_ratings, rebuild_geo_index)."""
+        import json
+        from app.jobs import enqueue
+        from app.persistence.unit_of_work import unit_of_work
+        try:
+            with unit_of_work():
+                queued = enqueue(name, **json.loads(payload))
+        except (ValueError, TypeError) as e:
+            raise click.BadParameter(str(e))
+        click.echo(f"Job {name} queued." if queued else f"Job {name} already waiting.")
+
+    @app.cli.command('geo-reindex')
+    @click.option('--missing-only', is_flag=True, help='Only index the places without a grid cell.')
+    def geo_reindex(missing_only):
+        """Queue the rebuild of the places' grid cells (after a change of the grid), run by jobs-worker."""
+        from app import get_facade
+        from app.jobs import REBUILD_GEO_INDEX
+        facade = get_facade()
+        with facade.transaction():
+            queued = facade.enqueue(REBUILD_GEO_INDEX, missing_only=missing_only)
+        click.echo("Geo index rebuild queued." if queued else "Geo index rebuild already waiting.")
+
+    @app.cli.command('db-upgrade')
+    def db_upgrade():
+        """Apply the pending schema migrations (app/migrations)."""
+        from app.extensions import db
+        from app.migrations import upgrade
+        applied = upgrade(db.engine)
+        for name in applied:
+            click.echo(f"Applied {name}")
+        click.echo(f"{len(applied)} migration(s) applied, schema up to date.")
+
+    @app.cli.command('db-status')
+    def db_status():
+        """List the schema migrations and whether they are applied."""
+        from app.extensions import db
+        from app.migrations import status
+        for version, name, applied in status(db.engine):
+            click.echo(f"[{'x' if applied else ' '}] {name}")
+
+    @app.cli.command('import-data')
+    @click.argument('kind', type=click.Choice(IMPORT_KINDS))
+    @click.argument('source', type=click.File('r', encoding='utf-8'))
+    @click.option('--format', 'fmt', type=click.Choice(['ndjson', 'csv']),
+                  help='Input format, guessed from the file extension by default.')
+    @click.option('--chunk-size', default=DEFAULT_CHUNK_SIZE, show_default=True,
+                  help='Rows inserted per transaction.')
+    def import_data(kind, source, fmt, chunk_size):
+        """Bulk import amenities, places or reviews from an NDJSON or CSV file."""
+        from app import get_facade
+        fmt = fmt or ('csv' if source.name.endswith('.csv') else 'ndjson')
+        report = get_facade().bulk_import(kind, read_rows(source, fmt), chunk_size=chunk_size)
+
+        for error in report['errors']:
+            click.echo(f"line {error['line']}: {error['error']}", err=True)
+        click.echo(f"{report['created']} {kind} created, {report['failed']} failed "
+                   f"out of {report['processed']} row(s).")
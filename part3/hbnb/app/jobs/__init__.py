@@ -0,0 +1,15 @@
+"""
+Background jobs: work deferred out of the request thread.
+
+Facade methods stage jobs with enqueue() in their unit of work; they are
+rows of the jobs table, committed (or rolled back) with the request.
+`flask --app run jobs-worker` claims and runs them, retrying failures with an
+exponential backoff; with JOBS_IN_PROCESS a thread of the web process runs
+them right after the commit instead.
+"""
+from app.jobs.queue import JOBS, ClaimedJob, enqueue, job
+from app.jobs.worker import BackgroundWorker, Worker, run_on_commit
+from app.jobs.tasks import PURGE_DELETED, RECOMPUTE_RATINGS, REBUILD_GEO_INDEX
+
+__all__ = ['JOBS', 'ClaimedJob', 'enqueue', 'job', 'BackgroundWorker', 'Worker', 'run_on_commit',
+           'PURGE_DELETED', 'RECOMPUTE_RATINGS', 'REBUILD_GEO_INDEX']
@@ -0,0 +1,119 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Callable, Dict, NamedTuple, Optional
+
+from app.extensions import db
+from app.models import Job
+from app.persistence.unit_of_work import unit_of_work
+
+DEFAULT_MAX_ATTEMPTS = 5
+# Session flag set by enqueue(), in-process runners wake up once it commits
+JOBS_ENQUEUED = 'jobs_enqueued'
+
+
+class JobSpec(NamedTuple):
+    function: Callable
+    max_attempts: int
+
+
+# Job name -> function run by the worker, filled by @job
+JOBS: Dict[str, JobSpec] = {}
+
+
+def job(name: str, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+    """
+    Register a function the worker can run under name. It is called with the
+    JSON payload given to enqueue() as keyword arguments, outside any unit of
+    work, and must be idempotent: a job is retried after a failure or a crash.
+    """
+    def register(function):
+        JOBS[name] = JobSpec(function, max_attempts)
+        return function
+    return register
+
+
+def dedupe_key(name: str, payload: Dict) -> str:
+    return hashlib.sha256(json.dumps([name, payload], sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def enqueue(name: str, delay: float = 0.0, **payload) -> bool:
+    """
+    Stage a job in the current transaction: workers only see it once that commits,
+    so it never runs before the data it follows up on, nor after a rollback.
+    A job with the same name and payload still waiting to be claimed is reused
+    instead (True when a new one was queued). It is touched by the same statement
+    that finds it, so a worker cannot claim it before this transaction commits.
+    """
+    if name not in JOBS:
+        raise ValueError(f"Unknown job '{name}', expected one of {sorted(JOBS)}.")
+    session = db.session
+    key = dedupe_key(name, payload)
+    session.info[JOBS_ENQUEUED] = True
+
+    waiting = session.execute(
+        db.update(Job).where(Job.dedupe_key == key, Job.status == Job.QUEUED)
+        .values(status=Job.QUEUED).execution_options(synchronize_session=False)
+    ).rowcount
+    if waiting:
+        return False
+    session.add(Job(name=name, payload=payload, dedupe_key=key, max_attempts=JOBS[name].max_attempts,
+                    run_after=datetime.utcnow() + timedelta(seconds=delay)))
+    return True
+
+
+def due_condition(now: datetime, lock_timeout: float):
+    """Queued jobs whose time has come, and running ones whose worker went silent."""
+    return db.or_(
+        db.and_(Job.status == Job.QUEUED, Job.run_after <= now),
+        db.and_(Job.status == Job.RUNNING, Job.locked_at <= now - timedelta(seconds=lock_timeout)),
+    )
+
+
+class ClaimedJob(NamedTuple):
+    id: str
+    name: str
+    payload: Dict
+    attempts: int
+    max_attempts: int
+
+
+def claim(now: datetime, lock_timeout: float) -> Optional[ClaimedJob]:
+    """
+    Take the next due job for this worker, or None. The conditional UPDATE
+    only matches while the job is still due, so two workers never both claim it;
+    the one that loses moves on to the next job.
+    """
+    due = due_condition(now, lock_timeout)
+    columns = (Job.id, Job.name, Job.payload, Job.attempts, Job.max_attempts)
+    while True:
+        with unit_of_work() as session:
+            candidate = session.execute(db.select(*columns).where(due).order_by(Job.run_after).limit(1)).first()
+            if candidate is None:
+                return None
+            claimed = session.execute(
+                db.update(Job).where(Job.id == candidate.id, due)
+                .values(status=Job.RUNNING, locked_at=now, attempts=Job.attempts + 1)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+        if claimed:
+            return ClaimedJob(candidate.id, candidate.name, candidate.payload or {},
+                              candidate.attempts + 1, candidate.max_attempts)
+
+
+def finish(claimed: ClaimedJob) -> None:
+    """A job succeeded: its row is deleted, the queue only keeps pending and failed work."""
+    with unit_of_work() as session:
+        session.execute(db.delete(Job).where(Job.id == claimed.id))
+
+
+def retry_or_fail(claimed: ClaimedJob, error: str, retry_at: datetime) -> bool:
+    """Record a failure: queued again for retry_at, or failed for good after max_attempts (False)."""
+    retry = claimed.attempts < claimed.max_attempts
+    with unit_of_work() as session:
+        session.execute(db.update(Job).where(Job.id == claimed.id).values(
+            status=Job.QUEUED if retry else Job.FAILED,
+            run_after=retry_at if retry else Job.run_after,
+            locked_at=None, last_error=error
+        ).execution_options(synchronize_session=False))
+    return retry
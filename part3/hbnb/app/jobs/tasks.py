@@ -0,0 +1,32 @@
+from typing import Dict, List, Optional
+
+from flask import current_app
+
+from app.jobs.queue import job
+
+# Names the facade enqueues. Job functions import the services when they run:
+# the facade itself imports this package
+PURGE_DELETED = 'purge_deleted'
+RECOMPUTE_RATINGS = 'recompute_ratings'
+REBUILD_GEO_INDEX = 'rebuild_geo_index'
+
+
+@job(PURGE_DELETED)
+def purge_deleted_rows(batch_size: Optional[int] = None) -> Dict[str, int]:
+    """Hard-delete the soft-deleted rows, one transaction per chunk."""
+    from app.services.purge import DEFAULT_PURGE_BATCH_SIZE, purge_deleted
+    return purge_deleted(batch_size or current_app.config.get('PURGE_BATCH_SIZE', DEFAULT_PURGE_BATCH_SIZE))
+
+
+@job(RECOMPUTE_RATINGS)
+def recompute_ratings(place_ids: Optional[List[str]] = None) -> int:
+    """Rebuild the rating aggregates of place_ids, or of every place."""
+    from app import get_facade
+    return get_facade().recompute_rating_aggregates(place_ids)
+
+
+@job(REBUILD_GEO_INDEX)
+def rebuild_geo_index(missing_only: bool = False) -> int:
+    """Recompute the grid cell of every place (of those without one with missing_only), in batches."""
+    from app import get_facade
+    return get_facade().rebuild_geo_index(missing_only)
@@ -0,0 +1,144 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from flask import current_app
+from sqlalchemy import event
+
+from app.extensions import db
+from app.jobs.queue import JOBS, JOBS_ENQUEUED, ClaimedJob, claim, finish, retry_or_fail
+
+
+class Worker:
+    """
+    Runs due jobs one at a time in the current app context.
+    A failed job is retried after an exponential backoff (backoff_base,
+    doubling per attempt, at most backoff_max seconds) until it has been tried
+    max_attempts times; it then stays in the table as failed, with its last error.
+    A running job not finished after lock_timeout seconds is taken over,
+    its worker is presumed dead.
+    """
+
+    def __init__(self, backoff_base: float = 5.0, backoff_max: float = 600.0,
+                 lock_timeout: float = 900.0, poll_interval: float = 1.0):
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+
+    @classmethod
+    def from_config(cls, config) -> 'Worker':
+        return cls(backoff_base=config.get('JOB_BACKOFF_SECONDS', 5.0),
+                   backoff_max=config.get('JOB_BACKOFF_MAX_SECONDS', 600.0),
+                   lock_timeout=config.get('JOB_LOCK_TIMEOUT_SECONDS', 900.0),
+                   poll_interval=config.get('JOB_POLL_INTERVAL_SECONDS', 1.0))
+
+    def backoff(self, attempts: int) -> float:
+        """Seconds to wait before the next try of a job that failed attempts times."""
+        return min(self.backoff_max, self.backoff_base * 2 ** (attempts - 1))
+
+    def run_pending(self, limit: Optional[int] = None, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Run the jobs due now (at most limit), returns how many were done, retried and failed."""
+        counts = {'done': 0, 'retried': 0, 'failed': 0}
+        while limit is None or sum(counts.values()) < limit:
+            claimed = claim(now or datetime.utcnow(), self.lock_timeout)
+            if claimed is None:
+                break
+            counts[self.run(claimed, now)] += 1
+        return counts
+
+    def run(self, claimed: ClaimedJob, now: Optional[datetime] = None) -> str:
+        try:
+            spec = JOBS.get(claimed.name)
+            if spec is None:
+                raise LookupError(f"No job function registered as '{claimed.name}'")
+            spec.function(**claimed.payload)
+        except Exception as error:
+            db.session.rollback()
+            retry_at = (now or datetime.utcnow()) + timedelta(seconds=self.backoff(claimed.attempts))
+            retried = retry_or_fail(claimed, f"{type(error).__name__}: {error}", retry_at)
+            current_app.logger.warning("Job %s (%s) failed on attempt %d/%d: %s%s", claimed.name, claimed.id,
+                                       claimed.attempts, claimed.max_attempts, error,
+                                       ", will retry" if retried else ", giving up")
+            return 'retried' if retried else 'failed'
+        finish(claimed)
+        return 'done'
+
+    def run_forever(self, stop: Optional[threading.Event] = None) -> None:
+        """Poll for due jobs until stop is set (the `flask jobs-worker` loop)."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            ran = sum(self.run_pending().values())
+            # Hand the connection back between polls
+            db.session.remove()
+            if not ran:
+                stop.wait(self.poll_interval)
+
+
+class BackgroundWorker:
+    """
+    Runs Worker.run_pending() on one thread of the web process right after a
+    transaction that queued jobs commits, for setups without a worker process.
+    Wake-ups arriving while a run is queued coalesce into it; one arriving while
+    a run is in progress queues one more. Retries wait for the next wake-up
+    (or a `flask jobs-worker`), nothing polls in the web process.
+    """
+
+    def __init__(self, worker: Worker):
+        self.worker = worker
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='jobs')
+        self._lock = threading.Lock()
+        self._queued = False
+
+    @classmethod
+    def from_config(cls, config) -> Optional['BackgroundWorker']:
+        if not config.get('JOBS_IN_PROCESS', False):
+            return None
+        return cls(Worker.from_config(config))
+
+    def request(self, app):
+        """Queue a run in an app context of app, returns its future (None when one is already queued)."""
+        with self._lock:
+            if self._queued:
+                return None
+            self._queued = True
+        return self._executor.submit(self._run, app)
+
+    def _run(self, app) -> Dict[str, int]:
+        with self._lock:
+            self._queued = False
+        with app.app_context():
+            try:
+                return self.worker.run_pending()
+            except Exception:
+                app.logger.exception("In-process job run failed, the jobs stay queued")
+                raise
+            finally:
+                db.session.remove()
+
+
+# The runner woken by the session listeners, see run_on_commit
+_runner: Optional[BackgroundWorker] = None
+
+
+def run_on_commit(runner: BackgroundWorker) -> None:
+    """
+    Wake the in-process runner after every commit that queued jobs.
+    The session listeners are registered once per process: a later call
+    only replaces the runner they wake.
+    """
+    global _runner
+    _runner = runner
+    for name, listener in (('after_commit', _after_commit), ('after_rollback', _after_rollback)):
+        if not event.contains(db.session, name, listener):
+            event.listen(db.session, name, listener)
+
+
+def _after_commit(session) -> None:
+    if session.info.pop(JOBS_ENQUEUED, False):
+        _runner.request(current_app._get_current_object())
+
+
+def _after_rollback(session) -> None:
+    session.info.pop(JOBS_ENQUEUED, None)
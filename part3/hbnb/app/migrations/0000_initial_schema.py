@@ -0,0 +1,70 @@
+"""
+Baseline schema: users, amenities, places, place_amenity and reviews exactly
+as the former db.create_all() at startup built them. Tables that already exist
+(databases created that way) are kept as they are; the later migrations add
+what the models gained since (0006-0008 for the place listing columns).
+"""
+from sqlalchemy import (
+    Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, MetaData,
+    String, Table, Text, UniqueConstraint
+)
+
+metadata = MetaData()
+
+
+def timestamps():
+    return [
+        Column('id', String(36), primary_key=True),
+        Column('created_at', DateTime, nullable=False),
+        Column('updated_at', DateTime, nullable=False),
+    ]
+
+
+Table(
+    'users', metadata,
+    Column('first_name', String(50), nullable=False),
+    Column('last_name', String(50), nullable=False),
+    Column('email', String(120), nullable=False),
+    Column('password_hash', String(255), nullable=False),
+    Column('is_admin', Boolean, nullable=False),
+    *timestamps(),
+    Index('ix_users_email', 'email', unique=True),
+)
+
+Table(
+    'amenities', metadata,
+    Column('name', String(128), nullable=False),
+    *timestamps(),
+    Index('ix_amenities_name', 'name', unique=True),
+)
+
+Table(
+    'places', metadata,
+    Column('title', String(100), nullable=False),
+    Column('description', Text),
+    Column('price', Float, nullable=False),
+    Column('latitude', Float, nullable=False),
+    Column('longitude', Float, nullable=False),
+    Column('owner_id', String(36), ForeignKey('users.id'), nullable=False),
+    *timestamps(),
+)
+
+Table(
+    'place_amenity', metadata,
+    Column('place_id', String(36), ForeignKey('places.id'), primary_key=True),
+    Column('amenity_id', String(36), ForeignKey('amenities.id'), primary_key=True),
+)
+
+Table(
+    'reviews', metadata,
+    Column('text', Text, nullable=False),
+    Column('rating', Integer, nullable=False),
+    Column('place_id', String(36), ForeignKey('places.id'), nullable=False),
+    Column('user_id', String(36), ForeignKey('users.id'), nullable=False),
+    *timestamps(),
+    UniqueConstraint('user_id', 'place_id', name='unique_user_place_review'),
+)
+
+
+def upgrade(connection):
+    metadata.create_all(connection, checkfirst=True)
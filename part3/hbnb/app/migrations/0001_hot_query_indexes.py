@@ -0,0 +1,21 @@
+"""
+Index the foreign keys and sort keys the facade filters on:
+- reviews (place_id, created_at): a place's reviews and their collection version
+- places (owner_id): a user's places (owner relationship, cascades)
+- places (price): price filters of the listing
+- place_amenity (amenity_id, place_id): amenity -> places and the amenity filter
+Lookups by reviews.user_id use the (user_id, place_id) unique index.
+"""
+from app.migrations import create_index
+
+INDEXES = [
+    ('ix_reviews_place_id_created_at', 'reviews', ['place_id', 'created_at']),
+    ('ix_places_owner_id', 'places', ['owner_id']),
+    ('ix_places_price', 'places', ['price']),
+    ('ix_place_amenity_amenity_id_place_id', 'place_amenity', ['amenity_id', 'place_id']),
+]
+
+
+def upgrade(connection):
+    for name, table, columns in INDEXES:
+        create_index(connection, name, table, columns)
@@ -0,0 +1,15 @@
+"""
+Add the version column of optimistic concurrency control (BaseModel.version)
+to the entity tables. Existing rows start at version 1 through the server
+default, so the column is added online without a backfill.
+"""
+from sqlalchemy import inspect
+
+TABLES = ['users', 'amenities', 'places', 'reviews']
+
+
+def upgrade(connection):
+    for table in TABLES:
+        if 'version' in {column['name'] for column in inspect(connection).get_columns(table)}:
+            continue
+        connection.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN version INTEGER DEFAULT '1' NOT NULL")
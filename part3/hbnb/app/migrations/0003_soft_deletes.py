@@ -0,0 +1,14 @@
+"""
+Add the deleted_at column of soft deletes (BaseModel.deleted_at) to the entity
+tables. It is nullable and every existing row is live, so no backfill.
+"""
+from sqlalchemy import inspect
+
+TABLES = ['users', 'amenities', 'places', 'reviews']
+
+
+def upgrade(connection):
+    for table in TABLES:
+        if 'deleted_at' in {column['name'] for column in inspect(connection).get_columns(table)}:
+            continue
+        connection.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN deleted_at DATETIME")
@@ -0,0 +1,17 @@
+"""
+Partial indexes of the soft-deleted users, places and reviews, which the purge
+looks up in batches. Live rows (deleted_at IS NULL) stay out of them, so they
+are small and reads never choose them. Amenities are deleted right away.
+"""
+from app.migrations import create_index
+
+INDEXES = [
+    ('ix_users_deleted_at', 'users'),
+    ('ix_places_deleted_at', 'places'),
+    ('ix_reviews_deleted_at', 'reviews'),
+]
+
+
+def upgrade(connection):
+    for name, table in INDEXES:
+        create_index(connection, name, table, ['deleted_at'], where='deleted_at IS NOT NULL')
@@ -0,0 +1,28 @@
+"""
+Job table of the background queue (app.jobs). A new, empty table: its
+indexes are created with it.
+"""
+from sqlalchemy import Column, DateTime, Index, Integer, JSON, MetaData, String, Table, Text
+
+metadata = MetaData()
+
+Table(
+    'jobs', metadata,
+    Column('id', String(36), primary_key=True),
+    Column('name', String(100), nullable=False),
+    Column('payload', JSON, nullable=False),
+    Column('dedupe_key', String(64), nullable=False),
+    Column('status', String(20), nullable=False),
+    Column('attempts', Integer, nullable=False),
+    Column('max_attempts', Integer, nullable=False),
+    Column('run_after', DateTime, nullable=False),
+    Column('locked_at', DateTime),
+    Column('last_error', Text),
+    Column('created_at', DateTime, nullable=False),
+    Index('ix_jobs_status_run_after', 'status', 'run_after'),
+    Index('ix_jobs_dedupe_key', 'dedupe_key'),
+)
+
+
+def upgrade(connection):
+    metadata.create_all(connection, checkfirst=True)
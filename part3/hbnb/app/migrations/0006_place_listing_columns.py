@@ -0,0 +1,22 @@
+"""
+Add the place columns of the listing features to databases built before them:
+- geo_cell: spatial grid bucket of (latitude, longitude), see app.services.geo
+- review_count, rating_sum, avg_rating: rating aggregates kept by the facade
+The aggregates start at zero through their server default; 0008 backfills them
+and the grid cells.
+"""
+from sqlalchemy import inspect
+
+COLUMNS = [
+    ('geo_cell', "INTEGER"),
+    ('review_count', "INTEGER DEFAULT 0 NOT NULL"),
+    ('rating_sum', "INTEGER DEFAULT 0 NOT NULL"),
+    ('avg_rating', "FLOAT"),
+]
+
+
+def upgrade(connection):
+    existing = {column['name'] for column in inspect(connection).get_columns('places')}
+    for name, ddl in COLUMNS:
+        if name not in existing:
+            connection.exec_driver_sql(f"ALTER TABLE places ADD COLUMN {name} {ddl}")
@@ -0,0 +1,18 @@
+"""
+Index the place listing columns added by 0006:
+- places (geo_cell): nearby search by grid cell
+- places (avg_rating): rating filter of the listing
+- places (created_at, id): keyset pagination of the listing
+"""
+from app.migrations import create_index
+
+INDEXES = [
+    ('ix_places_geo_cell', 'places', ['geo_cell']),
+    ('ix_places_avg_rating', 'places', ['avg_rating']),
+    ('ix_places_created_at_id', 'places', ['created_at', 'id']),
+]
+
+
+def upgrade(connection):
+    for name, table, columns in INDEXES:
+        create_index(connection, name, table, columns)
@@ -0,0 +1,59 @@
+"""
+Backfill the columns added by 0006 on existing places:
+- geo_cell where it is NULL, on the 0.5 degree grid of this migration
+- review_count, rating_sum and avg_rating from the live reviews
+The places are read and updated BATCH_SIZE at a time to bound the statements
+and the rows held in memory, but like every migration this one runs in a
+single transaction: it is applied entirely or not at all.
+Recomputing aggregates that are already right changes nothing, so databases
+that had the columns all along go through it unharmed.
+"""
+from sqlalchemy import bindparam, text
+
+BATCH_SIZE = 500
+
+# The grid as of this migration, frozen here rather than imported from
+# app.services.geo so that a later grid change cannot alter what it writes.
+CELL_DEGREES = 0.5
+GRID_ROWS = 360
+GRID_COLUMNS = 720
+
+
+def _geo_cell(latitude, longitude):
+    row = min(int((latitude + 90) / CELL_DEGREES), GRID_ROWS - 1)
+    column = int((longitude + 180) / CELL_DEGREES) % GRID_COLUMNS
+    return row * GRID_COLUMNS + column
+
+
+SET_CELL = text("UPDATE places SET geo_cell = :cell WHERE id = :place_id")
+
+RECOMPUTE = text("""
+    UPDATE places SET
+        review_count = (SELECT count(*) FROM reviews
+                        WHERE reviews.place_id = places.id AND reviews.deleted_at IS NULL),
+        rating_sum = (SELECT coalesce(sum(rating), 0) FROM reviews
+                      WHERE reviews.place_id = places.id AND reviews.deleted_at IS NULL),
+        avg_rating = (SELECT avg(CAST(rating AS FLOAT)) FROM reviews
+                      WHERE reviews.place_id = places.id AND reviews.deleted_at IS NULL)
+    WHERE id IN :place_ids
+""").bindparams(bindparam('place_ids', expanding=True))
+
+
+def upgrade(connection):
+    while True:
+        rows = connection.exec_driver_sql(
+            f"SELECT id, latitude, longitude FROM places WHERE geo_cell IS NULL LIMIT {BATCH_SIZE}").all()
+        if not rows:
+            break
+        connection.execute(SET_CELL, [{'cell': _geo_cell(latitude, longitude), 'place_id': place_id}
+                                      for place_id, latitude, longitude in rows])
+
+    last_id = ''
+    while True:
+        place_ids = connection.execute(text(
+            f"SELECT id FROM places WHERE id > :last_id ORDER BY id LIMIT {BATCH_SIZE}"
+        ), {'last_id': last_id}).scalars().all()
+        if not place_ids:
+            break
+        connection.execute(RECOMPUTE, {'place_ids': place_ids})
+        last_id = place_ids[-1]
@@ -0,0 +1,80 @@
+"""
+Versioned schema migrations.
+
+Each module named NNNN_description.py defines upgrade(connection), which runs
+in its own transaction. Applied versions are recorded in schema_migrations,
+so `flask --app run db-upgrade` only runs the pending ones, in order.
+Migrations are frozen: they spell out their DDL instead of reading the models.
+
+To keep changes online on a live database, add columns as nullable or with a
+server default, create indexes in their own migration, and backfill data in
+batches rather than in the DDL migration.
+"""
+import importlib
+import pkgutil
+import re
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, inspect
+
+MIGRATION_NAME = re.compile(r'^(\d{4})_\w+$')
+
+schema_migrations = Table(
+    'schema_migrations', MetaData(),
+    Column('version', String(4), primary_key=True),
+    Column('name', String(255), nullable=False),
+    Column('applied_at', DateTime, nullable=False),
+)
+
+
+def discover() -> List[Tuple[str, str]]:
+    """(version, module name) of every migration, oldest first."""
+    found = []
+    for module in pkgutil.iter_modules(__path__):
+        match = MIGRATION_NAME.match(module.name)
+        if match:
+            found.append((match.group(1), module.name))
+    return sorted(found)
+
+
+def applied_versions(connection) -> set:
+    if not inspect(connection).has_table(schema_migrations.name):
+        return set()
+    return set(connection.execute(schema_migrations.select().with_only_columns(
+        schema_migrations.c.version)).scalars())
+
+
+def pending(engine) -> List[Tuple[str, str]]:
+    return [(version, name) for version, name, applied in status(engine) if not applied]
+
+
+def status(engine) -> List[Tuple[str, str, bool]]:
+    """(version, module name, applied) of every migration."""
+    with engine.connect() as connection:
+        done = applied_versions(connection)
+    return [(version, name, version in done) for version, name in discover()]
+
+
+def upgrade(engine) -> List[str]:
+    """Apply the pending migrations, returns the names of those applied."""
+    schema_migrations.create(engine, checkfirst=True)
+    applied = []
+    for version, name in pending(engine):
+        module = importlib.import_module(f"{__name__}.{name}")
+        with engine.begin() as connection:
+            module.upgrade(connection)
+            connection.execute(schema_migrations.insert().values(
+                version=version, name=name, applied_at=datetime.utcnow()))
+        applied.append(name)
+    return applied
+
+
+def create_index(connection, name: str, table: str, columns: List[str],
+                 where: Optional[str] = None) -> None:
+    """CREATE INDEX unless it exists (portable, MySQL has no IF NOT EXISTS for indexes).
+    `where` makes it a partial index where supported (SQLite, PostgreSQL), a full one elsewhere."""
+    if name in {index['name'] for index in inspect(connection).get_indexes(table)}:
+        return
+    condition = f" WHERE {where}" if where and connection.dialect.name in ('sqlite', 'postgresql') else ""
+    connection.exec_driver_sql(f"CREATE INDEX {name} ON {table} ({', '.join(columns)}){condition}")
@@ -2,5 +2,6 @@ from .user import User
 from .place import Place
 from .amenity import Amenity
 from .review import Review
+from .job import Job
 
-__all__ = ['User', 'Place', 'Amenity', 'Review']
\ No newline at end of file
+__all__ = ['User', 'Place', 'Amenity', 'Review', 'Job']
@@ -1,23 +1,41 @@
 import uuid
 from datetime import datetime
+from sqlalchemy.orm import declared_attr
 from app.extensions import db
 
+def soft_deleted_index(table):
+    """Partial index of the soft-deleted rows of a table, which the purge walks.
+    Live rows are not indexed, so reads filtering on deleted_at IS NULL never pick it."""
+    only_deleted = db.text('deleted_at IS NOT NULL')
+    return db.Index(f'ix_{table}_deleted_at', 'deleted_at',
+                    sqlite_where=only_deleted, postgresql_where=only_deleted)
+
+
 class BaseModel(db.Model):
     __abstract__ = True
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Optimistic concurrency: bumped by every UPDATE, which the ORM makes
+    # conditional on the version it loaded (StaleDataError when it changed)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
+    # Soft delete: set when the entity is deleted, the row is hidden from every
+    # ORM query (see app.persistence.soft_delete) until the purge removes it
+    deleted_at = db.Column(db.DateTime, nullable=True)
+
+    @declared_attr.directive
+    def __mapper_args__(cls):
+        return {'version_id_col': cls.__table__.c.version}
 
     def save(self):
-        """save the object and commit it."""
+        """stage the object, committed by the unit of work."""
         db.session.add(self)
-        db.session.commit()
+        db.session.flush()
 
     def delete(self):
-        """delete on the database."""
+        """stage the deletion, committed by the unit of work."""
         db.session.delete(self)
-        db.session.commit()
 
     def update(self, data: dict):
         """update the attributes."""
@@ -25,7 +43,7 @@ class BaseModel(db.Model):
             # verification if attribute is on the model
             if hasattr(self, key):
                 setattr(self, key, value)
-        db.session.commit() # Commit the changes
+        db.session.flush() # Refresh updated_at, committed by the unit of work
 
     def to_dict(self):
         """Serialize the data"""
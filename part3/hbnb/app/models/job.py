@@ -0,0 +1,52 @@
+import uuid
+from datetime import datetime
+from app.extensions import db
+
+class Job(db.Model):
+    """
+    A unit of deferred work run by the job worker (see app.jobs).
+    Not a BaseModel: jobs are claimed with conditional UPDATEs on status,
+    they are neither versioned nor soft-deleted.
+    """
+    __tablename__ = 'jobs'
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    FAILED = 'failed'
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    name = db.Column(db.String(100), nullable=False)
+    # Keyword arguments of the job function
+    payload = db.Column(db.JSON, nullable=False, default=dict)
+    # name + payload digest: a job is not queued twice while a copy still waits
+    dedupe_key = db.Column(db.String(64), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default=QUEUED)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False)
+    # Not claimed before this time (set by the backoff after a failure)
+    run_after = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    locked_at = db.Column(db.DateTime, nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    # Workers look for due jobs by (status, run_after), enqueue for waiting copies by dedupe_key
+    __table_args__ = (
+        db.Index('ix_jobs_status_run_after', 'status', 'run_after'),
+        db.Index('ix_jobs_dedupe_key', 'dedupe_key'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'payload': self.payload,
+            'status': self.status,
+            'attempts': self.attempts,
+            'max_attempts': self.max_attempts,
+            'run_after': self.run_after.isoformat() if self.run_after else None,
+            'last_error': self.last_error,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+        }
+
+    def __repr__(self):
+        return f"<Job {self.name} {self.status}>"
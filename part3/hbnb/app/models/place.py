@@ -1,9 +1,11 @@
-from app.models.basemodel import BaseModel
+from app.models.basemodel import BaseModel, soft_deleted_index
 from app.extensions import db
 
 place_amenity = db.Table('place_amenity',
     db.Column('place_id', db.String(36), db.ForeignKey('places.id'), primary_key=True),
-    db.Column('amenity_id', db.String(36), db.ForeignKey('amenities.id'), primary_key=True)
+    db.Column('amenity_id', db.String(36), db.ForeignKey('amenities.id'), primary_key=True),
+    # The primary key serves place -> amenities, this one amenity -> places
+    db.Index('ix_place_amenity_amenity_id_place_id', 'amenity_id', 'place_id')
 )
 
 class Place(BaseModel):
@@ -11,14 +13,28 @@ class Place(BaseModel):
 
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text, nullable=True)
-    price = db.Column(db.Float, nullable=False, default=0.0)
+    price = db.Column(db.Float, nullable=False, default=0.0, index=True)
     latitude = db.Column(db.Float, nullable=False)
     longitude = db.Column(db.Float, nullable=False)
+    # Spatial grid bucket of (latitude, longitude), see app.services.geo
+    geo_cell = db.Column(db.Integer, nullable=True, index=True)
 
-    owner_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
+    # Rating aggregates maintained by the facade whenever a review changes
+    review_count = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum = db.Column(db.Integer, nullable=False, default=0)
+    avg_rating = db.Column(db.Float, nullable=True, index=True)
 
-    reviews = db.relationship('Review', backref='place', cascade="all, delete-orphan", lazy='selectin')
-    amenities = db.relationship('Amenity', secondary=place_amenity, backref=db.backref('places', lazy='dynamic'), lazy='selectin')
+    owner_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False, index=True)
+
+    # Loaded lazily; the facade eager-loads what each endpoint renders (see PLACE_LOADERS)
+    reviews = db.relationship('Review', backref='place', cascade="all, delete-orphan", lazy=True)
+    amenities = db.relationship('Amenity', secondary=place_amenity, backref=db.backref('places', lazy='dynamic'), lazy=True)
+
+    # Keyset pagination walks places in (created_at, id) order
+    __table_args__ = (
+        db.Index('ix_places_created_at_id', 'created_at', 'id'),
+        soft_deleted_index('places'),
+    )
 
     def to_nested_dict(self):
         return {
@@ -35,6 +51,8 @@ class Place(BaseModel):
             "latitude": self.latitude,
             "longitude": self.longitude,
             "owner_id": self.owner_id,
+            "review_count": self.review_count or 0,
+            "avg_rating": self.avg_rating,
         })
         
         if hasattr(self, 'owner') and self.owner: 
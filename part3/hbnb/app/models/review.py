@@ -1,4 +1,4 @@
-from app.models.basemodel import BaseModel
+from app.models.basemodel import BaseModel, soft_deleted_index
 from app.extensions import db
 
 class Review(BaseModel):
@@ -11,8 +11,12 @@ class Review(BaseModel):
     user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
 
     # Add unique constraint
+    # Its (user_id, place_id) index also serves lookups by user_id alone;
+    # a place's reviews are read through (place_id, created_at)
     __table_args__ = (
         db.UniqueConstraint('user_id', 'place_id', name='unique_user_place_review'),
+        db.Index('ix_reviews_place_id_created_at', 'place_id', 'created_at'),
+        soft_deleted_index('reviews'),
     )
 
     def to_dict(self):
@@ -1,4 +1,4 @@
-from app.models.basemodel import BaseModel
+from app.models.basemodel import BaseModel, soft_deleted_index
 from app.extensions import db, bcrypt
 
 class User(BaseModel):
@@ -14,6 +14,10 @@ class User(BaseModel):
     places = db.relationship('Place', backref='owner', cascade="all, delete-orphan", lazy=True)
     reviews = db.relationship('Review', backref='user', cascade="all, delete-orphan", lazy=True)
 
+    __table_args__ = (
+        soft_deleted_index('users'),
+    )
+
     @property
     def password(self):
         """Prevent reading password directly"""
@@ -22,9 +26,14 @@ class User(BaseModel):
     @password.setter
     def password(self, password_text):
         """Generate a hashed password"""
+        self.password_hash = self.hash_password(password_text)
+
+    @staticmethod
+    def hash_password(password_text):
+        """bcrypt hash of a password, for writes that do not go through an instance"""
         if not password_text:
             raise ValueError("Password cannot be empty")
-        self.password_hash = bcrypt.generate_password_hash(password_text).decode('utf-8')
+        return bcrypt.generate_password_hash(password_text).decode('utf-8')
 
     def verify_password(self, password_text):
         """Verify the password hash"""
@@ -32,6 +41,14 @@ class User(BaseModel):
             return False
         return bcrypt.check_password_hash(self.password_hash, password_text)
 
+    def password_needs_rehash(self, log_rounds):
+        """True when the stored hash was made with another bcrypt cost"""
+        try:
+            # bcrypt hashes look like $2b$<rounds>$<salt+hash>
+            return int(self.password_hash.split('$')[2]) != log_rounds
+        except (AttributeError, IndexError, ValueError):
+            return True
+
     def to_dict(self):
         """Complete serialization of User (excludes password)"""
         data = super().to_dict()
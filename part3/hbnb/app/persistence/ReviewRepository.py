@@ -1,7 +1,14 @@
 from app.models.review import Review
 from app.extensions import db
 from app.persistence.repository import SQLAlchemyRepository
-from typing import Optional, Any
+from sqlalchemy.orm import joinedload
+from typing import Optional, Any, List
+
+
+def with_relations(query):
+    """Load the author and the place of each review in the same query (Review.to_dict renders both)."""
+    return query.options(joinedload(Review.user), joinedload(Review.place))
+
 
 class ReviewRepository(SQLAlchemyRepository):
     def __init__(self):
@@ -9,12 +16,25 @@ class ReviewRepository(SQLAlchemyRepository):
         
     def get(self, entity_id: str) -> Optional[Review]:
         """
-        Retrieves a Review entity by its string ID.
+        Retrieves a Review entity by its string ID, with its author and place.
         This method is defined here to ensure the correct filter method is used,
         overriding a potentially flawed generic 'get' from the parent repository.
         """
         # We ensure that the string ID is passed to the filter, which resolves the ProgrammingError.
-        return self.model.query.filter_by(id=entity_id).first()
+        return db.session.execute(
+            with_relations(db.select(self.model).filter_by(id=entity_id))
+        ).scalar_one_or_none()
+
+    def get_all(self) -> List[Review]:
+        """All reviews with their authors and places, in one query."""
+        return db.session.execute(with_relations(db.select(self.model))).scalars().all()
+
+    def get_by_place(self, place_id: str) -> List[Review]:
+        """Reviews of a place (oldest first) with their authors, in one query."""
+        query = db.select(self.model).filter_by(place_id=place_id).order_by(
+            self.model.created_at, self.model.id
+        )
+        return db.session.execute(with_relations(query)).scalars().all()
 
     def delete(self, obj_or_id: Any) -> bool:
         """
@@ -33,15 +53,11 @@ class ReviewRepository(SQLAlchemyRepository):
         if not obj_to_delete:
             return False
 
-        try:
-            # Perform the deletion and commit the transaction
-            db.session.delete(obj_to_delete)
-            db.session.commit()
-            return True
-        except Exception:
-            # Rollback on any error to ensure session integrity
-            db.session.rollback()
-            return False
+        # Committed by the enclosing unit of work; the versioned DELETE
+        # (see BaseModel.version) fails here, not at commit
+        db.session.delete(obj_to_delete)
+        db.session.flush()
+        return True
 
     def get_by_attributes(self, **kwargs: Any) -> Optional[Review]:
         """
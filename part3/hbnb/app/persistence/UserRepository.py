@@ -12,11 +12,5 @@ class UserRepository(SQLAlchemyRepository):
         """Deletes a given object from the database."""
         if not obj:
             return False 
-        try:
-            db.session.delete(obj)
-            db.session.commit()
-            return True
-        except Exception as e:
-            db.session.rollback()
-            print(f"Error deleting object: {e}")
-            return False
\ No newline at end of file
+        db.session.delete(obj)
+        return True
\ No newline at end of file
@@ -0,0 +1,43 @@
+from importlib.util import find_spec
+
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from app.extensions import db
+from app.persistence.engine import apply_sqlite_pragmas
+
+# asyncio driver used for each database the sync engine may point at,
+# named after the package providing it
+ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+    'mysql': 'mysql+aiomysql',
+    'postgresql': 'postgresql+asyncpg',
+}
+
+
+def async_database_url(url) -> str:
+    """The same database as url, reached through its asyncio driver."""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No asyncio driver known for '{backend}' databases.")
+    driver = ASYNC_DRIVERS[backend].split('+')[1]
+    if find_spec(driver) is None:
+        raise ValueError(f"The asyncio driver of '{backend}' databases is not installed: pip install {driver}")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+def create_async_session_factory(app) -> async_sessionmaker:
+    """
+    Async sessions on the database of the app, with the same engine options
+    and SQLite pragmas as the sync engine. Must run in an app context: the
+    URL is taken from the sync engine, where Flask-SQLAlchemy has resolved
+    relative SQLite paths. An in-memory SQLite database is not shared.
+    """
+    engine: AsyncEngine = create_async_engine(
+        async_database_url(db.engine.url),
+        **app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {})
+    )
+    apply_sqlite_pragmas(engine.sync_engine, app.config.get('SQLITE_PRAGMAS'))
+    # Rows are serialized after the session closes
+    return async_sessionmaker(engine, expire_on_commit=False)
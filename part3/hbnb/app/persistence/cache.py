@@ -0,0 +1,304 @@
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.extensions import db
+from app.persistence.repository import Repository
+
+
+class CacheBackend(ABC):
+    """Key/value store for serialized entities, counting hits and misses."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Dict]:
+        value = self._get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses}
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[Dict]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Dict) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class InMemoryCache(CacheBackend):
+    """Bounded LRU with a time-to-live, local to the worker process."""
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 60.0):
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(value)
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, dict(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        data = super().stats()
+        data.update({'evictions': self.evictions, 'size': len(self._entries)})
+        return data
+
+
+class RedisCache(CacheBackend):
+    """
+    Backend for any Redis-compatible client exposing get, setex and delete
+    (redis-py, fakeredis, a local KeyDB/Valkey...). Entries are stored as JSON.
+    """
+
+    def __init__(self, client: Any, ttl: float = 60.0, prefix: str = 'hbnb:'):
+        super().__init__()
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs):
+        import redis  # optional dependency, only needed for this backend
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def _get(self, key):
+        raw = self.client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key, value):
+        self.client.setex(self.prefix + key, max(1, int(self.ttl)), json.dumps(value))
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.prefix + '*'))
+        if keys:
+            self.client.delete(*keys)
+
+
+def build_cache(config) -> Optional[CacheBackend]:
+    """Create the cache backend selected by ENTITY_CACHE ('memory', 'redis' or None)."""
+    backend = config.get('ENTITY_CACHE')
+    ttl = config.get('ENTITY_CACHE_TTL', 60)
+    if backend == 'memory':
+        return InMemoryCache(max_entries=config.get('ENTITY_CACHE_MAX_ENTRIES', 10000), ttl=ttl)
+    if backend == 'redis':
+        return RedisCache.from_url(config.get('ENTITY_CACHE_REDIS_URL', 'redis://localhost:6379/0'), ttl=ttl)
+    return None
+
+
+PENDING_INVALIDATIONS = 'cache_invalidations'
+
+
+def schedule_invalidation(session, *keys) -> None:
+    """Drop keys from the cache once the current transaction commits."""
+    session.info.setdefault(PENDING_INVALIDATIONS, set()).update(keys)
+
+
+# (cache, keys_for) evicted by the session listeners, see invalidate_on_commit
+_invalidation = None
+
+
+def invalidate_on_commit(cache: CacheBackend, keys_for) -> None:
+    """
+    Evict the cache entries of every entity modified or deleted through the ORM,
+    including cascades and BaseModel.update(), after the transaction commits.
+    keys_for(obj) returns the cache keys depending on an entity.
+    The session listeners are registered once per process: a later call
+    (another facade) only replaces the cache they evict from.
+    """
+    global _invalidation
+    _invalidation = (cache, keys_for)
+    for name, listener in (('after_flush', _after_flush), ('after_commit', _after_commit),
+                           ('after_rollback', _after_rollback)):
+        if not event.contains(db.session, name, listener):
+            event.listen(db.session, name, listener)
+
+
+def _after_flush(session, flush_context) -> None:
+    keys_for = _invalidation[1]
+    for obj in list(session.dirty) + list(session.deleted):
+        schedule_invalidation(session, *keys_for(obj))
+
+
+def _after_commit(session) -> None:
+    cache = _invalidation[0]
+    for key in session.info.pop(PENDING_INVALIDATIONS, ()):
+        cache.delete(key)
+
+
+def _after_rollback(session) -> None:
+    session.info.pop(PENDING_INVALIDATIONS, None)
+
+
+def entity_key(model, obj_id) -> str:
+    return f"{model.__tablename__}:{obj_id}"
+
+
+class CachedRepository(Repository):
+    """
+    Read-through cache in front of a SQLAlchemyRepository.
+    get() stores a column snapshot of the entity and rebuilds it from the cache
+    on the next call, merged into the session without querying the database.
+    Writes through add/update/delete invalidate the cached snapshot.
+    Columns in excluded (credentials) are left out of the snapshot: a rebuilt
+    entity loads them from the database on first access.
+    """
+
+    def __init__(self, repository, cache: CacheBackend, excluded=()):
+        self.repository = repository
+        self.model = repository.model
+        self.cache = cache
+        self._columns = [column.key for column in inspect(self.model).column_attrs
+                         if column.key not in excluded]
+        self._datetime_columns = {
+            column.key for column in inspect(self.model).column_attrs
+            if isinstance(column.expression.type, db.DateTime)
+        }
+
+    def __getattr__(self, name):
+        # Repository specific helpers (get_user_by_email, ...) are not cached
+        return getattr(self.repository, name)
+
+    def _key(self, obj_id) -> str:
+        return entity_key(self.model, obj_id)
+
+    def _snapshot(self, obj) -> Dict:
+        data = {}
+        for key in self._columns:
+            value = getattr(obj, key)
+            data[key] = value.isoformat() if isinstance(value, datetime) else value
+        return data
+
+    def _restore(self, data: Dict):
+        obj = self.model()
+        for key in self._columns:
+            value = data.get(key)
+            if value is not None and key in self._datetime_columns:
+                value = datetime.fromisoformat(value)
+            set_committed_value(obj, key, value)
+        make_transient_to_detached(obj)
+        # load=False attaches the instance to the session without a SELECT
+        return db.session.merge(obj, load=False)
+
+    def invalidate(self, obj_id) -> None:
+        # Evicted on commit, so no reader refills the cache with the old row meanwhile
+        schedule_invalidation(db.session, self._key(obj_id))
+
+    def add(self, obj):
+        self.repository.add(obj)
+        self.invalidate(obj.id)
+
+    def get(self, obj_id):
+        if obj_id is None:
+            return None
+        # An instance already in the session is fresher than any cached copy
+        loaded = db.session.identity_map.get(db.session.identity_key(self.model, obj_id))
+        if loaded is not None:
+            return loaded
+        data = self.cache.get(self._key(obj_id))
+        if data is not None:
+            return self._restore(data)
+        obj = self.repository.get(obj_id)
+        if obj is not None:
+            self.cache.set(self._key(obj_id), self._snapshot(obj))
+        return obj
+
+    def get_many(self, obj_ids):
+        """Like get() for many ids: the misses are fetched together with one IN query per chunk."""
+        found, missing = {}, []
+        for obj_id in dict.fromkeys(obj_ids):
+            if obj_id is None:
+                continue
+            loaded = db.session.identity_map.get(db.session.identity_key(self.model, obj_id))
+            if loaded is not None:
+                found[obj_id] = loaded
+                continue
+            data = self.cache.get(self._key(obj_id))
+            if data is not None:
+                found[obj_id] = self._restore(data)
+            else:
+                missing.append(obj_id)
+        if missing:
+            fetched = self.repository.get_many(missing)
+            for obj_id, obj in fetched.items():
+                self.cache.set(self._key(obj_id), self._snapshot(obj))
+            found.update(fetched)
+        return found
+
+    def exists_many(self, obj_ids):
+        return self.repository.exists_many(obj_ids)
+
+    def get_many_by_attribute(self, attr_name, attr_values):
+        return self.repository.get_many_by_attribute(attr_name, attr_values)
+
+    def get_all(self):
+        return self.repository.get_all()
+
+    def update(self, obj_id, data, returning=None, expected_version=None):
+        row = self.repository.update(obj_id, data, returning, expected_version)
+        self.invalidate(obj_id)
+        return row
+
+    def delete(self, obj_or_id):
+        obj_id = obj_or_id if isinstance(obj_or_id, str) else getattr(obj_or_id, 'id', None)
+        deleted = self.repository.delete(obj_or_id)
+        self.invalidate(obj_id)
+        return deleted
+
+    def get_by_attribute(self, attr_name, attr_value):
+        return self.repository.get_by_attribute(attr_name, attr_value)
+
+    def unique(self, attr_name, value):
+        return self.repository.unique(attr_name, value)
@@ -0,0 +1,38 @@
+from sqlalchemy import event
+
+from app.extensions import db
+
+
+def configure_engine(app) -> None:
+    """Apply the configured SQLITE_PRAGMAS to every new connection of the app's engine."""
+    apply_sqlite_pragmas(db.engine, app.config.get('SQLITE_PRAGMAS'))
+
+
+def apply_sqlite_pragmas(engine, pragmas) -> None:
+    """Run pragmas on every new connection of a (sync) SQLite engine."""
+    if not pragmas or engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+
+def begin_for_savepoint(session) -> None:
+    """
+    Make sure the session's transaction has really begun before a SAVEPOINT.
+    pysqlite defers BEGIN until the first INSERT/UPDATE/DELETE, so a SAVEPOINT
+    opened before it starts a transaction of its own that its RELEASE commits,
+    escaping the enclosing unit of work.
+    """
+    connection = session.connection()
+    if connection.dialect.name != 'sqlite':
+        return
+    if not connection.connection.dbapi_connection.in_transaction:
+        connection.exec_driver_sql("BEGIN")
@@ -1,13 +1,28 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
 from app.extensions import db
+from app.persistence.engine import begin_for_savepoint
+from app.persistence.soft_delete import INCLUDE_DELETED
 from app.models.user import User
 from app.models.place import Place
 from app.models.amenity import Amenity
 from app.models.review import Review
-from typing import Any
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+# Values per IN (...) list, below SQLite's historical 999 bound parameters limit
+IN_CHUNK_SIZE = 500
 
 __all__ = ["User", "Place", "Amenity", "Review"]
 
+
+class DuplicateValueError(ValueError):
+    """Raised when a write would give a unique attribute a value another row already holds."""
+
+    def __init__(self, model, attr_name: str, value):
+        super().__init__(f"{model.__name__} with {attr_name} '{value}' already exists.")
+
 class Repository(ABC):
     @abstractmethod
     def add(self, obj):
@@ -22,7 +37,11 @@ class Repository(ABC):
         pass
 
     @abstractmethod
-    def update(self, obj_id, data):
+    def update(self, obj_id, data, returning=None, expected_version=None):
+        """
+        Set the scalar attributes in data, returns the updated row (None if obj_id is unknown).
+        With expected_version, raises StaleDataError unless the row is still at that version.
+        """
         pass
 
     @abstractmethod
@@ -33,6 +52,31 @@ class Repository(ABC):
     def get_by_attribute(self, attr_name, attr_value):
         pass
 
+    @abstractmethod
+    def get_many(self, obj_ids) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def exists_many(self, obj_ids) -> Set[str]:
+        pass
+
+    @abstractmethod
+    def get_many_by_attribute(self, attr_name, attr_values) -> Dict[Any, Any]:
+        pass
+
+    @abstractmethod
+    def unique(self, attr_name, value):
+        """Context manager around writes that must keep attr_name unique (raises DuplicateValueError)."""
+        pass
+
+
+def chunked(values: Iterable, size: Optional[int] = None) -> Iterator[List]:
+    """Distinct non-null values in lists of at most size (IN_CHUNK_SIZE) items."""
+    size = size or IN_CHUNK_SIZE
+    unique = list(dict.fromkeys(value for value in values if value is not None))
+    for start in range(0, len(unique), size):
+        yield unique[start:start + size]
+
 
 class InMemoryRepository(Repository):
     def __init__(self):
@@ -47,10 +91,13 @@ class InMemoryRepository(Repository):
     def get_all(self):
         return list(self._storage.values())
 
-    def update(self, obj_id, data):
+    def update(self, obj_id, data, returning=None, expected_version=None):
         obj = self.get(obj_id)
         if obj:
+            if expected_version is not None and obj.version != expected_version:
+                raise StaleDataError(f"{type(obj).__name__} {obj_id} is no longer at version {expected_version}")
             obj.update(data)
+        return obj
 
     def delete(self, obj_id):
         if obj_id in self._storage:
@@ -58,15 +105,36 @@ class InMemoryRepository(Repository):
 
     def get_by_attribute(self, attr_name, attr_value):
         return next((obj for obj in self._storage.values() if getattr(obj, attr_name) == attr_value), None)
+
+    def get_many(self, obj_ids):
+        return {obj_id: self._storage[obj_id] for obj_id in obj_ids if obj_id in self._storage}
+
+    def exists_many(self, obj_ids):
+        return set(obj_ids) & set(self._storage)
+
+    def get_many_by_attribute(self, attr_name, attr_values):
+        wanted = set(attr_values)
+        return {getattr(obj, attr_name): obj for obj in self._storage.values()
+                if getattr(obj, attr_name) in wanted}
+
+    @contextmanager
+    def unique(self, attr_name, value):
+        # No index to lean on: check first
+        existing = self.get_by_attribute(attr_name, value)
+        if existing is not None:
+            raise DuplicateValueError(type(existing), attr_name, value)
+        yield
     
 
 class SQLAlchemyRepository(Repository):
     def __init__(self, model):
         self.model = model
 
+    # Writes are staged and flushed (ids, defaults) but not committed:
+    # the enclosing unit of work commits them (see unit_of_work.py)
     def add(self, obj):
         db.session.add(obj)
-        db.session.commit()
+        db.session.flush()
 
     def get(self, obj_id):
         return self.model.query.get(obj_id)
@@ -74,12 +142,42 @@ class SQLAlchemyRepository(Repository):
     def get_all(self):
         return self.model.query.all()
 
-    def update(self, obj_id, data):
-        obj = self.get(obj_id)
-        if obj:
-            for key, value in data.items():
-                setattr(obj, key, value)
-            db.session.commit()
+    def update(self, obj_id, data, returning=None, expected_version=None):
+        """
+        One UPDATE ... WHERE id = ? RETURNING statement, without loading the entity.
+        Keys of data that are not columns of the model are ignored; returning
+        lists the columns of the returned row (default: all of them).
+        An instance of the row already in the session is updated in place
+        (updated_at and version included), so callers holding it can render it as is.
+        The version is bumped like the ORM does for version_id_col; with
+        expected_version the UPDATE only matches the row at that version
+        (no row lock), and StaleDataError is raised when it does not.
+        Soft-deleted rows are not matched: a bulk UPDATE bypasses the filter
+        of app.persistence.soft_delete, so the condition spells it out.
+        """
+        mapper = db.inspect(self.model)
+        values = {key: value for key, value in data.items()
+                  if key in mapper.column_attrs and key != 'version'}
+        columns = returning or [attr.class_attribute for attr in mapper.column_attrs]
+        by_id = db.and_(self.model.id == obj_id, self.model.deleted_at.is_(None))
+        condition = by_id
+        if expected_version is not None:
+            condition = db.and_(by_id, self.model.version == expected_version)
+        if not values:
+            row = db.session.execute(db.select(*columns).where(condition)).first()
+        else:
+            values['version'] = self.model.version + 1
+            statement = db.update(self.model).where(condition).values(**values)
+            if db.session.get_bind().dialect.update_returning:
+                row = db.session.execute(statement.returning(*columns)).first()
+            elif db.session.execute(statement).rowcount == 0:
+                row = None
+            else:
+                # No RETURNING (MySQL): read the row back in the same transaction
+                row = db.session.execute(db.select(*columns).where(by_id)).first()
+        if row is None and expected_version is not None:
+            raise StaleDataError(f"{self.model.__name__} {obj_id} is no longer at version {expected_version}")
+        return row
 
     def delete(self, obj_or_id: Any) -> bool:
         """
@@ -97,15 +195,54 @@ class SQLAlchemyRepository(Repository):
             obj_to_delete = obj_or_id
         
         if obj_to_delete:
-            try:
-                db.session.delete(obj_to_delete)
-                db.session.commit()
-                return True
-            except Exception as e:
-                db.session.rollback()
-                print(f"Error during deletion: {e}")
-                return False
+            db.session.delete(obj_to_delete)
+            # The versioned DELETE (see BaseModel.version) fails here, not at commit
+            db.session.flush()
+            return True
         return False
 
     def get_by_attribute(self, attr_name, attr_value):
-        return self.model.query.filter(getattr(self.model, attr_name) == attr_value).first()
\ No newline at end of file
+        return self.model.query.filter(getattr(self.model, attr_name) == attr_value).first()
+
+    @contextmanager
+    def unique(self, attr_name, value):
+        """
+        Run the writes of the block in a SAVEPOINT and let the unique index of
+        attr_name reject a duplicate, instead of looking value up beforehand:
+        one statement, and no race between the check and the insert.
+        A conflict rolls back the savepoint only (the enclosing unit of work
+        stays usable) and raises DuplicateValueError.
+        """
+        begin_for_savepoint(db.session)
+        try:
+            with db.session.begin_nested():
+                yield
+                db.session.flush()
+        except IntegrityError:
+            # Another constraint (NOT NULL, foreign key...) is not a duplicate
+            column = getattr(self.model, attr_name)
+            # Soft-deleted rows keep their unique values until purged
+            exists = db.select(db.exists().where(column == value)).execution_options(**{INCLUDE_DELETED: True})
+            if value is None or not db.session.scalar(exists):
+                raise
+            raise DuplicateValueError(self.model, attr_name, value) from None
+
+    def get_many(self, obj_ids) -> Dict[str, Any]:
+        """Entities keyed by id, one IN query per IN_CHUNK_SIZE ids. Unknown ids are left out."""
+        return self.get_many_by_attribute('id', obj_ids)
+
+    def exists_many(self, obj_ids) -> Set[str]:
+        """The subset of obj_ids that exist, without loading the rows."""
+        existing = set()
+        for chunk in chunked(obj_ids):
+            existing.update(db.session.scalars(db.select(self.model.id).where(self.model.id.in_(chunk))))
+        return existing
+
+    def get_many_by_attribute(self, attr_name, attr_values) -> Dict[Any, Any]:
+        """Entities keyed by a unique attribute (email, name...), one IN query per chunk."""
+        column = getattr(self.model, attr_name)
+        found = {}
+        for chunk in chunked(attr_values):
+            for obj in db.session.scalars(db.select(self.model).where(column.in_(chunk))):
+                found[getattr(obj, attr_name)] = obj
+        return found
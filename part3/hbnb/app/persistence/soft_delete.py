@@ -0,0 +1,33 @@
+"""
+Soft deletes: deleting a user or a place only sets deleted_at on its rows
+(a few bulk UPDATEs, nothing loaded), and every ORM query stops seeing them
+at once. app.services.purge removes them later in chunked DELETEs.
+"""
+from sqlalchemy import event
+from sqlalchemy.orm import Session, with_loader_criteria
+
+from app.models.basemodel import BaseModel
+
+# Execution option of the queries that must see soft-deleted rows (purge, unique checks)
+INCLUDE_DELETED = 'include_deleted'
+
+
+def hide_deleted_rows() -> None:
+    """Filter out soft-deleted rows from every ORM SELECT, sync and async sessions alike."""
+    if not event.contains(Session, 'do_orm_execute', _hide_deleted):
+        event.listen(Session, 'do_orm_execute', _hide_deleted)
+
+
+def _hide_deleted(execute_state) -> None:
+    # Relationship loads too, for objects rebuilt from the cache that carry no loader criteria
+    if not execute_state.is_select or execute_state.execution_options.get(INCLUDE_DELETED, False):
+        return
+    statement = execute_state.statement
+    if execute_state.is_column_load:
+        # Refreshes of expired instances skip loader criteria: filter them by hand,
+        # so a soft-deleted row is not brought back but raises ObjectDeletedError
+        for mapper in execute_state.all_mappers:
+            if issubclass(mapper.class_, BaseModel):
+                statement = statement.where(mapper.class_.deleted_at.is_(None))
+    execute_state.statement = statement.options(with_loader_criteria(
+        BaseModel, lambda cls: cls.deleted_at.is_(None), include_aliases=True))
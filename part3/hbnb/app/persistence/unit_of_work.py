@@ -0,0 +1,73 @@
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import request
+
+from app.extensions import db
+
+UNIT_OF_WORK_DEPTH = 'unit_of_work_depth'
+# Requests that may change data; reads never commit
+WRITE_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
+
+
+@contextmanager
+def unit_of_work():
+    """
+    Group the changes staged inside the block into one transaction.
+    Blocks nest: only the outermost one commits (or rolls back on error),
+    so a facade call inside a request or a facade.transaction() block
+    joins the enclosing transaction instead of committing on its own.
+    """
+    session = db.session
+    depth = session.info.get(UNIT_OF_WORK_DEPTH, 0)
+    session.info[UNIT_OF_WORK_DEPTH] = depth + 1
+    try:
+        yield session
+        if depth == 0:
+            session.commit()
+    except Exception:
+        if depth == 0:
+            session.rollback()
+        raise
+    finally:
+        session.info[UNIT_OF_WORK_DEPTH] = depth
+
+
+def transactional(method):
+    """Run a facade method in a unit of work (one commit when called on its own)."""
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        with unit_of_work():
+            return method(*args, **kwargs)
+    return wrapper
+
+
+def register_unit_of_work(app) -> None:
+    """Open a unit of work per write request, committed once the response is ready."""
+    @app.before_request
+    def begin_unit_of_work():
+        if request.method in WRITE_METHODS:
+            db.session.info[UNIT_OF_WORK_DEPTH] = db.session.info.get(UNIT_OF_WORK_DEPTH, 0) + 1
+
+    @app.after_request
+    def commit_unit_of_work(response):
+        if request.method in WRITE_METHODS and db.session.info.get(UNIT_OF_WORK_DEPTH):
+            db.session.info[UNIT_OF_WORK_DEPTH] -= 1
+            if db.session.info[UNIT_OF_WORK_DEPTH] == 0:
+                if response.status_code < 400:
+                    try:
+                        db.session.commit()
+                    except Exception:
+                        db.session.rollback()
+                        raise
+                else:
+                    db.session.rollback()
+        return response
+
+    @app.teardown_request
+    def close_unit_of_work(exception):
+        # after_request does not run when the response itself failed
+        if request.method in WRITE_METHODS and db.session.info.get(UNIT_OF_WORK_DEPTH):
+            db.session.info[UNIT_OF_WORK_DEPTH] -= 1
+            if db.session.info[UNIT_OF_WORK_DEPTH] == 0:
+                db.session.rollback()
@@ -1,78 +1,131 @@
+-- Reference DDL (SQLite) of the schema built by app/migrations.
+-- The database is normally created with: flask --app run db-upgrade
+-- Keep this file in sync with new migrations (checked by app/test/test_migrations.py).
 PRAGMA foreign_keys = ON;
 
 -- Table users
 CREATE TABLE IF NOT EXISTS users (
-    id CHAR(36) PRIMARY KEY NOT NULL,
-    first_name VARCHAR(255) NOT NULL,
-    last_name VARCHAR(255) NOT NULL,
-    email VARCHAR(255) UNIQUE NOT NULL,
-    password VARCHAR(255) NOT NULL,
-    is_admin BOOLEAN DEFAULT FALSE,
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    first_name VARCHAR(50) NOT NULL,
+    last_name VARCHAR(50) NOT NULL,
+    email VARCHAR(120) NOT NULL,
+    password_hash VARCHAR(255) NOT NULL,
+    is_admin BOOLEAN NOT NULL,
+    id VARCHAR(36) NOT NULL,
+    created_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL,
+    version INTEGER DEFAULT '1' NOT NULL,
+    deleted_at DATETIME,
+    PRIMARY KEY (id)
 );
+CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users (email);
+
+-- Table amenities
+CREATE TABLE IF NOT EXISTS amenities (
+    name VARCHAR(128) NOT NULL,
+    id VARCHAR(36) NOT NULL,
+    created_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL,
+    version INTEGER DEFAULT '1' NOT NULL,
+    deleted_at DATETIME,
+    PRIMARY KEY (id)
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_amenities_name ON amenities (name);
 
 -- Table places
 CREATE TABLE IF NOT EXISTS places (
-    id CHAR(36) PRIMARY KEY NOT NULL,
-    title VARCHAR(255) NOT NULL,
+    title VARCHAR(100) NOT NULL,
     description TEXT,
-    price DECIMAL(10, 2) NOT NULL CHECK(price >= 0),
+    price FLOAT NOT NULL,
     latitude FLOAT NOT NULL,
     longitude FLOAT NOT NULL,
-    owner_id CHAR(36) NOT NULL,
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (owner_id) REFERENCES users(id) ON DELETE CASCADE
+    geo_cell INTEGER,
+    review_count INTEGER NOT NULL,
+    rating_sum INTEGER NOT NULL,
+    avg_rating FLOAT,
+    owner_id VARCHAR(36) NOT NULL,
+    id VARCHAR(36) NOT NULL,
+    created_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL,
+    version INTEGER DEFAULT '1' NOT NULL,
+    deleted_at DATETIME,
+    PRIMARY KEY (id),
+    FOREIGN KEY (owner_id) REFERENCES users (id)
+);
+CREATE INDEX IF NOT EXISTS ix_places_price ON places (price);
+CREATE INDEX IF NOT EXISTS ix_places_geo_cell ON places (geo_cell);
+CREATE INDEX IF NOT EXISTS ix_places_avg_rating ON places (avg_rating);
+CREATE INDEX IF NOT EXISTS ix_places_created_at_id ON places (created_at, id);
+
+-- Table place_amenity (many-to-many)
+CREATE TABLE IF NOT EXISTS place_amenity (
+    place_id VARCHAR(36) NOT NULL,
+    amenity_id VARCHAR(36) NOT NULL,
+    PRIMARY KEY (place_id, amenity_id),
+    FOREIGN KEY (place_id) REFERENCES places (id),
+    FOREIGN KEY (amenity_id) REFERENCES amenities (id)
 );
 
 -- Table reviews
 CREATE TABLE IF NOT EXISTS reviews (
-    id CHAR(36) PRIMARY KEY NOT NULL,
     text TEXT NOT NULL,
-    rating INT CHECK (rating BETWEEN 1 AND 5),
-    user_id CHAR(36) NOT NULL,
-    place_id CHAR(36) NOT NULL,
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (user_id)  REFERENCES users(id)   ON DELETE CASCADE,
-    FOREIGN KEY (place_id) REFERENCES places(id)  ON DELETE CASCADE,
-    CONSTRAINT unique_review UNIQUE (user_id, place_id)
+    rating INTEGER NOT NULL,
+    place_id VARCHAR(36) NOT NULL,
+    user_id VARCHAR(36) NOT NULL,
+    id VARCHAR(36) NOT NULL,
+    created_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL,
+    version INTEGER DEFAULT '1' NOT NULL,
+    deleted_at DATETIME,
+    PRIMARY KEY (id),
+    CONSTRAINT unique_user_place_review UNIQUE (user_id, place_id),
+    FOREIGN KEY (place_id) REFERENCES places (id),
+    FOREIGN KEY (user_id) REFERENCES users (id)
 );
 
--- Table amenities
-CREATE TABLE IF NOT EXISTS amenities (
-    id CHAR(36) PRIMARY KEY NOT NULL,
-    name VARCHAR(255) UNIQUE NOT NULL,
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-);
+-- Indexes for the hot query shapes (see app/migrations/0001_hot_query_indexes.py)
+CREATE INDEX IF NOT EXISTS ix_reviews_place_id_created_at ON reviews (place_id, created_at);
+CREATE INDEX IF NOT EXISTS ix_places_owner_id ON places (owner_id);
+CREATE INDEX IF NOT EXISTS ix_place_amenity_amenity_id_place_id ON place_amenity (amenity_id, place_id);
 
--- Table place_amenity (many-to-many)
-CREATE TABLE IF NOT EXISTS place_amenity (
-    place_id CHAR(36)   NOT NULL,
-    amenity_id CHAR(36) NOT NULL,
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    PRIMARY KEY (place_id, amenity_id),
-    FOREIGN KEY (place_id)   REFERENCES places(id)   ON DELETE CASCADE,
-    FOREIGN KEY (amenity_id) REFERENCES amenities(id) ON DELETE CASCADE
+-- Soft-deleted rows, walked by the purge (see app/migrations/0004_soft_delete_indexes.py)
+CREATE INDEX IF NOT EXISTS ix_users_deleted_at ON users (deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS ix_places_deleted_at ON places (deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS ix_reviews_deleted_at ON reviews (deleted_at) WHERE deleted_at IS NOT NULL;
+
+-- Background job queue (see app/jobs)
+CREATE TABLE IF NOT EXISTS jobs (
+    id VARCHAR(36) NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    payload JSON NOT NULL,
+    dedupe_key VARCHAR(64) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    attempts INTEGER NOT NULL,
+    max_attempts INTEGER NOT NULL,
+    run_after DATETIME NOT NULL,
+    locked_at DATETIME,
+    last_error TEXT,
+    created_at DATETIME NOT NULL,
+    PRIMARY KEY (id)
 );
+CREATE INDEX IF NOT EXISTS ix_jobs_status_run_after ON jobs (status, run_after);
+CREATE INDEX IF NOT EXISTS ix_jobs_dedupe_key ON jobs (dedupe_key);
 
 -- Insert admin user (ignore si déjà présent)
 INSERT OR IGNORE INTO users (
-    id, email, first_name, last_name, password, is_admin
+    id, email, first_name, last_name, password_hash, is_admin, created_at, updated_at
 ) VALUES (
     '36c9050e-ddd3-4c3b-9731-9f487208bbc1',
     'admin@hbnb.io',
     'Admin',
     'HBnB',
     '$2b$12$txryxzSae2ihpMFhwrpTBu2sF4P0WaDxJ9eY3bbArntgk5nExtn3q',
-    TRUE
+    TRUE,
+    CURRENT_TIMESTAMP,
+    CURRENT_TIMESTAMP
 );
 
 -- Insert initial amenities (ignore si déjà présents)
-INSERT OR IGNORE INTO amenities (id, name) VALUES
-    ('26de0779-5dfb-4f77-916d-ed6728e88edd', 'WiFi'),
-    ('3493beb7-a2aa-4dd2-95e2-be9b1cca3b06', 'Swimming Pool'),
-    ('3b23dec0-54f2-4a9f-bfb0-49a215961d72', 'Air Conditioning');
+INSERT OR IGNORE INTO amenities (id, name, created_at, updated_at) VALUES
+    ('26de0779-5dfb-4f77-916d-ed6728e88edd', 'WiFi', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
+    ('3493beb7-a2aa-4dd2-95e2-be9b1cca3b06', 'Swimming Pool', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
+    ('3b23dec0-54f2-4a9f-bfb0-49a215961d72', 'Air Conditioning', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
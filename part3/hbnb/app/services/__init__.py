@@ -1,3 +1,4 @@
+# The application's facade is built once by create_app (see app.get_facade)
 from app.services.facade import HBnBFacade
 
-facade = HBnBFacade()
\ No newline at end of file
+__all__ = ['HBnBFacade']
@@ -0,0 +1,78 @@
+import json
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+from app.extensions import db
+from app.models import User, Amenity, Place, Review
+from app.models.place import place_amenity
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Exported tables and the columns kept out of exports
+EXPORT_MODELS = {
+    'places': (Place, set()),
+    'reviews': (Review, set()),
+    'users': (User, {'password_hash'}),
+    'amenities': (Amenity, set()),
+}
+EXPORT_KINDS = tuple(EXPORT_MODELS)
+# Soft-deleted rows are not exported, so neither is their flag
+SOFT_DELETE_COLUMNS = {'deleted_at'}
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def to_ndjson(row: Dict) -> str:
+    return json.dumps(row, default=_json_default) + '\n'
+
+
+def iter_export(kind: str, since: Optional[datetime] = None,
+                batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Dict]:
+    """
+    Yield the rows of a table as dicts, ordered by (updated_at, id).
+    Rows are fetched batch_size at a time from a streaming cursor (yield_per),
+    so memory stays flat whatever the table size. since keeps rows updated
+    at or after that time, for incremental exports.
+    """
+    if kind not in EXPORT_MODELS:
+        raise ValueError(f"Unknown export kind '{kind}', expected one of {EXPORT_KINDS}.")
+    model, hidden = EXPORT_MODELS[kind]
+    columns = [column for column in model.__table__.columns
+               if column.key not in hidden and column.key not in SOFT_DELETE_COLUMNS]
+
+    # Streamed on a plain connection: the session does not hide deleted rows here
+    query = db.select(*columns).where(model.deleted_at.is_(None)).order_by(model.updated_at, model.id)
+    if since is not None:
+        query = query.where(model.updated_at >= since)
+    # Validation above runs on call, rows are only read when iterated
+    return _stream(query, batch_size, with_amenities=model is Place)
+
+
+def _stream(query, batch_size: int, with_amenities: bool) -> Iterator[Dict]:
+    # A dedicated connection holds the streaming cursor, batch lookups use the session
+    with db.engine.connect() as connection:
+        result = connection.execution_options(yield_per=batch_size).execute(query)
+        for partition in result.partitions():
+            rows = [dict(row._mapping) for row in partition]
+            if with_amenities:
+                _attach_amenity_names(rows)
+            yield from rows
+
+
+def _attach_amenity_names(rows) -> None:
+    """Add amenity names to a batch of places (one query per batch), as the importer expects them."""
+    names = {row['id']: [] for row in rows}
+    links = db.session.execute(
+        db.select(place_amenity.c.place_id, Amenity.name)
+        .join(Amenity, Amenity.id == place_amenity.c.amenity_id)
+        .where(place_amenity.c.place_id.in_(names))
+        .order_by(Amenity.name)
+    )
+    for place_id, name in links:
+        names[place_id].append(name)
+    for row in rows:
+        row['amenities'] = names[row['id']]
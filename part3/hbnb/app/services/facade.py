@@ -1,30 +1,203 @@
-from typing import Optional, Dict, List
+import heapq
+from datetime import datetime
+from typing import Optional, Dict, List, Tuple
 from app.models import User, Amenity, Place, Review
+from app.models.place import place_amenity
 from app.extensions import db
+from app.services.importer import BulkImporter, DEFAULT_CHUNK_SIZE
+from app.services.exporter import iter_export
+from app.services.passwords import PasswordVerifier, DEFAULT_LOG_ROUNDS
+from app.services.pagination import clamp_limit, encode_cursor, decode_cursor
+from app.services.purge import DEFAULT_PURGE_BATCH_SIZE, purge_deleted
+from app.jobs import BackgroundWorker, PURGE_DELETED, enqueue, run_on_commit
+from app.services.geo import (
+    GEO_INDEX_BATCH_SIZE, MAX_RADIUS_KM, validate_coordinates, geo_cell, haversine_km,
+    bounding_box, cell_ranges_for_box, longitude_ranges
+)
 from app.persistence.UserRepository import UserRepository
 from app.persistence.PlaceRepository import PlaceRepository
 from app.persistence.ReviewRepository import ReviewRepository
 from app.persistence.AmenityRepository import AmenityRepository
+from app.persistence.cache import (
+    CacheBackend, CachedRepository, entity_key, invalidate_on_commit, schedule_invalidation
+)
+from app.persistence.unit_of_work import unit_of_work, transactional
+from app.persistence.repository import chunked
+from sqlalchemy import Row
 from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm.exc import StaleDataError
+
+# Relationships a caller may ask the facade to load with a place
+PLACE_LOADERS = {
+    'owner': lambda: joinedload(Place.owner),
+    'amenities': lambda: selectinload(Place.amenities),
+    'reviews': lambda: selectinload(Place.reviews),
+}
+
+# Load profiles: what each kind of endpoint renders
+PLACE_DETAIL = ('owner', 'amenities')
+PLACE_ONLY = ()
+
+
+def place_load_options(projection):
+    """Translate a projection (relationship names) into loader options."""
+    unknown = set(projection) - set(PLACE_LOADERS)
+    if unknown:
+        raise ValueError(f"Unknown place relationships: {unknown}")
+    return [PLACE_LOADERS[name]() for name in projection]
+
+
+def entity_version_query(model, entity_id: str):
+    """Select the (updated_at, version) of one entity."""
+    return db.select(model.updated_at, model.version).where(model.id == entity_id)
+
+
+def check_version(obj, expected_version: Optional[int]) -> None:
+    """Raise StaleDataError when a conditional write finds obj at another version than expected."""
+    if expected_version is not None and obj.version != expected_version:
+        raise StaleDataError(f"{type(obj).__name__} {obj.id} is no longer at version {expected_version}")
+
+
+def collection_version_query(model, **filters):
+    """Select (max(updated_at), row count) of a table, optionally filtered by columns."""
+    return db.select(db.func.max(model.updated_at), db.func.count(model.id)).filter_by(**filters)
+
+
+def place_reviews_version_query(place_id: str):
+    """
+    Select (max(updated_at), row count) of a place's reviews: no row at all
+    when the place does not exist, unlike an empty place's (None, 0).
+    """
+    return (db.select(db.func.max(Review.updated_at), db.func.count(Review.id))
+            .select_from(Place).outerjoin(Review, Review.place_id == Place.id)
+            .where(Place.id == place_id).group_by(Place.id))
+
+
+def related_value(column, condition):
+    """
+    column of the row matching condition, as a correlated scalar subquery: lets
+    an UPDATE ... RETURNING (which cannot join) return the author of a review
+    or the owner of a place along with the updated row.
+    """
+    return db.select(column).where(condition).scalar_subquery()
+
+
+def place_query(place_id: str, projection=PLACE_DETAIL):
+    """Select one place with the relationships named in projection."""
+    return db.select(Place).filter_by(id=place_id).options(*place_load_options(projection))
+
+
+def review_rows_query(columns, place_id: Optional[str] = None):
+    """
+    Select columns of reviews joined with their author and place, as plain
+    rows (no entity loaded); a place's reviews come oldest first.
+    """
+    query = db.select(*columns).select_from(Review).outerjoin(
+        User, User.id == Review.user_id
+    ).outerjoin(Place, Place.id == Review.place_id)
+    if place_id is not None:
+        query = query.where(Review.place_id == place_id).order_by(Review.created_at, Review.id)
+    return query
+
+
+def place_amenity_rows_query(columns, place_ids: List[str]):
+    """Select (place_id, *columns) of the amenities of the given places."""
+    return db.select(place_amenity.c.place_id, *columns).join(
+        Amenity, Amenity.id == place_amenity.c.amenity_id
+    ).where(place_amenity.c.place_id.in_(place_ids))
+
+
+def group_by_parent(rows) -> Dict[str, List]:
+    """Group (parent_id, *values) rows into {parent_id: [values, ...]}."""
+    grouped = {}
+    for row in rows:
+        grouped.setdefault(row[0], []).append(row[1:])
+    return grouped
+
+
+def split_page(rows: List, limit: int) -> Tuple[List, Optional[str]]:
+    """Cut the extra row fetched past limit and turn it into the next cursor."""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
+
 
 class HBnBFacade:
     
-    def __init__(self):
+    def __init__(self, cache: Optional[CacheBackend] = None,
+                 password_verifier: Optional[PasswordVerifier] = None,
+                 log_rounds: int = DEFAULT_LOG_ROUNDS,
+                 job_runner: Optional[BackgroundWorker] = None):
+        self.cache = cache
+        self.password_verifier = password_verifier
+        self.log_rounds = log_rounds
         self.user_repository = UserRepository()
         self.place_repository = PlaceRepository()
         self.review_repository = ReviewRepository()
         self.amenity_repository = AmenityRepository()
 
+        if cache is not None:
+            # Hot entities are read through the cache, reviews are not cached.
+            # Password hashes never leave the database (the cache may be Redis)
+            self.user_repository = CachedRepository(self.user_repository, cache, excluded={'password_hash'})
+            self.place_repository = CachedRepository(self.place_repository, cache)
+            self.amenity_repository = CachedRepository(self.amenity_repository, cache)
+            invalidate_on_commit(cache, self._cache_keys)
+        if job_runner is not None:
+            # Without it, queued jobs wait for `flask jobs-worker`
+            run_on_commit(job_runner)
+
+    def transaction(self):
+        """
+        Unit of work spanning several facade calls: everything staged in the
+        block is committed once at the end, or rolled back if it raises.
+        Write requests already run in one (see register_unit_of_work).
+        """
+        return unit_of_work()
+
+    @staticmethod
+    def place_details_key(place_id: str) -> str:
+        return f"{entity_key(Place, place_id)}:details"
+
+    def _cache_keys(self, obj) -> List[str]:
+        """Cache entries to evict when an entity changes."""
+        if isinstance(obj, Review):
+            # Place details embed the rating aggregates
+            return [self.place_details_key(obj.place_id)]
+        keys = [entity_key(type(obj), obj.id)]
+        if isinstance(obj, Place):
+            keys.append(self.place_details_key(obj.id))
+        return keys
+
+    def get_entity_version(self, model, entity_id: str) -> Optional[Tuple[datetime, int]]:
+        """(updated_at, version) of one entity, without loading it (None if it does not exist)."""
+        return db.session.execute(entity_version_query(model, entity_id)).one_or_none()
+
+    def get_collection_version(self, model, **filters) -> Tuple[Optional[datetime], int]:
+        """(max(updated_at), row count) of a table, optionally filtered by columns."""
+        return tuple(db.session.execute(collection_version_query(model, **filters)).one())
+
+    def get_place_reviews_version(self, place_id: str) -> Optional[Tuple[Optional[datetime], int]]:
+        """(max(updated_at), row count) of a place's reviews (None if the place does not exist)."""
+        row = db.session.execute(place_reviews_version_query(place_id)).one_or_none()
+        return tuple(row) if row is not None else None
+
+    def get_owner_id(self, model, entity_id: str) -> Optional[str]:
+        """Id of the user owning a place or having written a review, without loading it (None if unknown)."""
+        column = model.owner_id if model is Place else model.user_id
+        return db.session.scalar(db.select(column).where(model.id == entity_id))
+
+    @transactional
     def create_user(self, user_data: Dict) -> User:
         email = user_data.get('email')
         if not email:
             raise ValueError("Email is required.")
-        
-        if self.get_user_by_email(email):
-            raise ValueError(f"User with email '{email}' already exists.")
 
         new_user = User(**user_data)
-        self.user_repository.add(new_user)
+        # The unique index on users.email rejects duplicates: no lookup first
+        with self.user_repository.unique('email', email):
+            self.user_repository.add(new_user)
         return new_user
 
     def get_all_users(self) -> List[User]:
@@ -33,156 +206,453 @@ class HBnBFacade:
     def get_user(self, user_id: str) -> Optional[User]:
         return self.user_repository.get(user_id)
 
+    def user_exists(self, user_id: str) -> bool:
+        return db.session.scalar(db.select(User.id).where(User.id == user_id)) is not None
+
     def get_user_by_email(self, email: str) -> Optional[User]:
         return self.user_repository.get_by_attribute('email', email)
 
-    def update_user(self, user_id: str, profile_data: Dict) -> Optional[User]:
-        user = self.get_user(user_id)
-        if not user:
+    def authenticate(self, email: str, password: str) -> Optional[User]:
+        """
+        Return the user matching the credentials, or None.
+        The bcrypt check runs on the bounded verifier pool when configured
+        (raises PasswordVerifierBusy when saturated), and a hash made with an
+        outdated cost is upgraded transparently.
+        """
+        user = self.get_user_by_email(email)
+        if not user or not user.password_hash:
             return None
 
+        if self.password_verifier is not None:
+            valid = self.password_verifier.verify(user.password_hash, password)
+        else:
+            valid = user.verify_password(password)
+        if not valid:
+            return None
+
+        if user.password_needs_rehash(self.log_rounds):
+            with unit_of_work():
+                user.password = password
+        return user
+
+    # The update_* methods write scalar fields with one UPDATE ... RETURNING
+    # (see SQLAlchemyRepository.update) and return the row of columns
+    # (default: every column of the entity), None when the id is unknown.
+    # update_* and delete_* take the expected_version of a conditional
+    # request (If-Match) and raise StaleDataError when the entity moved on.
+    # Only the fields a client may set are kept: ids, timestamps, versions and the
+    # server-maintained columns (rating aggregates, geo_cell) are dropped.
+
+    @transactional
+    def update_user(self, user_id: str, profile_data: Dict, columns=None,
+                    expected_version: Optional[int] = None) -> Optional[Row]:
         allowed_fields = {'first_name', 'last_name'}
         data_to_update = {
             key: value for key, value in profile_data.items() if key in allowed_fields
         }
+        row = self.user_repository.update(user_id, data_to_update, columns, expected_version)
+        if row is not None:
+            self._touch_user_mentions(user_id, data_to_update)
+        return row
+
+    @transactional
+    def update_user_by_admin(self, user_id: str, admin_data: Dict, columns=None,
+                             expected_version: Optional[int] = None) -> Optional[Row]:
+        allowed_fields = {'first_name', 'last_name', 'email', 'password', 'is_admin'}
+        admin_data = {key: value for key, value in admin_data.items() if key in allowed_fields}
+        if 'password' in admin_data:
+            admin_data['password_hash'] = User.hash_password(admin_data.pop('password'))
 
-        if data_to_update:
-            user.update(data_to_update)
-
-        return user
-
-    def update_user_by_admin(self, user_id: str, admin_data: Dict) -> Optional[User]:
-        user = self.get_user(user_id)
-        if not user:
-            return None
-        
         new_email = admin_data.get('email')
-        if new_email and new_email != user.email:
-            if self.get_user_by_email(new_email):
-                raise ValueError(f"User with email '{new_email}' already exists.")
-        
-        user.update(admin_data)
-        return user
-
-    def delete_user(self, user_id: str) -> bool:
+        if new_email:
+            with self.user_repository.unique('email', new_email):
+                row = self.user_repository.update(user_id, admin_data, columns, expected_version)
+        else:
+            row = self.user_repository.update(user_id, admin_data, columns, expected_version)
+        if row is not None:
+            self._touch_user_mentions(user_id, admin_data)
+        return row
+
+    def _touch_user_mentions(self, user_id: str, changed: Dict) -> None:
+        """Places and reviews embed their owner's or author's name and email."""
+        if changed.keys() & {'first_name', 'last_name', 'email'}:
+            self._touch_rows(Place, Place.owner_id == user_id)
+            self._touch_rows(Review, Review.user_id == user_id)
+
+    @transactional
+    def delete_user(self, user_id: str, expected_version: Optional[int] = None) -> bool:
         user_to_delete = self.get_user(user_id)
         if not user_to_delete:
             return False
-        
-        self.user_repository.delete(user_to_delete)
+        check_version(user_to_delete, expected_version)
+
+        # The user's reviews on other hosts' places disappear with them
+        reviewed_places = db.session.execute(
+            db.select(Review.place_id, db.func.count(Review.id), db.func.sum(Review.rating))
+            .where(Review.user_id == user_id)
+            .group_by(Review.place_id)
+        ).all()
+        for place_id, count, rating_sum in reviewed_places:
+            self._apply_rating_delta(place_id, -count, -rating_sum)
+
+        # Soft delete: the user, their places and every review by them or on
+        # their places are flagged in bulk, nothing is loaded; the purge removes them
+        owned_places = db.select(Place.id).where(Place.owner_id == user_id)
+        place_ids = db.session.scalars(owned_places).all()
+        deleted_at = datetime.utcnow()
+        self._soft_delete(user_to_delete, deleted_at)
+        self._soft_delete_rows(Place, Place.owner_id == user_id, deleted_at)
+        self._soft_delete_rows(Review, db.or_(Review.user_id == user_id, Review.place_id.in_(owned_places)),
+                               deleted_at)
+        for place_id in place_ids:
+            schedule_invalidation(db.session, entity_key(Place, place_id), self.place_details_key(place_id))
         return True
 
+    @transactional
     def create_amenity(self, amenity_data: Dict) -> Amenity:
         name = amenity_data.get('name')
         if not name:
             raise ValueError("Amenity name is required.")
-        
-        if self.amenity_repository.get_by_attribute('name', name):
-            raise ValueError(f"Amenity with name '{name}' already exists.")
-        
+
         new_amenity = Amenity(**amenity_data)
-        self.amenity_repository.add(new_amenity)
+        # The unique index on amenities.name rejects duplicates: no lookup first
+        with self.amenity_repository.unique('name', name):
+            self.amenity_repository.add(new_amenity)
         return new_amenity
 
     def get_all_amenities(self) -> List[Amenity]:
         return self.amenity_repository.get_all()
 
+    def get_amenity_rows(self, columns) -> List:
+        """Columns of every amenity as plain rows (see app.api.v2.serializers)."""
+        return db.session.execute(db.select(*columns).select_from(Amenity)).all()
+
     def get_amenity(self, amenity_id: str) -> Optional[Amenity]:
         return self.amenity_repository.get(amenity_id)
 
-    def update_amenity(self, amenity_id: str, amenity_data: Dict) -> Optional[Amenity]:
-        amenity = self.get_amenity(amenity_id)
-        if not amenity:
-            return None
-        
+    @transactional
+    def update_amenity(self, amenity_id: str, amenity_data: Dict, columns=None,
+                       expected_version: Optional[int] = None) -> Optional[Row]:
+        allowed_fields = {'name'}
+        amenity_data = {key: value for key, value in amenity_data.items() if key in allowed_fields}
         new_name = amenity_data.get('name')
-        if new_name and new_name != amenity.name:
-            if self.amenity_repository.get_by_attribute('name', new_name):
-                raise ValueError(f"Amenity with name '{new_name}' already exists.")
-
-        amenity.update(amenity_data)
-        return amenity
-
-    def delete_amenity(self, amenity_id: str) -> bool:
+        if new_name:
+            with self.amenity_repository.unique('name', new_name):
+                row = self.amenity_repository.update(amenity_id, amenity_data, columns, expected_version)
+        else:
+            row = self.amenity_repository.update(amenity_id, amenity_data, columns, expected_version)
+        if row is not None and new_name:
+            # Places embed the names of their amenities
+            self._touch_rows(Place, Place.id.in_(self._places_with_amenity(amenity_id)))
+        return row
+
+    @staticmethod
+    def _places_with_amenity(amenity_id: str):
+        return db.select(place_amenity.c.place_id).where(place_amenity.c.amenity_id == amenity_id)
+
+    @transactional
+    def delete_amenity(self, amenity_id: str, expected_version: Optional[int] = None) -> bool:
         amenity = self.get_amenity(amenity_id)
         if not amenity:
             return False
+        check_version(amenity, expected_version)
+        self._touch_rows(Place, Place.id.in_(self._places_with_amenity(amenity_id)))
         self.amenity_repository.delete(amenity)
         return True
 
-    def create_place(self, place_data: Dict) -> Place:
+    @transactional
+    def create_place(self, place_data: Dict, known_user: bool = False) -> Place:
+        """known_user skips the owner lookup when the caller already checked it (authenticated requests)."""
         owner_id = place_data.get('owner_id')
         if not owner_id:
             raise ValueError("owner_id is required to create a place.")
         
-        if not self.get_user(owner_id):
+        if not known_user and not self.get_user(owner_id):
             raise ValueError(f"Owner with ID '{owner_id}' not found.")
 
         amenities_names = place_data.pop('amenities', [])
         
+        validate_coordinates(place_data.get('latitude'), place_data.get('longitude'))
         new_place = Place(**place_data) 
+        new_place.geo_cell = geo_cell(new_place.latitude, new_place.longitude)
         
         if amenities_names:
-            amenity_objects = db.session.scalars(
-                db.select(Amenity).filter(Amenity.name.in_(amenities_names))
-            ).all()
-            
-            if len(amenity_objects) != len(amenities_names):
-                found_names = {a.name for a in amenity_objects}
-                missing = set(amenities_names) - found_names
-                raise ValueError(f"Amenities not found: {missing}")
-            
-            new_place.amenities.extend(amenity_objects)
+            new_place.amenities.extend(self._amenities_by_name(amenities_names))
 
         self.place_repository.add(new_place)
         return new_place
 
-    def get_place(self, place_id: str) -> Optional[Place]:
-        query = db.select(Place).filter_by(id=place_id).options(
-            selectinload(Place.amenities),
-            selectinload(Place.reviews),
-            joinedload(Place.owner)
-        )
-        return db.session.execute(query).scalar_one_or_none()
-
-    def get_all_places(self) -> List[Place]:
-        query = db.select(Place).options(
-            selectinload(Place.amenities),
-            selectinload(Place.reviews),
-            joinedload(Place.owner)
-        )
-        return db.session.execute(query).unique().scalars().all()
+    def _amenities_by_name(self, names: List[str]) -> List[Amenity]:
+        """Resolve amenity names with one batch lookup, failing on unknown names."""
+        found = self.amenity_repository.get_many_by_attribute('name', names)
+        missing = set(names) - set(found)
+        if missing:
+            raise ValueError(f"Amenities not found: {missing}")
+        return list(found.values())
+
+    def get_place(self, place_id: str, projection=PLACE_DETAIL) -> Optional[Place]:
+        """Get a place, eagerly loading only the relationships named in projection."""
+        return db.session.execute(place_query(place_id, projection)).unique().scalar_one_or_none()
+
+    def get_place_details(self, place_id: str) -> Optional[Dict]:
+        """
+        Serialized place page (owner and amenities included), served from the
+        cache when possible. Evicted with the place, its reviews, and renames of its
+        owner or amenities (see _touch_rows).
+        """
+        key = self.place_details_key(place_id)
+        if self.cache is not None:
+            data = self.cache.get(key)
+            if data is not None:
+                return data
 
-    def update_place(self, place_id: str, place_data: Dict) -> Optional[Place]:
         place = self.get_place(place_id)
         if not place:
             return None
+        data = place.to_dict()
+        if self.cache is not None:
+            self.cache.set(key, data)
+        return data
 
+    def get_all_places(self, projection=PLACE_DETAIL) -> List[Place]:
+        query = db.select(Place).options(*place_load_options(projection))
+        return db.session.execute(query).unique().scalars().all()
+
+    def get_places_page(self, limit: Optional[int] = None, cursor: Optional[str] = None,
+                        filters: Optional[Dict] = None,
+                        projection=PLACE_DETAIL) -> Tuple[List[Place], Optional[str]]:
+        """Return one page of places ordered by (created_at, id) and the next cursor."""
+        query, limit = self.places_page_query(limit, cursor, filters, projection)
+        return split_page(db.session.execute(query).unique().scalars().all(), limit)
+
+    def get_place_rows_page(self, columns, limit: Optional[int] = None, cursor: Optional[str] = None,
+                            filters: Optional[Dict] = None) -> Tuple[List, Optional[str]]:
+        """get_places_page() as plain rows of columns (places joined with their owner)."""
+        query, limit = self.places_page_query(limit, cursor, filters, columns=columns)
+        return split_page(db.session.execute(query).all(), limit)
+
+    def get_place_amenity_rows(self, columns, place_ids: List[str]) -> Dict[str, List]:
+        """Columns of the amenities of each place, as {place_id: rows}."""
+        grouped = {}
+        for ids in chunked(place_ids):
+            grouped.update(group_by_parent(db.session.execute(place_amenity_rows_query(columns, ids))))
+        return grouped
+
+    def get_review_rows(self, columns, place_id: Optional[str] = None) -> List:
+        """Columns of all reviews, or of one place's, as plain rows (one query)."""
+        return db.session.execute(review_rows_query(columns, place_id)).all()
+
+    def places_page_query(self, limit: Optional[int] = None, cursor: Optional[str] = None,
+                          filters: Optional[Dict] = None, projection=PLACE_DETAIL, columns=None):
+        """
+        Select one page of places (plus one row telling whether another page
+        exists) and the clamped page size; split_page() cuts the result.
+        With columns, rows of those columns (places joined with their owner)
+        are selected instead of entities, and the columns must include
+        created_at and id for the cursor.
+        """
+        limit = clamp_limit(limit)
+        if columns is None:
+            query = db.select(Place).options(*place_load_options(projection))
+        else:
+            query = db.select(*columns).select_from(Place).outerjoin(User, User.id == Place.owner_id)
+        query = query.order_by(Place.created_at, Place.id)
+
+        query = self._filter_places(query, filters or {})
+
+        if cursor:
+            created_at, last_id = decode_cursor(cursor)
+            query = query.filter(db.or_(
+                Place.created_at > created_at,
+                db.and_(Place.created_at == created_at, Place.id > last_id)
+            ))
+
+        # Fetch one extra row to know whether another page exists
+        return query.limit(limit + 1), limit
+
+    def _filter_places(self, query, filters: Dict):
+        """Apply the price, amenity (all-of) and rating filters of the listing."""
+        min_price = filters.get('min_price')
+        max_price = filters.get('max_price')
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise ValueError("min_price cannot be greater than max_price.")
+        if min_price is not None:
+            query = query.filter(Place.price >= min_price)
+        if max_price is not None:
+            query = query.filter(Place.price <= max_price)
+
+        amenity_names = set(filters.get('amenities') or [])
+        if amenity_names:
+            # Places linked to every requested amenity
+            matching = db.select(place_amenity.c.place_id).join(
+                Amenity, Amenity.id == place_amenity.c.amenity_id
+            ).filter(Amenity.name.in_(amenity_names)).group_by(
+                place_amenity.c.place_id
+            ).having(db.func.count(Amenity.id) == len(amenity_names))
+            query = query.filter(Place.id.in_(matching))
+
+        min_rating = filters.get('min_rating')
+        if min_rating is not None:
+            query = query.filter(Place.avg_rating >= min_rating)
+
+        return query
+
+    @transactional
+    def update_place(self, place_id: str, place_data: Dict, columns=None,
+                     expected_version: Optional[int] = None) -> Optional[Row]:
+        allowed_fields = {'title', 'description', 'price', 'latitude', 'longitude', 'amenities'}
+        place_data = {key: value for key, value in place_data.items() if key in allowed_fields}
         amenities_list = place_data.pop('amenities', None)
-        if amenities_list is not None:
-            amenity_objects = db.session.scalars(
-                db.select(Amenity).filter(Amenity.name.in_(amenities_list))
-            ).all()
-            
-            if len(amenity_objects) != len(amenities_list):
-                found_names = {a.name for a in amenity_objects}
-                missing = set(amenities_list) - found_names
-                raise ValueError(f"Amenities not found: {missing}")
-            
-            place.amenities = amenity_objects
-
-        place_data.pop('owner_id', None)
-        
-        place.update(place_data)
-        return place
 
-    def delete_place(self, place_id: str) -> bool:
-        place = self.get_place(place_id)
+        if amenities_list is not None:
+            # A relationship change goes through the ORM: load the place
+            # (the identity map serves it when the caller already holds it)
+            place = self.place_repository.get(place_id)
+            if not place:
+                return None
+            check_version(place, expected_version)
+            place.amenities = self._amenities_by_name(amenities_list)
+            db.session.flush()
+            # The link rows do not touch the places row: bump its version anyway
+            place_data.setdefault('updated_at', datetime.utcnow())
+
+        if ('latitude' in place_data) != ('longitude' in place_data):
+            # Only one coordinate given: the other one comes from the current row
+            place = self.place_repository.get(place_id)
+            if not place:
+                return None
+            place_data.setdefault('latitude', place.latitude)
+            place_data.setdefault('longitude', place.longitude)
+        if 'latitude' in place_data:
+            # Keep the spatial grid cell in sync with the new coordinates
+            validate_coordinates(place_data['latitude'], place_data['longitude'])
+            place_data['geo_cell'] = geo_cell(place_data['latitude'], place_data['longitude'])
+
+        # A bulk UPDATE is not seen by the flush listener: evict the details here
+        schedule_invalidation(db.session, self.place_details_key(place_id))
+        row = self.place_repository.update(place_id, place_data, columns, expected_version)
+        if row is not None and 'title' in place_data:
+            # Reviews embed the title of their place
+            self._touch_rows(Review, Review.place_id == place_id)
+        return row
+
+    def rebuild_geo_index(self, missing_only: bool = False, batch_size: int = GEO_INDEX_BATCH_SIZE) -> int:
+        """
+        Recompute the grid cell of every place, or only of the places without
+        one (missing_only), returns the number of places indexed.
+        Ids and coordinates are read in batches of batch_size (keyset on id), and
+        each batch is written by one executemany UPDATE in its own transaction.
+        """
+        places = Place.__table__
+        set_cell = places.update().where(places.c.id == db.bindparam('place_id')).values(
+            geo_cell=db.bindparam('cell'))
+        count, last_id = 0, ''
+        while True:
+            with unit_of_work() as session:
+                query = db.select(Place.id, Place.latitude, Place.longitude).where(
+                    Place.id > last_id).order_by(Place.id).limit(batch_size)
+                if missing_only:
+                    query = query.where(Place.geo_cell.is_(None))
+                rows = session.execute(query).all()
+                if rows:
+                    session.execute(set_cell, [{'place_id': row.id, 'cell': geo_cell(row.latitude, row.longitude)}
+                                               for row in rows])
+            if not rows:
+                break
+            count += len(rows)
+            last_id = rows[-1].id
+        return count
+
+    def get_places_nearby(self, latitude: float, longitude: float, radius_km: float,
+                          limit: Optional[int] = None,
+                          projection=PLACE_DETAIL) -> List[Tuple[Place, float]]:
+        """Return (place, distance_km) pairs within radius_km, closest first."""
+        validate_coordinates(latitude, longitude)
+        if not 0 < radius_km <= MAX_RADIUS_KM:
+            raise ValueError(f"radius_km must be between 0 and {MAX_RADIUS_KM:g}.")
+        limit = clamp_limit(limit)
+
+        min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, radius_km)
+        cell_ranges = cell_ranges_for_box(min_lat, max_lat, min_lng, max_lng)
+
+        # The grid index and the bounding box narrow candidates in SQL, read as
+        # (id, latitude, longitude) only; the exact distance is checked here, since
+        # trigonometric functions are missing from some SQLite builds
+        candidates = db.select(Place.id, Place.latitude, Place.longitude).filter(
+            db.or_(*(Place.geo_cell.between(first, last) for first, last in cell_ranges)),
+            Place.latitude.between(min_lat, max_lat),
+            db.or_(*(Place.longitude.between(west, east) for west, east in longitude_ranges(min_lng, max_lng)))
+        )
+        distances = {}
+        for place_id, place_latitude, place_longitude in db.session.execute(candidates):
+            distance = haversine_km(latitude, longitude, place_latitude, place_longitude)
+            if distance <= radius_km:
+                distances[place_id] = distance
+        closest = heapq.nsmallest(limit, distances, key=distances.get)
+        if not closest:
+            return []
+
+        # Only the places returned are loaded, with their relationships
+        query = db.select(Place).options(*place_load_options(projection)).where(Place.id.in_(closest))
+        places = {place.id: place for place in db.session.execute(query).unique().scalars()}
+        return [(places[place_id], distances[place_id]) for place_id in closest if place_id in places]
+
+    @transactional
+    def delete_place(self, place_id: str, expected_version: Optional[int] = None) -> bool:
+        place = self.get_place(place_id, projection=PLACE_ONLY)
         if not place:
             return False
-        self.place_repository.delete(place)
+        check_version(place, expected_version)
+
+        deleted_at = datetime.utcnow()
+        self._soft_delete(place, deleted_at)
+        self._soft_delete_rows(Review, Review.place_id == place_id, deleted_at)
         return True
 
+    def _soft_delete(self, obj, deleted_at: datetime) -> None:
+        """
+        Flag one entity as deleted, at the version it was read (StaleDataError
+        if it changed since), and queue the purge of the deleted rows.
+        """
+        model = type(obj)
+        statement = db.update(model).where(model.id == obj.id, model.version == obj.version)
+        if not db.session.execute(statement.values(deleted_at=deleted_at, version=model.version + 1)).rowcount:
+            raise StaleDataError(f"{model.__name__} {obj.id} is no longer at version {obj.version}")
+        schedule_invalidation(db.session, *self._cache_keys(obj))
+        self.enqueue(PURGE_DELETED)
+
+    def _touch_rows(self, model, condition) -> None:
+        """
+        Bump updated_at and version of the live rows matching condition, whose
+        representations embed a related row that just changed: their ETags
+        (see app.api.v2.conditional) only cover their own rows.
+        """
+        if model is Place and self.cache is not None:
+            # Not seen by the flush listener either: evict the touched places here
+            for place_id in db.session.scalars(db.select(Place.id).where(condition)):
+                schedule_invalidation(db.session, entity_key(Place, place_id), self.place_details_key(place_id))
+        db.session.execute(db.update(model).where(condition, model.deleted_at.is_(None)).values(
+            updated_at=datetime.utcnow(), version=model.version + 1
+        ))
+
+    def _soft_delete_rows(self, model, condition, deleted_at: datetime) -> int:
+        """Flag the live rows matching condition as deleted, in one UPDATE that loads nothing."""
+        statement = db.update(model).where(condition, model.deleted_at.is_(None)).values(
+            deleted_at=deleted_at, version=model.version + 1
+        ).execution_options(synchronize_session=False)
+        return db.session.execute(statement).rowcount
+
+    def enqueue(self, job_name: str, **payload) -> bool:
+        """
+        Queue follow-up work (see app.jobs) in the current unit of work, run by
+        a worker once it commits. False when an identical job is already waiting.
+        """
+        return enqueue(job_name, **payload)
+
+    def purge_deleted(self, batch_size: int = DEFAULT_PURGE_BATCH_SIZE) -> Dict[str, int]:
+        """Hard-delete the soft-deleted rows now, in chunks (see app.services.purge)."""
+        return purge_deleted(batch_size)
+
     def user_has_reviewed_place(self, user_id: str, place_id: str) -> bool:
         existing_review = self.review_repository.get_by_attributes(
             user_id=user_id,
@@ -190,19 +660,20 @@ class HBnBFacade:
         )
         return existing_review is not None
 
-    def create_review(self, review_data: Dict) -> Review:
+    @transactional
+    def create_review(self, review_data: Dict, known_user: bool = False) -> Review:
+        """known_user skips the author lookup when the caller already checked it (authenticated requests)."""
         place_id = review_data.get('place_id')
         user_id = review_data.get('user_id')
         
         if not place_id or not user_id:
             raise ValueError("place_id and user_id are required.")
 
-        place = self.get_place(place_id)
-        user = self.get_user(user_id)
+        place = self.get_place(place_id, projection=PLACE_ONLY)
         
         if not place:
             raise ValueError(f"Place with ID '{place_id}' not found.")
-        if not user:
+        if not known_user and not self.get_user(user_id):
             raise ValueError(f"User with ID '{user_id}' not found.")
 
         if place.owner_id == user_id:
@@ -212,14 +683,16 @@ class HBnBFacade:
             raise ValueError("User has already reviewed this place.")
 
         new_review = Review(**review_data)
+        self._apply_rating_delta(place_id, 1, new_review.rating)
         self.review_repository.add(new_review)
         return new_review
 
+    # Reviews come with their author and place (see ReviewRepository),
+    # so serializing N reviews costs one query instead of 2N+1
     def get_reviews_by_place(self, place_id: str) -> List[Review]:
-        place = self.get_place(place_id)
-        if not place:
+        if not self.get_place(place_id, projection=PLACE_ONLY):
             raise ValueError(f"Place with ID '{place_id}' not found.")
-        return place.reviews
+        return self.review_repository.get_by_place(place_id)
 
     def get_all_reviews(self) -> List[Review]:
         return self.review_repository.get_all()
@@ -227,20 +700,96 @@ class HBnBFacade:
     def get_review(self, review_id: str) -> Optional[Review]:
         return self.review_repository.get(review_id)
 
-    def update_review(self, review_id: str, review_data: Dict) -> Optional[Review]:
-        review = self.get_review(review_id)
-        if not review:
-            return None
-
-        review_data.pop('user_id', None)
-        review_data.pop('place_id', None)
-
-        review.update(review_data)
-        return review
-
-    def delete_review(self, review_id: str) -> bool:
+    @transactional
+    def update_review(self, review_id: str, review_data: Dict, columns=None,
+                      expected_version: Optional[int] = None) -> Optional[Row]:
+        allowed_fields = {'text', 'rating'}
+        review_data = {key: value for key, value in review_data.items() if key in allowed_fields}
+
+        new_rating = review_data.get('rating')
+        if new_rating is not None:
+            # The rating delta needs the old rating: the identity map serves
+            # the review when the caller already holds it, else a primary key lookup
+            review = db.session.get(Review, review_id)
+            if not review:
+                return None
+            check_version(review, expected_version)
+            if new_rating != review.rating:
+                self._apply_rating_delta(review.place_id, 0, new_rating - review.rating)
+
+        return self.review_repository.update(review_id, review_data, columns, expected_version)
+
+    @transactional
+    def delete_review(self, review_id: str, expected_version: Optional[int] = None) -> bool:
         review = self.get_review(review_id)
         if not review:
             return False
+        check_version(review, expected_version)
+        self._apply_rating_delta(review.place_id, -1, -review.rating)
         self.review_repository.delete(review)
-        return True
\ No newline at end of file
+        return True
+
+    def _apply_rating_delta(self, place_id: str, count_delta: int, sum_delta: int) -> None:
+        """
+        Stage an incremental change of a place's rating aggregates.
+        The UPDATEs run in the caller's transaction and are committed with the review.
+        """
+        schedule_invalidation(db.session, entity_key(Place, place_id), self.place_details_key(place_id))
+        # Bulk UPDATEs are not filtered for us: a soft-deleted place keeps its rows as they are
+        live_place = db.and_(Place.id == place_id, Place.deleted_at.is_(None))
+        db.session.execute(
+            db.update(Place).where(live_place).values(
+                review_count=Place.review_count + count_delta,
+                rating_sum=Place.rating_sum + sum_delta,
+                version=Place.version + 1
+            )
+        )
+        # Separate statement: MySQL evaluates SET clauses left to right
+        db.session.execute(
+            db.update(Place).where(live_place).values(
+                avg_rating=db.case(
+                    (Place.review_count > 0, db.cast(Place.rating_sum, db.Float) / Place.review_count),
+                    else_=None
+                )
+            )
+        )
+
+    def recompute_rating_aggregates(self, place_ids: Optional[List[str]] = None) -> int:
+        """Rebuild the rating aggregates of every place (or of place_ids) in one bulk UPDATE."""
+        with unit_of_work():
+            updated = self._recompute_rating_aggregates(place_ids)
+        if self.cache is not None and place_ids is None:
+            self.cache.clear()
+        return updated
+
+    def _recompute_rating_aggregates(self, place_ids: Optional[List[str]] = None) -> int:
+        """Stage the bulk UPDATE recomputing aggregates, for all places or only place_ids."""
+        # Inside an UPDATE: soft-deleted reviews are not filtered out for us
+        place_reviews = db.select(Review).where(Review.place_id == Place.id, Review.deleted_at.is_(None))
+        statement = db.update(Place).values(
+            review_count=place_reviews.with_only_columns(db.func.count(Review.id)).scalar_subquery(),
+            rating_sum=place_reviews.with_only_columns(
+                db.func.coalesce(db.func.sum(Review.rating), 0)
+            ).scalar_subquery(),
+            avg_rating=place_reviews.with_only_columns(
+                db.func.avg(db.cast(Review.rating, db.Float))
+            ).scalar_subquery(),
+            version=Place.version + 1
+        ).where(Place.deleted_at.is_(None)).execution_options(synchronize_session=False)
+
+        if place_ids is not None:
+            statement = statement.where(Place.id.in_(place_ids))
+            for place_id in place_ids:
+                schedule_invalidation(db.session, entity_key(Place, place_id), self.place_details_key(place_id))
+        return db.session.execute(statement).rowcount
+
+    def bulk_import(self, kind: str, rows, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict:
+        """
+        Import amenities, places or reviews from parsed rows (see importer.read_rows).
+        Returns a report with created/failed counts and per-line errors.
+        """
+        return BulkImporter(self, chunk_size=chunk_size).run(kind, rows)
+
+    def export_rows(self, kind: str, since: Optional[datetime] = None):
+        """Lazily iterate the rows of places, reviews, users or amenities for an export."""
+        return iter_export(kind, since=since)
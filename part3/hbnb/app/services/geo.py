@@ -0,0 +1,93 @@
+import math
+from typing import List, Tuple
+
+EARTH_RADIUS_KM = 6371.0
+MAX_RADIUS_KM = 500.0
+# Places reindexed per transaction by HBnBFacade.rebuild_geo_index
+GEO_INDEX_BATCH_SIZE = 500
+
+# Places are bucketed in a fixed lat/lng grid; a cell id is row * GRID_COLUMNS + column
+CELL_DEGREES = 0.5
+GRID_ROWS = int(180 / CELL_DEGREES)
+GRID_COLUMNS = int(360 / CELL_DEGREES)
+
+
+def validate_coordinates(latitude: float, longitude: float) -> None:
+    if latitude is None or longitude is None:
+        raise ValueError("Latitude and longitude are required.")
+    if not -90 <= latitude <= 90:
+        raise ValueError("Latitude must be between -90 and 90.")
+    if not -180 <= longitude <= 180:
+        raise ValueError("Longitude must be between -180 and 180.")
+
+
+def _row(latitude: float) -> int:
+    return min(int((latitude + 90) / CELL_DEGREES), GRID_ROWS - 1)
+
+
+def _column(longitude: float) -> int:
+    return int((longitude + 180) / CELL_DEGREES) % GRID_COLUMNS
+
+
+def geo_cell(latitude: float, longitude: float) -> int:
+    """Return the grid cell containing a coordinate."""
+    return _row(latitude) * GRID_COLUMNS + _column(longitude)
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two coordinates in kilometers."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(latitude: float, longitude: float,
+                 radius_km: float) -> Tuple[float, float, float, float]:
+    """Return (min_lat, max_lat, min_lng, max_lng) enclosing the search circle."""
+    d_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat, max_lat = max(-90.0, latitude - d_lat), min(90.0, latitude + d_lat)
+
+    # Near the poles the circle spans every longitude
+    cos_lat = math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    if cos_lat <= 0 or d_lat / cos_lat >= 180:
+        return min_lat, max_lat, -180.0, 180.0
+    d_lng = d_lat / cos_lat
+    return min_lat, max_lat, longitude - d_lng, longitude + d_lng
+
+
+def longitude_ranges(min_lng: float, max_lng: float) -> List[Tuple[float, float]]:
+    """
+    The (west, east) longitude ranges of a bounding box from bounding_box():
+    two when it wraps around the antimeridian (bounds beyond +/-180).
+    """
+    if min_lng < -180:
+        return [(min_lng + 360, 180.0), (-180.0, max_lng)]
+    if max_lng > 180:
+        return [(min_lng, 180.0), (-180.0, max_lng - 360)]
+    return [(min_lng, max_lng)]
+
+
+def cell_ranges_for_box(min_lat: float, max_lat: float,
+                        min_lng: float, max_lng: float) -> List[Tuple[int, int]]:
+    """
+    List the (first, last) cell id ranges covering a bounding box.
+    Cells of one grid row are contiguous, so each row needs one range,
+    or two when the box wraps around the antimeridian.
+    """
+    if max_lng - min_lng >= 360:
+        spans = [(0, GRID_COLUMNS - 1)]
+    else:
+        first = int((min_lng + 180) // CELL_DEGREES) % GRID_COLUMNS
+        last = int((max_lng + 180) // CELL_DEGREES) % GRID_COLUMNS
+        if first <= last:
+            spans = [(first, last)]
+        else:
+            spans = [(first, GRID_COLUMNS - 1), (0, last)]
+
+    return [
+        (row * GRID_COLUMNS + first, row * GRID_COLUMNS + last)
+        for row in range(_row(min_lat), _row(max_lat) + 1)
+        for first, last in spans
+    ]
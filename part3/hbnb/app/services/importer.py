@@ -0,0 +1,295 @@
+import csv
+import io
+import json
+import math
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.extensions import db
+from app.jobs import RECOMPUTE_RATINGS
+from app.models import User, Amenity, Place, Review
+from app.models.place import place_amenity
+from app.persistence.repository import chunked
+from app.services.geo import validate_coordinates, geo_cell
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+IMPORT_KINDS = ('amenities', 'places', 'reviews')
+
+# (line number, parsed row or None, parse error or None)
+Row = Tuple[int, Optional[Dict], Optional[str]]
+
+
+def read_rows(stream: Iterable[str], fmt: str) -> Iterator[Row]:
+    """Parse NDJSON or CSV lines lazily, one row dict at a time."""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            # Empty CSV cells are missing values
+            yield reader.line_num, {k: v for k, v in row.items() if v not in ('', None)}, None
+    elif fmt == 'ndjson':
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield line_number, None, f"Invalid JSON: {e}"
+                continue
+            if not isinstance(row, dict):
+                yield line_number, None, "Each line must be a JSON object."
+                continue
+            yield line_number, row, None
+    else:
+        raise ValueError(f"Unsupported import format '{fmt}', use 'ndjson' or 'csv'.")
+
+
+def text_stream(binary_stream) -> io.TextIOWrapper:
+    return io.TextIOWrapper(binary_stream, encoding='utf-8', newline='')
+
+
+def _required(row: Dict, key: str) -> str:
+    value = row.get(key)
+    if value is None or (isinstance(value, str) and not value.strip()):
+        raise ValueError(f"'{key}' is required.")
+    return value.strip() if isinstance(value, str) else value
+
+
+def _number(row: Dict, key: str, cast=float, required: bool = True):
+    """A finite number; with cast=int, a whole one (4.7 is refused, not truncated)."""
+    value = row.get(key)
+    if value is None:
+        if required:
+            raise ValueError(f"'{key}' is required.")
+        return None
+    try:
+        if isinstance(value, bool):
+            raise TypeError(value)
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"'{key}' must be a number.")
+    if not math.isfinite(number):
+        raise ValueError(f"'{key}' must be a number.")
+    if cast is int and not number.is_integer():
+        raise ValueError(f"'{key}' must be a whole number.")
+    return cast(number)
+
+
+def _names(value) -> List[str]:
+    """Amenity names given as a JSON list or a ';'-separated CSV cell."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = value.split(';')
+    return sorted({str(name).strip() for name in value if str(name).strip()})
+
+
+def _check_references(rows: List[Tuple[int, Dict]], keys: Tuple[str, ...]) -> Tuple[List, List]:
+    """
+    Split rows into those whose references (ids, emails, amenity names) are
+    strings, or a list of strings for 'amenities', and the errors of the others:
+    a JSON list or object would otherwise end up in the sets of ids looked up.
+    """
+    valid, errors = [], []
+    for line, row in rows:
+        wrong = next((key for key in keys if not _is_reference(row.get(key), many=key == 'amenities')), None)
+        if wrong is None:
+            valid.append((line, row))
+        elif wrong == 'amenities':
+            errors.append((line, "'amenities' must be a list of names."))
+        else:
+            errors.append((line, f"'{wrong}' must be a string."))
+    return valid, errors
+
+
+def _rows_in(columns, key, values) -> List:
+    """Rows of columns whose key is one of values, one IN query per IN_CHUNK_SIZE values."""
+    rows = []
+    for chunk in chunked(values):
+        rows.extend(db.session.execute(db.select(*columns).where(key.in_(chunk))).all())
+    return rows
+
+
+def _is_reference(value, many: bool = False) -> bool:
+    if value is None or isinstance(value, str):
+        return True
+    return many and isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+class BulkImporter:
+    """
+    Imports rows in chunks: related entities are resolved with one IN query per
+    chunk, rows are inserted with executemany and every chunk is its own transaction.
+    """
+
+    def __init__(self, facade, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        self.facade = facade
+        self.chunk_size = chunk_size
+
+    def run(self, kind: str, rows: Iterable[Row]) -> Dict:
+        if kind not in IMPORT_KINDS:
+            raise ValueError(f"Unknown import kind '{kind}', expected one of {IMPORT_KINDS}.")
+        import_chunk = getattr(self, f"_import_{kind}")
+
+        report = {'kind': kind, 'processed': 0, 'created': 0, 'failed': 0, 'errors': []}
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                self._run_chunk(import_chunk, chunk, report)
+                chunk = []
+        if chunk:
+            self._run_chunk(import_chunk, chunk, report)
+        return report
+
+    def _run_chunk(self, import_chunk, chunk: List[Row], report: Dict) -> None:
+        errors = []
+        valid = []
+        for line, row, error in chunk:
+            if error:
+                errors.append((line, error))
+            else:
+                valid.append((line, row))
+
+        try:
+            created, chunk_errors = import_chunk(valid)
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            created = 0
+            chunk_errors = [(line, f"Chunk rolled back: {e.__class__.__name__}") for line, _ in valid]
+        errors.extend(chunk_errors)
+
+        report['processed'] += len(chunk)
+        report['created'] += created
+        report['failed'] += len(errors)
+        room = MAX_REPORTED_ERRORS - len(report['errors'])
+        report['errors'].extend({'line': line, 'error': error} for line, error in sorted(errors)[:room])
+
+    def _resolve_users(self, rows: List[Dict], id_key: str, email_key: str) -> Tuple[set, Dict[str, str]]:
+        """Existing user ids and an email -> id map for the users referenced by a chunk."""
+        ids = {row[id_key] for row in rows if row.get(id_key)}
+        emails = {row[email_key] for row in rows if row.get(email_key)}
+        known_ids = self.facade.user_repository.exists_many(ids)
+        by_email = dict(_rows_in((User.email, User.id), User.email, emails))
+        return known_ids, by_email
+
+    @staticmethod
+    def _user_id(row: Dict, id_key: str, email_key: str, known_ids: set, by_email: Dict) -> str:
+        if row.get(id_key):
+            if row[id_key] not in known_ids:
+                raise ValueError(f"User with ID '{row[id_key]}' not found.")
+            return row[id_key]
+        if row.get(email_key):
+            if row[email_key] not in by_email:
+                raise ValueError(f"User with email '{row[email_key]}' not found.")
+            return by_email[row[email_key]]
+        raise ValueError(f"'{id_key}' or '{email_key}' is required.")
+
+    def _import_amenities(self, rows: List[Tuple[int, Dict]]) -> Tuple[int, List]:
+        errors, records = [], []
+        names = {str(row.get('name', '')).strip() for _, row in rows}
+        existing = {name for name, in _rows_in((Amenity.name,), Amenity.name, names)}
+        now = datetime.utcnow()
+
+        for line, row in rows:
+            try:
+                name = str(_required(row, 'name'))
+                if name in existing:
+                    raise ValueError(f"Amenity with name '{name}' already exists.")
+            except ValueError as e:
+                errors.append((line, str(e)))
+                continue
+            existing.add(name)
+            records.append({'id': str(uuid.uuid4()), 'name': name, 'created_at': now, 'updated_at': now})
+
+        if records:
+            db.session.execute(Amenity.__table__.insert(), records)
+        return len(records), errors
+
+    def _import_places(self, rows: List[Tuple[int, Dict]]) -> Tuple[int, List]:
+        rows, errors = _check_references(rows, ('owner_id', 'owner_email', 'amenities'))
+        records, links = [], []
+        known_ids, by_email = self._resolve_users([row for _, row in rows], 'owner_id', 'owner_email')
+        wanted = {name for _, row in rows for name in _names(row.get('amenities'))}
+        amenity_ids = dict(_rows_in((Amenity.name, Amenity.id), Amenity.name, wanted))
+        now = datetime.utcnow()
+
+        for line, row in rows:
+            try:
+                title = str(_required(row, 'title'))
+                price = _number(row, 'price')
+                if price < 0:
+                    raise ValueError("'price' must be positive.")
+                latitude = _number(row, 'latitude')
+                longitude = _number(row, 'longitude')
+                validate_coordinates(latitude, longitude)
+                owner_id = self._user_id(row, 'owner_id', 'owner_email', known_ids, by_email)
+                names = _names(row.get('amenities'))
+                missing = [name for name in names if name not in amenity_ids]
+                if missing:
+                    raise ValueError(f"Amenities not found: {missing}")
+            except ValueError as e:
+                errors.append((line, str(e)))
+                continue
+
+            place_id = str(uuid.uuid4())
+            records.append({
+                'id': place_id, 'title': title, 'description': row.get('description'),
+                'price': price, 'latitude': latitude, 'longitude': longitude,
+                'geo_cell': geo_cell(latitude, longitude), 'owner_id': owner_id,
+                'review_count': 0, 'rating_sum': 0, 'avg_rating': None,
+                'created_at': now, 'updated_at': now
+            })
+            links.extend({'place_id': place_id, 'amenity_id': amenity_ids[name]} for name in names)
+
+        if records:
+            db.session.execute(Place.__table__.insert(), records)
+        if links:
+            db.session.execute(place_amenity.insert(), links)
+        return len(records), errors
+
+    def _import_reviews(self, rows: List[Tuple[int, Dict]]) -> Tuple[int, List]:
+        rows, errors = _check_references(rows, ('place_id', 'user_id', 'user_email'))
+        records = []
+        known_ids, by_email = self._resolve_users([row for _, row in rows], 'user_id', 'user_email')
+        place_ids = {row['place_id'] for _, row in rows if row.get('place_id')}
+        owners = dict(_rows_in((Place.id, Place.owner_id), Place.id, place_ids))
+        reviewed = set(_rows_in((Review.user_id, Review.place_id), Review.place_id, owners))
+        now = datetime.utcnow()
+
+        for line, row in rows:
+            try:
+                text = str(_required(row, 'text'))
+                rating = _number(row, 'rating', cast=int)
+                if not 1 <= rating <= 5:
+                    raise ValueError("'rating' must be between 1 and 5.")
+                place_id = _required(row, 'place_id')
+                if place_id not in owners:
+                    raise ValueError(f"Place with ID '{place_id}' not found.")
+                user_id = self._user_id(row, 'user_id', 'user_email', known_ids, by_email)
+                if owners[place_id] == user_id:
+                    raise ValueError("Owner cannot review their own place.")
+                if (user_id, place_id) in reviewed:
+                    raise ValueError("User has already reviewed this place.")
+            except ValueError as e:
+                errors.append((line, str(e)))
+                continue
+
+            reviewed.add((user_id, place_id))
+            records.append({
+                'id': str(uuid.uuid4()), 'text': text, 'rating': rating,
+                'place_id': place_id, 'user_id': user_id,
+                'created_at': now, 'updated_at': now
+            })
+
+        if records:
+            db.session.execute(Review.__table__.insert(), records)
+            # Committed with the chunk: a worker rebuilds the aggregates of its places
+            self.facade.enqueue(RECOMPUTE_RATINGS, place_ids=sorted({r['place_id'] for r in records}))
+        return len(records), errors
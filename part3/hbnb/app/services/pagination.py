@@ -0,0 +1,32 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def clamp_limit(limit: Optional[int]) -> int:
+    """Return a page size between 1 and MAX_PAGE_SIZE."""
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    if limit < 1:
+        raise ValueError("limit must be a positive integer.")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def encode_cursor(created_at: datetime, entity_id: str) -> str:
+    """Encode the (created_at, id) key of the last row of a page."""
+    raw = json.dumps([created_at.isoformat(), entity_id]).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor produced by encode_cursor."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, entity_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(entity_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid pagination cursor.")
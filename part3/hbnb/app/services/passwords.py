@@ -0,0 +1,37 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.extensions import bcrypt
+
+DEFAULT_LOG_ROUNDS = 12
+
+
+class PasswordVerifierBusy(Exception):
+    """Raised when too many password checks are already running or queued."""
+
+
+class PasswordVerifier:
+    """
+    Runs bcrypt checks on a bounded thread pool (bcrypt releases the GIL).
+    At most max_workers hashes run at once and max_pending more may wait;
+    beyond that verify() fails fast instead of piling up CPU-bound work.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 16):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='bcrypt')
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(max_workers=config.get('PASSWORD_VERIFY_WORKERS', 2),
+                   max_pending=config.get('PASSWORD_VERIFY_MAX_PENDING', 16))
+
+    def verify(self, password_hash: str, password: str) -> bool:
+        if not password_hash:
+            return False
+        if not self._slots.acquire(blocking=False):
+            raise PasswordVerifierBusy("Too many concurrent logins, retry shortly.")
+        try:
+            return self._executor.submit(bcrypt.check_password_hash, password_hash, password).result()
+        finally:
+            self._slots.release()
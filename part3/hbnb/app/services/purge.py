@@ -0,0 +1,51 @@
+from typing import Dict
+
+from app.extensions import db
+from app.models import User, Place, Review
+from app.models.place import place_amenity
+from app.persistence.soft_delete import INCLUDE_DELETED
+from app.persistence.unit_of_work import unit_of_work
+
+DEFAULT_PURGE_BATCH_SIZE = 500
+
+
+def purge_steps():
+    """
+    (name, key column, select of the keys to delete) of each purge step, children first.
+    Rows of deleted users and places count as deleted even when not flagged themselves,
+    so every step removes what the next one would otherwise trip over.
+    """
+    gone_users = db.select(User.id).where(User.deleted_at.isnot(None))
+    gone_places = db.select(Place.id).where(
+        db.or_(Place.deleted_at.isnot(None), Place.owner_id.in_(gone_users)))
+    return [
+        ('place_amenity', place_amenity.c.place_id,
+         db.select(place_amenity.c.place_id).where(place_amenity.c.place_id.in_(gone_places)).distinct()),
+        ('reviews', Review.id, db.select(Review.id).where(db.or_(
+            Review.deleted_at.isnot(None), Review.place_id.in_(gone_places), Review.user_id.in_(gone_users)))),
+        ('places', Place.id, gone_places),
+        ('users', User.id, gone_users),
+    ]
+
+
+def purge_deleted(batch_size: int = DEFAULT_PURGE_BATCH_SIZE) -> Dict[str, int]:
+    """
+    Hard-delete the soft-deleted rows and their children in chunked DELETEs,
+    one transaction per chunk of at most batch_size keys, so the purge never
+    holds long locks and resumes where it stopped after a failure.
+    Run by the purge_deleted job (see app.jobs) queued by every soft delete.
+    Returns the number of rows deleted per table.
+    """
+    purged = {}
+    for name, key, keys_query in purge_steps():
+        table = key.table
+        purged[name] = 0
+        while True:
+            with unit_of_work() as session:
+                keys = session.scalars(keys_query.limit(batch_size)
+                                       .execution_options(**{INCLUDE_DELETED: True})).all()
+                if keys:
+                    purged[name] += session.execute(table.delete().where(key.in_(keys))).rowcount
+            if not keys:
+                break
+    return purged
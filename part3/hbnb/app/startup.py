@@ -0,0 +1,37 @@
+import logging
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict
+
+logger = logging.getLogger('app.startup')
+
+
+class StartupTimer:
+    """Wall-clock time of each create_app phase, reported once the app is built."""
+
+    def __init__(self):
+        self.started = perf_counter()
+        self.phases: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = (perf_counter() - start) * 1000
+
+    def report(self, app) -> Dict:
+        """Store the timings in app.extensions['startup'] and log them, warning past STARTUP_BUDGET_MS."""
+        total = (perf_counter() - self.started) * 1000
+        timings = {'total_ms': round(total, 1),
+                   'phases_ms': {name: round(ms, 1) for name, ms in self.phases.items()}}
+        app.extensions['startup'] = timings
+
+        details = ", ".join(f"{name} {ms:.1f}ms" for name, ms in self.phases.items())
+        budget = app.config.get('STARTUP_BUDGET_MS')
+        if budget and total > budget:
+            logger.warning("create_app took %.1fms (budget %sms): %s", total, budget, details)
+        else:
+            logger.info("create_app took %.1fms: %s", total, details)
+        return timings
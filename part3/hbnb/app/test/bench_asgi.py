@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Load test of the read routes at high concurrency, WSGI vs ASGI entry point.
+Both run under uvicorn on a file SQLite database with the entity cache off:
+- wsgi: the whole Flask app behind a thread pool (ASGI_WSGI_WORKERS threads)
+- asgi: asgi.py, async handlers for the read routes
+Each of the connections (HTTP/1.1 keep-alive) loops over place listings,
+place details, place reviews and amenities for the duration of the run.
+Run from project root: python app/test/bench_asgi.py [connections] [seconds]
+Default: 1000 connections, 10 seconds per entry point
+"""
+
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+PLACES = 500
+REVIEWERS = 5
+PORT = 8765
+
+
+def bench_config(database):
+    from config import DevelopmentConfig
+    return type('BenchConfig', (DevelopmentConfig,), {
+        'DEBUG': False, 'TESTING': True, 'ENTITY_CACHE': None, 'BCRYPT_LOG_ROUNDS': 4,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{database}",
+    })
+
+
+def seed(database):
+    from app import create_app, get_facade
+    from app.extensions import db
+
+    app = create_app(bench_config(database))
+    with app.app_context():
+        db.create_all()
+        facade = get_facade()
+        for name in ("WiFi", "Pool", "Parking"):
+            facade.create_amenity({'name': name})
+        owner = facade.create_user({'first_name': "Bench", 'last_name': "Owner",
+                                    'email': "owner@hbnb.com", 'password': "bench"})
+        reviewers = [facade.create_user({'first_name': "Bench", 'last_name': f"Guest {i}",
+                                         'email': f"guest{i}@hbnb.com", 'password': "bench"}).id
+                     for i in range(REVIEWERS)]
+        places = []
+        with facade.transaction():
+            for i in range(PLACES):
+                place = facade.create_place({'title': f"Place {i}", 'price': float(i % 300),
+                                             'owner_id': owner.id, 'latitude': 45.0 + i % 10,
+                                             'longitude': 2.0 + i % 10,
+                                             'amenities': ["WiFi"] if i % 2 else []}, known_user=True)
+                places.append(place.id)
+                for user_id in reviewers:
+                    facade.create_review({'text': "Bench review", 'rating': 1 + i % 5,
+                                          'user_id': user_id, 'place_id': place.id}, known_user=True)
+        db.session.remove()
+        db.engine.dispose()
+    return places
+
+
+def serve(kind, database):
+    """Child process: run one entry point under uvicorn."""
+    import uvicorn
+    from a2wsgi import WSGIMiddleware
+
+    config_class = bench_config(database)
+    if kind == 'asgi':
+        from app.asgi import create_asgi_app
+        application = create_asgi_app(config_class)
+    else:
+        from app import create_app
+        flask_app = create_app(config_class)
+        application = WSGIMiddleware(flask_app, workers=flask_app.config['ASGI_WSGI_WORKERS'])
+    uvicorn.run(application, host='127.0.0.1', port=PORT, log_level='error',
+                backlog=4096, lifespan='off' if kind == 'wsgi' else 'on')
+
+
+def wait_for_port(timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', PORT), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+async def client(index, paths, deadline, latencies, errors):
+    try:
+        reader, writer = await asyncio.open_connection('127.0.0.1', PORT)
+    except OSError:
+        errors.append('connect')
+        return
+    i = index
+    try:
+        while time.perf_counter() < deadline:
+            path = paths[i % len(paths)]
+            i += 1
+            start = time.perf_counter()
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            if not head.startswith(b"HTTP/1.1 200"):
+                errors.append(head.split(b"\r\n", 1)[0].decode())
+    except (OSError, asyncio.IncompleteReadError) as e:
+        errors.append(type(e).__name__)
+    finally:
+        writer.close()
+
+
+async def load(paths, connections, duration):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    start = time.perf_counter()
+    await asyncio.gather(*(client(n, paths, deadline, latencies, errors) for n in range(connections)))
+    return len(latencies) / (time.perf_counter() - start), latencies, errors
+
+
+def run(kind, database, paths, connections, duration):
+    server = subprocess.Popen([sys.executable, '-W', 'ignore', os.path.abspath(__file__),
+                               '--serve', kind, database], cwd=project_root)
+    try:
+        wait_for_port()
+        return asyncio.run(load(paths, connections, duration))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    connections = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 10.0
+    print(f"{connections} connections, {duration:.0f}s per entry point, "
+          f"{PLACES} places x {REVIEWERS} reviews")
+    print(f"{'entry':>6} | {'req/s':>8} | {'p50 ms':>8} | {'p99 ms':>8} | {'errors':>6}")
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, 'bench.db')
+        places = seed(database)
+        paths = []
+        for place_id in places[:50]:
+            paths += ['/api/v2/places/?limit=20', f'/api/v2/places/{place_id}',
+                      f'/api/v2/reviews/places/{place_id}/reviews', '/api/v2/amenities/']
+        for kind in ('wsgi', 'asgi'):
+            rate, latencies, errors = run(kind, database, paths, connections, duration)
+            cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0] * 99
+            print(f"{kind:>6} | {rate:>8.1f} | {cuts[49] * 1000:>8.1f} | {cuts[98] * 1000:>8.1f} | "
+                  f"{len(errors):>6}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--serve':
+        serve(sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark of requests/s for each engine profile on a file SQLite database.
+Worker threads mix place listings, place details and place updates (1 write in 5),
+with the entity cache off so every request reaches the database.
+Run from project root: python app/test/bench_engine.py [threads] [seconds]
+Default: 8 threads, 5 seconds per profile
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from flask_jwt_extended import create_access_token
+
+from app import create_app, get_facade
+from app.extensions import db
+from config import DevelopmentConfig, ProductionConfig, SQLITE_TUNED_PRAGMAS
+
+PLACES = 2000
+WRITE_EVERY = 5
+
+
+def profiles(directory):
+    base = {'TESTING': True, 'ENTITY_CACHE': None, 'BCRYPT_LOG_ROUNDS': 4}
+    return {
+        'default': type('DefaultProfile', (DevelopmentConfig,), dict(
+            base, SQLITE_PRAGMAS={},
+            SQLALCHEMY_DATABASE_URI=f"sqlite:///{os.path.join(directory, 'default.db')}")),
+        'sqlite-tuned': type('TunedProfile', (DevelopmentConfig,), dict(
+            base, SQLITE_PRAGMAS=SQLITE_TUNED_PRAGMAS,
+            SQLALCHEMY_DATABASE_URI=f"sqlite:///{os.path.join(directory, 'tuned.db')}")),
+        'production': type('ProductionProfile', (ProductionConfig,), dict(
+            base, SQLALCHEMY_DATABASE_URI=os.getenv(
+                'DATABASE_URL', f"sqlite:///{os.path.join(directory, 'production.db')}"))),
+    }
+
+
+def seed():
+    facade = get_facade()
+    owner = facade.create_user({'first_name': "Bench", 'last_name': "Owner",
+                                'email': "owner@hbnb.com", 'password': "bench"})
+    places = []
+    for i in range(PLACES):
+        places.append(facade.create_place({'title': f"Place {i}", 'price': float(i % 300),
+                                           'owner_id': owner.id, 'latitude': 45.0 + i % 10,
+                                           'longitude': 2.0 + i % 10}).id)
+    return create_access_token(identity=owner.id, additional_claims={"is_admin": False}), places
+
+
+def run_profile(config_class, threads, duration):
+    app = create_app(config_class)
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        token, places = seed()
+        db.session.remove()
+
+    counts = [0] * threads
+    errors = [0] * threads
+    deadline = time.perf_counter() + duration
+
+    def worker(index):
+        client = app.test_client()
+        headers = {'Authorization': f'Bearer {token}'}
+        i = index
+        while time.perf_counter() < deadline:
+            place_id = places[i % len(places)]
+            if i % WRITE_EVERY == 0:
+                response = client.put(f'/api/v2/places/{place_id}', json={'price': float(i % 500)},
+                                      headers=headers)
+            elif i % 2:
+                response = client.get('/api/v2/places/?limit=20')
+            else:
+                response = client.get(f'/api/v2/places/{place_id}')
+            if response.status_code == 200:
+                counts[index] += 1
+            else:
+                errors[index] += 1
+            i += threads
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+    return sum(counts) / elapsed, sum(errors)
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    print(f"{threads} threads, {duration:.0f}s per profile, {PLACES} places, 1 write in {WRITE_EVERY}")
+    print(f"{'profile':>12} | {'req/s':>8} | {'errors':>6}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, config_class in profiles(directory).items():
+            rate, errors = run_profile(config_class, threads, duration)
+            print(f"{name:>12} | {rate:>8.1f} | {errors:>6}")
+
+
+if __name__ == '__main__':
+    main()
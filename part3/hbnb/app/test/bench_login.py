@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Benchmark of login throughput per core for several bcrypt costs.
+Logins run sequentially on one thread, so logins/s is the per-core rate.
+Run from project root: python app/test/bench_login.py [rounds...]
+Default rounds: 10 11 12
+"""
+
+import os
+import sys
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from app import create_app, get_facade
+from app.extensions import db, bcrypt
+from app.models import User
+
+DURATION = 3.0
+
+
+def main():
+    rounds_list = [int(arg) for arg in sys.argv[1:]] or [10, 11, 12]
+    app = create_app("config.TestingConfig")
+    client = app.test_client()
+    facade = get_facade()
+
+    print(f"{'rounds':>6} | {'ms/login':>9} | {'logins/s/core':>13}")
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        user = User(first_name="Bench", last_name="User", email="bench@hbnb.com", password="bench")
+        db.session.add(user)
+        db.session.commit()
+
+        for rounds in rounds_list:
+            # Hash at the measured cost and keep it (no rehash during the run)
+            user.password_hash = bcrypt.generate_password_hash("bench", rounds).decode('utf-8')
+            db.session.commit()
+            facade.log_rounds = rounds
+
+            count = 0
+            start = time.perf_counter()
+            while time.perf_counter() - start < DURATION:
+                response = client.post('/api/v2/auth/login',
+                                       json={'email': "bench@hbnb.com", 'password': "bench"})
+                assert response.status_code == 200
+                count += 1
+            elapsed = time.perf_counter() - start
+            print(f"{rounds:>6} | {elapsed / count * 1000:>9.1f} | {count / elapsed:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
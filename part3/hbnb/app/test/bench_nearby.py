@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the grid-indexed nearby search against a full table scan.
+Run from project root: python app/test/bench_nearby.py [sizes...]
+Default sizes: 10000 100000 1000000
+"""
+
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from app import create_app, get_facade
+from app.extensions import db
+from app.models import User, Place
+from app.services.geo import geo_cell, haversine_km
+
+QUERIES = 50
+RADIUS_KM = 10
+CHUNK = 50000
+
+
+def seed_places(count, owner_id):
+    """Insert places spread over Europe in executemany chunks."""
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    table = Place.__table__
+    for start in range(0, count, CHUNK):
+        rows = []
+        for _ in range(min(CHUNK, count - start)):
+            latitude = rng.uniform(36.0, 60.0)
+            longitude = rng.uniform(-10.0, 30.0)
+            rows.append({
+                'id': str(uuid.uuid4()), 'title': 'Bench', 'price': 50.0,
+                'latitude': latitude, 'longitude': longitude,
+                'geo_cell': geo_cell(latitude, longitude),
+                'owner_id': owner_id, 'created_at': now, 'updated_at': now
+            })
+        db.session.execute(table.insert(), rows)
+    db.session.commit()
+
+
+def full_scan(latitude, longitude):
+    rows = db.session.execute(db.select(Place.latitude, Place.longitude))
+    return sum(1 for lat, lng in rows if haversine_km(latitude, longitude, lat, lng) <= RADIUS_KM)
+
+
+def timed(fn, points):
+    start = time.perf_counter()
+    for latitude, longitude in points:
+        fn(latitude, longitude)
+    return (time.perf_counter() - start) / len(points) * 1000
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000]
+    app = create_app("config.TestingConfig")
+    facade = get_facade()
+    rng = random.Random(7)
+    points = [(rng.uniform(40.0, 55.0), rng.uniform(-5.0, 25.0)) for _ in range(QUERIES)]
+
+    print(f"{'places':>10} | {'grid ms/query':>14} | {'scan ms/query':>14}")
+    with app.app_context():
+        for size in sizes:
+            db.drop_all()
+            db.create_all()
+            owner = User(first_name="Bench", last_name="Host", email="bench@hbnb.com", password="bench")
+            db.session.add(owner)
+            db.session.commit()
+            seed_places(size, owner.id)
+
+            grid_ms = timed(lambda lat, lng: facade.get_places_nearby(lat, lng, RADIUS_KM, limit=100), points)
+            # A scan is linear in the table size, a handful of queries is enough
+            scan_ms = timed(full_scan, points[:3])
+            print(f"{size:>10} | {grid_ms:>14.2f} | {scan_ms:>14.2f}")
+            db.session.remove()
+
+
+if __name__ == '__main__':
+    main()
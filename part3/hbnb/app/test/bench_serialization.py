@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the per-row cost of listing reviews, on an in-memory SQLite database:
+- marshal: entities loaded (authors and places batch-attached), to_dict(), marshal(), json
+- compiled: column rows encoded by the review RowSerializer, with json and with orjson
+Run from project root: python app/test/bench_serialization.py [reviews] [runs]
+Default: 10000 reviews, best of 5 runs
+"""
+
+import json
+import os
+import sys
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from flask_restx import marshal
+
+from app import create_app, get_facade
+from app.extensions import db
+from app.models import Place, Review, User
+
+
+def seed(count):
+    side = int(count ** 0.5) + 1
+    users = [User(first_name="Bench", last_name=f"User {i}", email=f"user{i}@hbnb.com",
+                  password_hash="x") for i in range(side)]
+    db.session.add_all(users)
+    db.session.flush()
+    places = [Place(title=f"Place {i}", price=100.0, latitude=45.0, longitude=2.0,
+                    owner_id=users[0].id) for i in range(side)]
+    db.session.add_all(places)
+    db.session.flush()
+    db.session.add_all(Review(text="A fine stay, would come back.", rating=1 + n % 5,
+                              user_id=users[n % side].id, place_id=places[n // side].id)
+                       for n in range(count))
+    db.session.commit()
+
+
+def best(runs, fn):
+    timings = []
+    for _ in range(runs):
+        db.session.expunge_all()
+        start = time.perf_counter()
+        size = len(fn())
+        timings.append(time.perf_counter() - start)
+    return min(timings), size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    app = create_app("config.TestingConfig")
+    with app.app_context():
+        db.create_all()
+        seed(count)
+        facade = get_facade()
+
+        from app.api.v2 import serializers
+        from app.api.v2.reviews import review_response_model, review_rows
+
+        def marshalled():
+            reviews = facade.get_all_reviews()
+            data = marshal([review.to_dict() for review in reviews], review_response_model)
+            return (json.dumps(data) + "\n").encode('utf-8')
+
+        def compiled():
+            return review_rows.dumps(facade.get_review_rows(review_rows.columns))
+
+        orjson = serializers.orjson
+        paths = [('marshal', marshalled, None), ('compiled+json', compiled, None)]
+        if orjson is not None:
+            paths.append(('compiled+orjson', compiled, orjson))
+
+        print(f"{count} reviews, best of {runs}")
+        print(f"{'path':>15} | {'total ms':>9} | {'us/row':>7} | {'bytes':>9}")
+        for name, fn, encoder in paths:
+            serializers.orjson = encoder
+            elapsed, size = best(runs, fn)
+            print(f"{name:>15} | {elapsed * 1000:>9.1f} | {elapsed / count * 1e6:>7.2f} | {size:>9}")
+        serializers.orjson = orjson
+
+
+if __name__ == '__main__':
+    main()
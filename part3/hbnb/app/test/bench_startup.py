@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark of worker boot time: each run is a fresh interpreter importing the
+app and calling create_app, as an autoscaled worker does.
+Bytecode must be cached for meaningful numbers (run once to warm it up).
+Run from project root: python app/test/bench_startup.py [runs]
+Default: 10 runs per profile
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PROFILES = {
+    'docs on': 'config.TestingConfig',
+    'docs off': 'config.ProductionConfig',
+}
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app(sys.argv[1])
+print(json.dumps({'import_ms': (imported - start) * 1000, **app.extensions['startup']}))
+"""
+
+
+def boot(config_class):
+    # ProductionConfig pool options need a file database; create_app never connects
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(tempfile.gettempdir(), 'bench_startup.db')}")
+    output = subprocess.run([sys.executable, '-W', 'ignore', '-c', CHILD, config_class],
+                            cwd=project_root, env=env, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"{'profile':>9} | {'import ms':>9} | {'create_app ms':>13} | slowest phases")
+    for name, config_class in PROFILES.items():
+        boot(config_class)  # warm the bytecode cache
+        samples = [boot(config_class) for _ in range(runs)]
+        phases = {phase: statistics.median(s['phases_ms'][phase] for s in samples)
+                  for phase in samples[0]['phases_ms']}
+        slowest = ", ".join(f"{phase} {ms:.0f}" for phase, ms in
+                            sorted(phases.items(), key=lambda item: -item[1])[:3])
+        print(f"{name:>9} | {statistics.median(s['import_ms'] for s in samples):>9.0f} | "
+              f"{statistics.median(s['total_ms'] for s in samples):>13.0f} | {slowest}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Fixtures shared by the test modules: the testing app on a fresh schema, its
+test client and facade, the usual host / guest / admin users, a place of the
+host and access tokens.
+"""
+
+import os
+import sys
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from app import create_app, get_facade
+from app.extensions import db
+
+
+@pytest.fixture
+def app():
+    """The testing app on an empty schema, inside its app context."""
+    app = create_app("config.TestingConfig")
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+        yield app
+
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def facade(app):
+    """The app's facade, its entity cache emptied (it outlives the app)."""
+    facade = get_facade()
+    if facade.cache is not None:
+        facade.cache.clear()
+    return facade
+
+
+@pytest.fixture
+def host(facade):
+    return facade.create_user({'first_name': "Host", 'last_name': "Test",
+                               'email': "host@hbnb.com", 'password': "host123"})
+
+
+@pytest.fixture
+def guest(facade):
+    return facade.create_user({'first_name': "Guest", 'last_name': "Test",
+                               'email': "guest@hbnb.com", 'password': "guest123"})
+
+
+@pytest.fixture
+def admin(facade):
+    return facade.create_user({'first_name': "Admin", 'last_name': "Test",
+                               'email': "admin@hbnb.com", 'password': "admin123", 'is_admin': True})
+
+
+@pytest.fixture
+def seeded_place(facade, host):
+    """A place of the host, without amenities or reviews."""
+    return facade.create_place({'title': "Loft", 'price': 80.0, 'owner_id': host.id,
+                                'latitude': 48.8, 'longitude': 2.3})
+
+
+@pytest.fixture
+def access_token(app):
+    """access_token(user) -> an access token of user, with its is_admin claim."""
+    def make(user) -> str:
+        return create_access_token(identity=user.id, additional_claims={'is_admin': bool(user.is_admin)})
+    return make
+
+
+@pytest.fixture
+def auth_headers(access_token):
+    """auth_headers(user) -> the Authorization header of an access token of user."""
+    def make(user) -> dict:
+        return {'Authorization': f'Bearer {access_token(user)}'}
+    return make
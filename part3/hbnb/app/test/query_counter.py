@@ -0,0 +1,34 @@
+"""
+Query-counting harness for the tests: collect the SQL statements an
+endpoint or a facade call sends to the database.
+"""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.extensions import db
+
+
+@contextmanager
+def count_queries():
+    """Collect every SQL statement sent to the database inside the block (needs an app context)."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        # The BEGIN of each transaction is not a query
+        if statement != "BEGIN":
+            statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def fresh_request(facade) -> None:
+    """Start the next request cold: empty identity map and entity cache."""
+    db.session.expunge_all()
+    if facade.cache is not None:
+        facade.cache.clear()
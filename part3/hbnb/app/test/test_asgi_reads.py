@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Tests for the ASGI entry point: async read routes answer like the Flask ones
+Run from project root: python -m pytest app/test/test_asgi_reads.py
+"""
+
+import asyncio
+import json
+import re
+
+import pytest
+
+pytest.importorskip('aiosqlite')
+pytest.importorskip('greenlet')
+pytest.importorskip('a2wsgi')
+
+from app import get_facade
+from app.asgi import create_asgi_app
+from app.extensions import db
+from config import TestingConfig
+
+PLACES = 25
+
+
+@pytest.fixture
+def setup(tmp_path):
+    # Async and sync engines must reach the same database: no :memory:
+    config_class = type('AsgiTestingConfig', (TestingConfig,), {
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'asgi.db'}"
+    })
+    asgi_app = create_asgi_app(config_class)
+    flask_app = asgi_app.flask_app
+    loop = asyncio.new_event_loop()
+    with flask_app.app_context():
+        db.create_all()
+        facade = get_facade()
+        facade.create_amenity({'name': "WiFi"})
+        facade.create_amenity({'name': "Pool"})
+        host = facade.create_user({'first_name': "Host", 'last_name': "Test",
+                                   'email': "host@hbnb.com", 'password': "host123"})
+        guests = [facade.create_user({'first_name': "Guest", 'last_name': f"Test {i}",
+                                      'email': f"guest{i}@hbnb.com", 'password': "guest123"})
+                  for i in range(2)]
+        place_ids = [facade.create_place({'title': f"Place {i}", 'price': 50.0 + i, 'owner_id': host.id,
+                                          'latitude': 48.8, 'longitude': 2.3,
+                                          'amenities': ["WiFi"] if i % 2 else []}).id
+                     for i in range(PLACES)]
+        for user in guests:
+            facade.create_review({'text': "Nice", 'rating': 4, 'user_id': user.id,
+                                  'place_id': place_ids[0]})
+        db.session.remove()
+
+        yield asgi_app, flask_app.test_client(), loop, place_ids
+
+        loop.run_until_complete(asgi_app.session_factory.kw['bind'].dispose())
+        loop.close()
+        db.session.remove()
+        db.drop_all()
+
+
+def call(asgi_app, loop, path, query='', headers=None, method='GET'):
+    """Run one request through the ASGI app and return (status, headers, body)."""
+    scope = {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+        'method': method, 'scheme': 'http', 'path': path, 'raw_path': path.encode(),
+        'root_path': '', 'query_string': query.encode(), 'server': ('testserver', 80),
+        'client': ('127.0.0.1', 5000),
+        'headers': [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()],
+    }
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    loop.run_until_complete(asgi_app(scope, receive, send))
+    start = messages[0]
+    response_headers = {name.decode().lower(): value.decode() for name, value in start['headers']}
+    body = b''.join(message.get('body', b'') for message in messages[1:])
+    return start['status'], response_headers, body
+
+
+def test_async_routes_match_flask(setup):
+    asgi_app, client, loop, place_ids = setup
+    urls = [
+        ('/api/v2/places/', 'limit=10'),
+        ('/api/v2/places/', 'amenities=WiFi&min_price=55'),
+        (f'/api/v2/places/{place_ids[0]}', ''),
+        (f'/api/v2/reviews/places/{place_ids[0]}/reviews', ''),
+        ('/api/v2/amenities/', ''),
+    ]
+    for path, query in urls:
+        assert asgi_app.match({'method': 'GET', 'path': path}) is not None, path
+        status, headers, body = call(asgi_app, loop, path, query)
+        expected = client.get(f'{path}?{query}')
+        assert status == expected.status_code == 200
+        assert headers['etag'] == expected.headers['ETag']
+        assert headers.get('x-next-cursor') == expected.headers.get('X-Next-Cursor')
+        assert json.loads(body) == expected.get_json()
+
+
+def test_pagination_and_conditional_get(setup):
+    asgi_app, client, loop, place_ids = setup
+    status, headers, body = call(asgi_app, loop, '/api/v2/places/', 'limit=20')
+    assert status == 200 and headers['x-next-cursor']
+    status, _, body = call(asgi_app, loop, '/api/v2/places/', f"limit=20&cursor={headers['x-next-cursor']}")
+    assert status == 200 and body.count(b'"title"') == PLACES - 20
+
+    path = f'/api/v2/places/{place_ids[1]}'
+    _, headers, _ = call(asgi_app, loop, path)
+    status, revalidated, body = call(asgi_app, loop, path, headers={'If-None-Match': headers['etag']})
+    assert status == 304 and body == b''
+    assert revalidated['etag'] == headers['etag']
+
+    # Reviews of an empty place, then of the same place deleted
+    path = f'/api/v2/reviews/places/{place_ids[1]}/reviews'
+    _, headers, _ = call(asgi_app, loop, path)
+    assert call(asgi_app, loop, path, headers={'If-None-Match': headers['etag']})[0] == 304
+    with asgi_app.flask_app.app_context():
+        get_facade().delete_place(place_ids[1])
+    assert call(asgi_app, loop, path, headers={'If-None-Match': headers['etag']})[0] == 404
+
+
+def test_errors_and_cors(setup):
+    asgi_app, client, loop, place_ids = setup
+    status, _, body = call(asgi_app, loop, '/api/v2/places/missing')
+    assert status == 404 and b"Place with ID missing not found." in body
+    status, _, _ = call(asgi_app, loop, '/api/v2/reviews/places/missing/reviews')
+    assert status == 404
+    status, _, body = call(asgi_app, loop, '/api/v2/places/', 'cursor=zz')
+    assert status == 400 and b"Invalid pagination cursor." in body
+    status, _, body = call(asgi_app, loop, '/api/v2/places/', 'max_price=cheap')
+    assert status == 400 and b"max_price must be a number." in body
+
+    _, headers, _ = call(asgi_app, loop, '/api/v2/amenities/', headers={'Origin': "http://front.example"})
+    assert headers['access-control-allow-origin'] == "http://front.example"
+    assert 'ETag' in headers['access-control-expose-headers']
+
+
+def test_other_routes_fall_back_to_flask(setup):
+    asgi_app, client, loop, place_ids = setup
+    assert asgi_app.match({'method': 'GET', 'path': '/api/v2/places/nearby'}) is None
+    assert asgi_app.match({'method': 'PUT', 'path': f'/api/v2/places/{place_ids[0]}'}) is None
+
+    status, _, body = call(asgi_app, loop, '/api/v2/places/nearby', 'lat=48.8&lng=2.3&radius_km=5')
+    assert status == 200 and body.count(b'"distance_km"') == 20
+    status, _, _ = call(asgi_app, loop, f'/api/v2/places/{place_ids[0]}', method='DELETE')
+    assert status == 401
+
+
+def test_unexpected_errors_answer_500_with_cors(setup, monkeypatch):
+    asgi_app, client, loop, place_ids = setup
+
+    async def broken(session, request, **kwargs):
+        raise RuntimeError("database went away")
+
+    monkeypatch.setattr(asgi_app, 'routes', [('GET', re.compile(r'^/api/v2/amenities/$'), broken)])
+    status, headers, body = call(asgi_app, loop, '/api/v2/amenities/', headers={'Origin': "http://front.example"})
+    assert status == 500
+    assert json.loads(body) == {'message': "Internal Server Error"}
+    assert headers['content-type'] == 'application/json'
+    assert headers['access-control-allow-origin'] == "http://front.example"
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for login: configurable bcrypt cost, rehash-on-login and the bounded verifier pool
+Run from project root: python -m pytest app/test/test_auth_login.py
+"""
+
+import pytest
+
+from app.extensions import db, bcrypt
+from app.models import User
+from app.services.passwords import PasswordVerifier, PasswordVerifierBusy
+
+LOGIN_URL = '/api/v2/auth/login'
+
+
+@pytest.fixture
+def setup(client, facade):
+    facade.create_user({'first_name': "Ann", 'last_name': "Lee",
+                        'email': "ann@hbnb.com", 'password': "secret"})
+    return client, facade
+
+
+def stored_hash():
+    db.session.expire_all()
+    return db.session.scalars(db.select(User.password_hash).filter_by(email="ann@hbnb.com")).one()
+
+
+def test_login_uses_configured_cost(setup):
+    client, facade = setup
+    assert stored_hash().startswith('$2b$04$')
+    response = client.post(LOGIN_URL, json={'email': "ann@hbnb.com", 'password': "secret"})
+    assert response.status_code == 200
+    assert 'access_token' in response.get_json()
+
+
+def test_outdated_hash_is_upgraded_on_login(setup):
+    client, facade = setup
+    user = facade.get_user_by_email("ann@hbnb.com")
+    user.password_hash = bcrypt.generate_password_hash("secret", 5).decode('utf-8')
+    db.session.commit()
+
+    assert client.post(LOGIN_URL, json={'email': "ann@hbnb.com", 'password': "wrong"}).status_code == 401
+    assert stored_hash().startswith('$2b$05$')
+
+    assert client.post(LOGIN_URL, json={'email': "ann@hbnb.com", 'password': "secret"}).status_code == 200
+    assert stored_hash().startswith('$2b$04$')
+
+
+def test_saturated_verifier_fails_fast(setup):
+    client, facade = setup
+    verifier = PasswordVerifier(max_workers=1, max_pending=0)
+    hashed = bcrypt.generate_password_hash("secret", 4).decode('utf-8')
+    assert verifier.verify(hashed, "secret") is True
+
+    verifier._slots.acquire()
+    with pytest.raises(PasswordVerifierBusy):
+        verifier.verify(hashed, "secret")
+
+    previous, facade.password_verifier = facade.password_verifier, verifier
+    try:
+        response = client.post(LOGIN_URL, json={'email': "ann@hbnb.com", 'password': "secret"})
+        assert response.status_code == 503
+    finally:
+        facade.password_verifier = previous
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared authorization module: admin checks, known users and revoked tokens
+Run from project root: python -m pytest app/test/test_authorization.py
+"""
+
+import time
+
+import pytest
+
+from app.api.v2.security import KNOWN_USER_TTL, TokenRegistry, token_registry
+from app.persistence import cache
+
+
+@pytest.fixture
+def setup(client, facade, admin, guest, seeded_place, access_token):
+    token_registry.clear()
+    tokens = {'admin': access_token(admin), 'guest': access_token(guest)}
+    ids = {'admin': admin.id, 'guest': guest.id, 'place': seeded_place.id}
+
+    yield client, facade, tokens, ids
+
+    token_registry.clear()
+
+
+def auth(token):
+    return {'Authorization': f'Bearer {token}'}
+
+
+def test_admin_required_is_shared(setup):
+    client, facade, tokens, ids = setup
+    for url in ('/api/v2/users/', '/api/v2/export/users.ndjson'):
+        assert client.get(url, headers=auth(tokens['guest'])).status_code == 403
+        assert client.get(url, headers=auth(tokens['admin'])).status_code == 200
+    response = client.post('/api/v2/amenities/', json={'name': "WiFi"}, headers=auth(tokens['guest']))
+    assert response.status_code == 403
+    assert response.get_json()['message'] == "Access forbidden: Admin privilege required."
+
+
+def test_known_user_is_checked_once(setup, monkeypatch):
+    client, facade, tokens, ids = setup
+    checks = []
+    user_exists = facade.user_exists
+    monkeypatch.setattr(facade, 'user_exists', lambda user_id: checks.append(user_id) or user_exists(user_id))
+    monkeypatch.setattr(facade, 'get_user', lambda user_id: pytest.fail("get_user called on a write"))
+
+    review = {'text': "Great", 'rating': 5, 'user_id': ids['guest'], 'place_id': ids['place']}
+    assert client.post('/api/v2/reviews/', json=review, headers=auth(tokens['guest'])).status_code == 201
+    place = {'title': "Hut", 'price': 20.0, 'latitude': 45.1, 'longitude': 6.0}
+    assert client.post('/api/v2/places/', json=place, headers=auth(tokens['guest'])).status_code == 201
+    assert checks == [ids['guest']]
+
+
+def test_logout_revokes_the_token(setup):
+    client, facade, tokens, ids = setup
+    assert client.get('/api/v2/auth/protected', headers=auth(tokens['guest'])).status_code == 200
+    assert client.post('/api/v2/auth/logout', headers=auth(tokens['guest'])).status_code == 204
+    assert client.get('/api/v2/auth/protected', headers=auth(tokens['guest'])).status_code == 401
+
+
+def test_deleted_user_tokens_are_rejected(setup):
+    client, facade, tokens, ids = setup
+    place = {'title': "Hut", 'price': 20.0, 'latitude': 45.1, 'longitude': 6.0}
+    assert client.post('/api/v2/places/', json=place, headers=auth(tokens['guest'])).status_code == 201
+
+    response = client.delete(f"/api/v2/users/{ids['guest']}", headers=auth(tokens['admin']))
+    assert response.status_code == 204
+    assert client.post('/api/v2/places/', json=place, headers=auth(tokens['guest'])).status_code == 401
+    assert client.get('/api/v2/auth/protected', headers=auth(tokens['admin'])).status_code == 200
+
+
+def test_known_users_expire_quickly(monkeypatch):
+    # Another worker deleted the user: this registry only learns it from the database
+    registry = TokenRegistry()
+    exists = {'user-1': True}
+    assert registry.is_known_user('user-1', exists.get) is True
+    exists['user-1'] = False
+    assert registry.is_known_user('user-1', exists.get) is True
+
+    now = time.monotonic()
+    monkeypatch.setattr(cache.time, 'monotonic', lambda: now + KNOWN_USER_TTL)
+    assert registry.is_known_user('user-1', exists.get) is False
+    assert KNOWN_USER_TTL <= 10
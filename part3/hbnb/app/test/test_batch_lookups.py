@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the batch repository lookups (get_many, exists_many, get_many_by_attribute)
+Run from project root: python -m pytest app/test/test_batch_lookups.py
+"""
+
+import pytest
+
+from app.extensions import db
+from app.persistence import repository
+from app.test.query_counter import count_queries
+
+
+@pytest.fixture
+def setup(app, facade):
+    users = [facade.create_user({'first_name': f"User{i}", 'last_name': "Test",
+                                 'email': f"user{i}@hbnb.com", 'password': "secret"})
+             for i in range(5)]
+    return app, facade, [user.id for user in users]
+
+
+@pytest.fixture
+def statements():
+    with count_queries() as collected:
+        yield collected
+
+
+def test_get_many_is_keyed_by_id_and_chunked(setup, statements, monkeypatch):
+    app, facade, user_ids = setup
+    monkeypatch.setattr(repository, 'IN_CHUNK_SIZE', 2)
+    users = facade.user_repository.repository
+    db.session.expunge_all()
+
+    found = users.get_many(user_ids + ["unknown", user_ids[0]])
+    assert set(found) == set(user_ids)
+    assert all(found[user_id].id == user_id for user_id in user_ids)
+    # 6 distinct ids in chunks of 2
+    assert len(statements) == 3
+
+    assert users.exists_many([user_ids[1], "unknown"]) == {user_ids[1]}
+    by_email = users.get_many_by_attribute('email', ["user3@hbnb.com", "nobody@hbnb.com"])
+    assert list(by_email) == ["user3@hbnb.com"]
+    assert users.get_many([]) == {}
+
+
+def test_cached_get_many_only_fetches_misses(setup, statements):
+    app, facade, user_ids = setup
+    db.session.expunge_all()
+    facade.user_repository.get(user_ids[0])
+    db.session.expunge_all()
+    statements.clear()
+
+    found = facade.user_repository.get_many(user_ids)
+    assert set(found) == set(user_ids)
+    assert len(statements) == 1
+    db.session.expunge_all()
+    statements.clear()
+
+    assert set(facade.user_repository.get_many(user_ids)) == set(user_ids)
+    assert statements == []
+
+
+def test_review_listing_does_not_query_per_review(setup, statements):
+    app, facade, user_ids = setup
+    client = app.test_client()
+    host = facade.create_user({'first_name': "Host", 'last_name': "Test",
+                               'email': "host@hbnb.com", 'password': "secret"})
+    place_ids = [facade.create_place({'title': f"Place {i}", 'price': 10.0, 'owner_id': host.id,
+                                      'latitude': 1.0, 'longitude': 1.0}).id for i in range(2)]
+
+    counts = []
+    for place_id in place_ids:
+        for user_id in user_ids:
+            facade.create_review({'text': "Nice", 'rating': 4, 'user_id': user_id, 'place_id': place_id})
+            # Measure with cold session and cache, as in a fresh request
+            db.session.expunge_all()
+            facade.cache.clear()
+            statements.clear()
+            response = client.get('/api/v2/reviews/')
+            assert response.status_code == 200
+            assert all(review['user']['id'] in user_ids for review in response.get_json())
+            counts.append(len(statements))
+    assert len(set(counts)) == 1
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tests for the bulk import CLI command and admin endpoint
+Run from project root: python -m pytest app/test/test_bulk_import.py
+"""
+
+import json
+
+import pytest
+
+from app import get_facade
+from app.extensions import db
+from app.jobs import Worker
+from app.models import Job, Place, Review
+from app.persistence import repository
+from app.test.query_counter import count_queries
+
+
+@pytest.fixture
+def setup(app, admin, host, guest, access_token):
+    return app, access_token(admin)
+
+
+def ndjson(*rows):
+    return '\n'.join(row if isinstance(row, str) else json.dumps(row) for row in rows) + '\n'
+
+
+def test_cli_imports_csv_and_ndjson_with_row_errors(setup, tmp_path):
+    app, token = setup
+    runner = app.test_cli_runner()
+
+    amenities = tmp_path / "amenities.csv"
+    amenities.write_text("name\nWiFi\nPool\nWiFi\n")
+    result = runner.invoke(args=['import-data', 'amenities', str(amenities)])
+    assert "2 amenities created, 1 failed out of 3 row(s)." in result.output
+    assert "line 4: Amenity with name 'WiFi' already exists." in result.output
+
+    places = tmp_path / "places.ndjson"
+    places.write_text(ndjson(
+        {'title': "Loft", 'price': 80, 'latitude': 48.8, 'longitude': 2.3,
+         'owner_email': "host@hbnb.com", 'amenities': ["WiFi", "Pool"]},
+        {'title': "Hut", 'price': 20, 'latitude': 45.1, 'longitude': 6.0,
+         'owner_email': "host@hbnb.com"},
+        {'title': "Nowhere", 'price': 20, 'latitude': 145.1, 'longitude': 6.0,
+         'owner_email': "host@hbnb.com"},
+        {'title': "Orphan", 'price': 20, 'latitude': 45.1, 'longitude': 6.0,
+         'owner_email': "nobody@hbnb.com"},
+        "{not json"
+    ))
+    result = runner.invoke(args=['import-data', 'places', str(places), '--chunk-size', '2'])
+    assert "2 places created, 3 failed out of 5 row(s)." in result.output
+
+    loft = db.session.scalars(db.select(Place).filter_by(title="Loft")).one()
+    assert sorted(amenity.name for amenity in loft.amenities) == ["Pool", "WiFi"]
+    assert loft.geo_cell is not None
+
+
+def test_endpoint_imports_reviews_and_updates_aggregates(setup):
+    app, token = setup
+    client = app.test_client()
+    facade = get_facade()
+    host = facade.get_user_by_email("host@hbnb.com")
+    place = facade.create_place({'title': "Loft", 'price': 80.0, 'owner_id': host.id,
+                                 'latitude': 48.8, 'longitude': 2.3})
+    place_id = place.id
+
+    body = ndjson(
+        {'text': "Great", 'rating': 4, 'place_id': place_id, 'user_email': "guest@hbnb.com"},
+        {'text': "Again", 'rating': 2, 'place_id': place_id, 'user_email': "guest@hbnb.com"},
+        {'text': "Mine", 'rating': 5, 'place_id': place_id, 'user_email': "host@hbnb.com"},
+        {'text': "Bad", 'rating': 9, 'place_id': place_id, 'user_email': "admin@hbnb.com"},
+    )
+    response = client.post('/api/v2/import/reviews', data=body,
+                           headers={'Authorization': f'Bearer {token}'},
+                           content_type='application/x-ndjson')
+    assert response.status_code == 200
+    report = response.get_json()
+    assert (report['created'], report['failed']) == (1, 3)
+    assert [error['line'] for error in report['errors']] == [2, 3, 4]
+
+    # The aggregates are rebuilt by the job queued with the chunk
+    job = db.session.scalars(db.select(Job)).one()
+    assert (job.name, job.payload) == ('recompute_ratings', {'place_ids': [place_id]})
+    assert Worker().run_pending()['done'] == 1
+    db.session.expire_all()
+    place = db.session.get(Place, place_id)
+    assert (place.review_count, place.avg_rating) == (1, 4.0)
+    assert db.session.scalar(db.select(db.func.count(Review.id))) == 1
+
+
+def test_endpoint_requires_admin_and_known_kind(setup):
+    app, token = setup
+    client = app.test_client()
+    assert client.post('/api/v2/import/places', data='').status_code == 401
+    response = client.post('/api/v2/import/users', data='',
+                           headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == 400
+
+
+def test_malformed_references_are_row_errors(setup):
+    app, token = setup
+    client = app.test_client()
+    facade = get_facade()
+    host = facade.get_user_by_email("host@hbnb.com")
+    place_id = facade.create_place({'title': "Loft", 'price': 80.0, 'owner_id': host.id,
+                                    'latitude': 48.8, 'longitude': 2.3}).id
+    headers = {'Authorization': f'Bearer {token}'}
+
+    body = ndjson(
+        {'text': "List", 'rating': 4, 'place_id': [place_id], 'user_email': "guest@hbnb.com"},
+        {'text': "Object", 'rating': 4, 'place_id': place_id, 'user_id': {'id': host.id}},
+        {'text': "Partial", 'rating': 4.7, 'place_id': place_id, 'user_email': "guest@hbnb.com"},
+        {'text': "Whole", 'rating': 4.0, 'place_id': place_id, 'user_email': "guest@hbnb.com"},
+    )
+    report = client.post('/api/v2/import/reviews', data=body, headers=headers,
+                         content_type='application/x-ndjson').get_json()
+    assert (report['created'], report['failed']) == (1, 3)
+    assert [error['error'] for error in report['errors']] == [
+        "'place_id' must be a string.", "'user_id' must be a string.", "'rating' must be a whole number."]
+    assert db.session.scalar(db.select(Review.rating)) == 4
+
+    body = ndjson(
+        {'title': "Hut", 'price': 20, 'latitude': 45.1, 'longitude': 6.0, 'owner_id': [host.id]},
+        {'title': "Tent", 'price': 20, 'latitude': 45.1, 'longitude': 6.0, 'owner_id': host.id, 'amenities': 3},
+    )
+    response = client.post('/api/v2/import/places', data=body, headers=headers,
+                           content_type='application/x-ndjson')
+    assert response.status_code == 200
+    assert [error['error'] for error in response.get_json()['errors']] == [
+        "'owner_id' must be a string.", "'amenities' must be a list of names."]
+
+
+def test_lookups_stay_under_the_parameter_bound(setup, monkeypatch):
+    app, token = setup
+    facade = get_facade()
+    names = [f"Amenity {i}" for i in range(5)]
+    for name in names:
+        facade.create_amenity({'name': name})
+    # Chunks of 1000 rows and more must not build IN lists past IN_CHUNK_SIZE values
+    monkeypatch.setattr(repository, 'IN_CHUNK_SIZE', 2)
+    rows = [(i + 1, {'title': f"Hut {i}", 'price': 20, 'latitude': 45.1, 'longitude': 6.0,
+                     'owner_email': "host@hbnb.com", 'amenities': names}, None) for i in range(3)]
+    with count_queries() as statements:
+        report = facade.bulk_import('places', rows, chunk_size=1000)
+    assert (report['created'], report['failed']) == (3, 0)
+    lookups = [statement for statement in statements if statement.startswith("SELECT amenities.name")]
+    assert len(lookups) == 3
+    assert max(statement.count('?') for statement in statements if statement.startswith("SELECT")) <= 2
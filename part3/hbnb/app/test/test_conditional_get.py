@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for conditional GET (ETag / Last-Modified / 304) on the v2 read endpoints
+Run from project root: python -m pytest app/test/test_conditional_get.py
+"""
+
+import pytest
+
+from app.models import Place
+
+
+@pytest.fixture
+def setup(client, facade, seeded_place):
+    amenity = facade.create_amenity({'name': "WiFi"})
+    return client, facade, seeded_place.id, amenity.id
+
+
+def revalidate(client, url, etag):
+    return client.get(url, headers={'If-None-Match': etag})
+
+
+def test_entity_etag_and_304(setup):
+    client, facade, place_id, amenity_id = setup
+    url = f'/api/v2/places/{place_id}'
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first.headers['ETag'] and first.headers['Last-Modified']
+
+    second = revalidate(client, url, first.headers['ETag'])
+    assert second.status_code == 304
+    assert second.data == b''
+    assert second.headers['ETag'] == first.headers['ETag']
+
+    facade.update_place(place_id, {'title': "Renamed loft"})
+    third = revalidate(client, url, first.headers['ETag'])
+    assert third.status_code == 200
+    assert third.get_json()['title'] == "Renamed loft"
+
+
+def test_collection_etag_follows_rows_and_query(setup):
+    client, facade, place_id, amenity_id = setup
+    url = '/api/v2/places/'
+    etag = client.get(url).headers['ETag']
+    assert revalidate(client, url, etag).status_code == 304
+    # Another query string selects other rows, so it has another ETag
+    assert revalidate(client, url + '?max_price=10', etag).status_code == 200
+
+    facade.delete_place(place_id)
+    assert revalidate(client, url, etag).status_code == 200
+
+
+def test_amenity_if_modified_since(setup):
+    client, facade, place_id, amenity_id = setup
+    url = f'/api/v2/amenities/{amenity_id}'
+    last_modified = client.get(url).headers['Last-Modified']
+    response = client.get(url, headers={'If-Modified-Since': last_modified})
+    assert response.status_code == 304
+
+
+def test_missing_entity_is_still_404(setup):
+    client, facade, place_id, amenity_id = setup
+    assert client.get('/api/v2/reviews/unknown').status_code == 404
+
+
+def test_deleted_place_reviews_are_404_not_304(setup):
+    client, facade, place_id, amenity_id = setup
+    url = f'/api/v2/reviews/places/{place_id}/reviews'
+    etag = client.get(url).headers['ETag']
+    assert revalidate(client, url, etag).status_code == 304
+
+    # An empty place and a missing one must not share an ETag
+    facade.delete_place(place_id)
+    assert revalidate(client, url, etag).status_code == 404
+
+
+def test_etags_follow_embedded_rows(setup):
+    client, facade, place_id, amenity_id = setup
+    owner_id = facade.get_owner_id(Place, place_id)
+    guest = facade.create_user({'first_name': "Guest", 'last_name': "Test",
+                                'email': "guest@hbnb.com", 'password': "guest123"})
+    facade.update_place(place_id, {'amenities': ["WiFi"]})
+    facade.create_review({'text': "Nice", 'rating': 4, 'user_id': guest.id, 'place_id': place_id})
+    urls = ['/api/v2/places/', f'/api/v2/places/{place_id}',
+            '/api/v2/reviews/', f'/api/v2/reviews/places/{place_id}/reviews']
+
+    def etags():
+        return {url: client.get(url).headers['ETag'] for url in urls}
+
+    def still_fresh(before):
+        return [url for url in urls if revalidate(client, url, before[url]).status_code == 304]
+
+    # Amenity and owner renames change the places, a place title and an author rename the reviews
+    before = etags()
+    facade.update_amenity(amenity_id, {'name': "Fiber"})
+    assert still_fresh(before) == urls[2:]
+    assert client.get(urls[1]).get_json()['amenities'][0]['name'] == "Fiber"
+
+    before = etags()
+    facade.update_user(owner_id, {'first_name': "Renamed"})
+    assert still_fresh(before) == urls[2:]
+    assert client.get(urls[1]).get_json()['owner']['first_name'] == "Renamed"
+
+    before = etags()
+    facade.update_place(place_id, {'title': "Attic"})
+    assert still_fresh(before) == []
+    before = etags()
+    facade.update_user(guest.id, {'first_name': "Gus"})
+    assert still_fresh(before) == urls[:2]
+
+    before = etags()
+    facade.delete_amenity(amenity_id)
+    assert still_fresh(before) == urls[2:]
+    assert client.get(urls[1]).get_json()['amenities'] == []
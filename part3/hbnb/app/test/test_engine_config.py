@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for the engine tuning profiles (pool options and SQLite pragmas)
+Run from project root: python -m pytest app/test/test_engine_config.py
+"""
+
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.persistence import async_engine
+from app.persistence.async_engine import async_database_url
+from config import TestingConfig, ProductionConfig, SQLITE_TUNED_PRAGMAS
+
+
+def pragma(name):
+    return db.session.execute(db.text(f"PRAGMA {name}")).scalar()
+
+
+def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    class TunedConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'tuned.db'}"
+        SQLITE_PRAGMAS = SQLITE_TUNED_PRAGMAS
+
+    app = create_app(TunedConfig)
+    with app.app_context():
+        assert pragma('journal_mode') == 'wal'
+        assert pragma('synchronous') == 1  # NORMAL
+        assert pragma('mmap_size') == SQLITE_TUNED_PRAGMAS['mmap_size']
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_default_profile_keeps_sqlite_defaults(tmp_path):
+    class PlainConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'plain.db'}"
+
+    app = create_app(PlainConfig)
+    with app.app_context():
+        assert pragma('journal_mode') == 'delete'
+        assert pragma('synchronous') == 2  # FULL
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_production_pool_options(tmp_path):
+    class LocalProductionConfig(ProductionConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'production.db'}"
+
+    app = create_app(LocalProductionConfig)
+    with app.app_context():
+        pool = db.engine.pool
+        options = ProductionConfig.SQLALCHEMY_ENGINE_OPTIONS
+        assert pool.size() == options['pool_size']
+        assert pool._max_overflow == options['max_overflow']
+        assert pool._pre_ping is True
+        assert pool._recycle == options['pool_recycle']
+        assert pragma('journal_mode') == 'wal'
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_async_url_needs_an_installed_driver(monkeypatch):
+    installed = {'aiosqlite', 'aiomysql'}
+    monkeypatch.setattr(async_engine, 'find_spec', lambda name: name if name in installed else None)
+    assert async_database_url("sqlite:////tmp/hbnb.db") == "sqlite+aiosqlite:////tmp/hbnb.db"
+    assert async_database_url("mysql://user:pw@db/hbnb") == "mysql+aiomysql://user:pw@db/hbnb"
+    with pytest.raises(ValueError, match="No asyncio driver"):
+        async_database_url("oracle://db/hbnb")
+
+    # The production profile (MySQL) without aiomysql fails at startup, saying why
+    installed.remove('aiomysql')
+    with pytest.raises(ValueError, match="pip install aiomysql"):
+        async_database_url("mysql://user:pw@db/hbnb")
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Tests for the read-through entity cache (app/persistence/cache.py)
+Run from project root: python -m pytest app/test/test_entity_cache.py
+"""
+
+import importlib
+
+import pytest
+from sqlalchemy import event
+
+from app.extensions import db
+from app.models import User
+from app.jobs import BackgroundWorker, Worker, run_on_commit, worker
+from app.persistence.cache import InMemoryCache, build_cache, entity_key, invalidate_on_commit
+from app.services import HBnBFacade
+from app.test.query_counter import count_queries
+
+
+def new_session():
+    """Simulate the next request: nothing left in the identity map."""
+    db.session.remove()
+
+
+def count_statements(fn):
+    with count_queries() as statements:
+        result = fn()
+    return result, len(statements)
+
+
+def test_lru_eviction_and_ttl():
+    cache = InMemoryCache(max_entries=2, ttl=60)
+    cache.set('a', {'v': 1})
+    cache.set('b', {'v': 2})
+    cache.get('a')
+    cache.set('c', {'v': 3})
+    assert cache.get('b') is None
+    assert cache.get('a') == {'v': 1}
+    assert cache.stats() == {'hits': 2, 'misses': 1, 'evictions': 1, 'size': 2}
+
+    expired = InMemoryCache(ttl=0)
+    expired.set('a', {'v': 1})
+    assert expired.get('a') is None
+
+
+def test_cached_get_skips_database(facade):
+    user = facade.create_user({'first_name': "Ann", 'last_name': "Lee",
+                               'email': "ann@hbnb.com", 'password': "ann123"})
+    user_id = user.id
+    new_session()
+    facade.get_user(user_id)
+    new_session()
+
+    cached, statements = count_statements(lambda: facade.get_user(user_id))
+    assert statements == 0
+    assert cached.email == "ann@hbnb.com"
+    assert facade.cache.hits >= 1
+
+
+def test_update_and_delete_invalidate(facade):
+    user = facade.create_user({'first_name': "Ann", 'last_name': "Lee",
+                               'email': "ann@hbnb.com", 'password': "ann123"})
+    user_id = user.id
+    new_session()
+    facade.get_user(user_id)
+    new_session()
+
+    # The instance rebuilt from the cache can be modified like any other
+    facade.update_user(user_id, {'first_name': "Anna"})
+    new_session()
+    assert facade.get_user(user_id).first_name == "Anna"
+
+    new_session()
+    assert facade.delete_user(user_id) is True
+    new_session()
+    assert facade.get_user(user_id) is None
+
+
+def test_place_details_served_from_cache_and_refreshed_by_reviews(facade):
+    host = facade.create_user({'first_name': "Host", 'last_name': "Test",
+                               'email': "host@hbnb.com", 'password': "host123"})
+    guest = facade.create_user({'first_name': "Guest", 'last_name': "Test",
+                                'email': "guest@hbnb.com", 'password': "guest123"})
+    place = facade.create_place({'title': "Loft", 'price': 80.0, 'owner_id': host.id,
+                                 'latitude': 48.8, 'longitude': 2.3})
+    place_id, guest_id = place.id, guest.id
+    new_session()
+
+    facade.get_place_details(place_id)
+    details, statements = count_statements(lambda: facade.get_place_details(place_id))
+    assert statements == 0
+    assert details['review_count'] == 0
+
+    facade.create_review({'text': "Great", 'rating': 5, 'user_id': guest_id, 'place_id': place_id})
+    new_session()
+    details = facade.get_place_details(place_id)
+    assert (details['review_count'], details['avg_rating']) == (1, 5.0)
+
+
+def test_credentials_stay_out_of_the_cache(facade):
+    user = facade.create_user({'first_name': "Ann", 'last_name': "Lee",
+                               'email': "ann@hbnb.com", 'password': "ann123"})
+    user_id = user.id
+    new_session()
+    facade.get_user(user_id)
+    assert 'password_hash' not in facade.cache.get(entity_key(User, user_id))
+    new_session()
+
+    # Rebuilt from the cache, then the hash alone is read from the database
+    cached, statements = count_statements(lambda: facade.get_user(user_id))
+    assert statements == 0
+    password_hash, statements = count_statements(lambda: cached.password_hash)
+    assert statements == 1
+    assert cached.verify_password("ann123")
+
+
+def test_production_has_no_per_process_cache(monkeypatch):
+    monkeypatch.delenv('ENTITY_CACHE', raising=False)
+    import config
+    importlib.reload(config)
+    assert config.ProductionConfig.ENTITY_CACHE is None
+    assert build_cache({'ENTITY_CACHE': config.ProductionConfig.ENTITY_CACHE}) is None
+
+
+def test_place_details_follow_owner_and_amenity_renames(facade):
+    host = facade.create_user({'first_name': "Host", 'last_name': "Test",
+                               'email': "host@hbnb.com", 'password': "host123"})
+    wifi = facade.create_amenity({'name': "WiFi"})
+    place = facade.create_place({'title': "Loft", 'price': 80.0, 'owner_id': host.id,
+                                 'latitude': 48.8, 'longitude': 2.3, 'amenities': ["WiFi"]})
+    place_id, host_id, wifi_id = place.id, host.id, wifi.id
+    new_session()
+    facade.get_place_details(place_id)
+
+    facade.update_user(host_id, {'first_name': "Renamed"})
+    facade.update_amenity(wifi_id, {'name': "Fiber"})
+    new_session()
+    details = facade.get_place_details(place_id)
+    assert details['owner']['first_name'] == "Renamed"
+    assert [amenity['name'] for amenity in details['amenities']] == ["Fiber"]
+
+
+def test_commit_listeners_are_registered_once(facade):
+    def listeners():
+        session = db.session()
+        return len(session.dispatch.after_flush), len(session.dispatch.after_commit)
+
+    registered = listeners()
+    try:
+        HBnBFacade(cache=InMemoryCache())
+        HBnBFacade(cache=InMemoryCache())
+        assert listeners() == registered
+    finally:
+        invalidate_on_commit(facade.cache, facade._cache_keys)
+
+    try:
+        run_on_commit(BackgroundWorker(Worker()))
+        run_on_commit(BackgroundWorker(Worker()))
+        assert listeners() == (registered[0], registered[1] + 1)
+    finally:
+        # The testing app runs no jobs in process
+        event.remove(db.session, 'after_commit', worker._after_commit)
+        event.remove(db.session, 'after_rollback', worker._after_rollback)
+        worker._runner = None
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Index tests: the hot facade queries must not fall back to full table scans,
+and the index migration must bring an existing database up to date
+Run from project root: python -m pytest app/test/test_indexes.py
+"""
+
+import re
+
+import pytest
+from sqlalchemy import event, inspect
+
+from app.extensions import db
+from app.migrations import upgrade, pending
+from app.models import Amenity, Review, User
+
+# "SCAN reviews" is a full scan, "SCAN reviews USING INDEX ..." walks an index
+FULL_SCAN = re.compile(r'\bSCAN (?:TABLE )?(reviews|places|place_amenity|users|amenities)\b(?! USING)')
+
+
+@pytest.fixture
+def setup(facade, host, guest):
+    wifi = facade.create_amenity({'name': "WiFi"})
+    place = facade.create_place({'title': "Loft", 'price': 80.0, 'owner_id': host.id,
+                                 'latitude': 48.8, 'longitude': 2.3, 'amenities': ["WiFi"]})
+    facade.create_review({'text': "Nice", 'rating': 4, 'user_id': guest.id, 'place_id': place.id})
+    ids = {'host': host.id, 'guest': guest.id, 'place': place.id, 'amenity': wifi.id}
+    db.session.expunge_all()
+    return facade, ids
+
+
+def captured_statements(action):
+    """Run action and return the (statement, parameters) it sent to the database."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        action()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    return statements
+
+
+def full_scans(statements):
+    scans = []
+    for statement, parameters in statements:
+        plan = db.session.connection().exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)
+        for row in plan:
+            if FULL_SCAN.search(row[-1]):
+                scans.append((row[-1], statement))
+    return scans
+
+
+HOT_QUERIES = {
+    'reviews of a place': lambda facade, ids: facade.get_reviews_by_place(ids['place']),
+    'review collection version': lambda facade, ids: facade.get_collection_version(Review, place_id=ids['place']),
+    'duplicate review check': lambda facade, ids: facade.user_has_reviewed_place(ids['guest'], ids['place']),
+    "user's places": lambda facade, ids: db.session.get(User, ids['host']).places,
+    'places of an amenity': lambda facade, ids: db.session.get(Amenity, ids['amenity']).places.all(),
+    'price filter': lambda facade, ids: facade.get_places_page(filters={'max_price': 100}, projection=()),
+    'amenity filter': lambda facade, ids: facade.get_places_page(filters={'amenities': ["WiFi"]}, projection=()),
+    "user's review aggregates": lambda facade, ids: facade.delete_user(ids['guest']),
+}
+
+
+@pytest.mark.parametrize('name', HOT_QUERIES)
+def test_hot_query_uses_indexes(setup, name):
+    facade, ids = setup
+    statements = captured_statements(lambda: HOT_QUERIES[name](facade, ids))
+    assert statements
+    assert full_scans(statements) == []
+
+
+def test_migration_adds_missing_indexes(setup):
+    connection = db.session.connection()
+    for index in ('ix_reviews_place_id_created_at', 'ix_places_owner_id',
+                  'ix_place_amenity_amenity_id_place_id'):
+        connection.exec_driver_sql(f"DROP INDEX {index}")
+    db.session.commit()
+    assert FULL_SCAN.search(" ".join(row[-1] for row in db.session.connection().exec_driver_sql(
+        "EXPLAIN QUERY PLAN SELECT id FROM reviews WHERE place_id = ?", ("x",))))
+
+    # The baseline finds its tables (and version columns) in place, the index migration restores the indexes
+    expected = ['0000_initial_schema', '0001_hot_query_indexes', '0002_entity_versions',
+                '0003_soft_deletes', '0004_soft_delete_indexes', '0005_jobs',
+                '0006_place_listing_columns', '0007_place_listing_indexes',
+                '0008_backfill_place_listing_columns']
+    assert [name for _, name in pending(db.engine)] == expected
+    assert upgrade(db.engine) == expected
+    assert pending(db.engine) == []
+    assert upgrade(db.engine) == []
+
+    inspector = inspect(db.engine)
+    assert {'ix_reviews_place_id_created_at'} <= {i['name'] for i in inspector.get_indexes('reviews')}
+    assert {'ix_places_owner_id', 'ix_places_price'} <= {i['name'] for i in inspector.get_indexes('places')}
+    assert 'ix_place_amenity_amenity_id_place_id' in {i['name'] for i in inspector.get_indexes('place_amenity')}
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for the background job queue: enqueue in the unit of work, worker, retries with backoff
+Run from project root: python -m pytest app/test/test_jobs.py
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.extensions import db
+from app.jobs import JOBS, BackgroundWorker, Worker, enqueue, job
+from app.models import Job, Place
+
+calls = []
+
+
+@job('test_flaky', max_attempts=3)
+def flaky(fail_times=0):
+    calls.append(fail_times)
+    if len(calls) <= fail_times:
+        raise RuntimeError(f"failure {len(calls)}")
+
+
+@pytest.fixture
+def setup(app, facade, seeded_place):
+    calls.clear()
+    return app, facade, seeded_place.id
+
+
+def jobs():
+    db.session.expire_all()
+    return db.session.scalars(db.select(Job).order_by(Job.created_at)).all()
+
+
+def test_jobs_commit_with_the_unit_of_work(setup):
+    app, facade, place_id = setup
+    with pytest.raises(RuntimeError):
+        with facade.transaction():
+            facade.enqueue('test_flaky')
+            raise RuntimeError("request failed")
+    assert jobs() == []
+
+    with facade.transaction():
+        assert facade.enqueue('test_flaky') is True
+        # Same name and payload: the waiting job is reused
+        assert facade.enqueue('test_flaky') is False
+        assert facade.enqueue('test_flaky', fail_times=1) is True
+    assert [(queued.payload, queued.status) for queued in jobs()] == [({}, 'queued'), ({'fail_times': 1}, 'queued')]
+
+    with pytest.raises(ValueError, match="Unknown job"):
+        enqueue('no_such_job')
+
+
+def test_failures_are_retried_with_backoff(setup):
+    app, facade, place_id = setup
+    with facade.transaction():
+        facade.enqueue('test_flaky', fail_times=5)
+    worker = Worker(backoff_base=5, backoff_max=8)
+    start = datetime.utcnow()
+
+    assert worker.run_pending(now=start) == {'done': 0, 'retried': 1, 'failed': 0}
+    [failed_once] = jobs()
+    assert (failed_once.status, failed_once.attempts) == ('queued', 1)
+    assert failed_once.run_after == start + timedelta(seconds=5)
+    assert failed_once.last_error == "RuntimeError: failure 1"
+
+    # Not due before its backoff, then 10s capped to 8s
+    assert worker.run_pending(now=start + timedelta(seconds=4)) == {'done': 0, 'retried': 0, 'failed': 0}
+    assert worker.run_pending(now=start + timedelta(seconds=5))['retried'] == 1
+    assert jobs()[0].run_after == start + timedelta(seconds=13)
+
+    # Third attempt of three: kept as failed, never claimed again
+    assert worker.run_pending(now=start + timedelta(seconds=13))['failed'] == 1
+    assert [(failed.status, failed.attempts) for failed in jobs()] == [('failed', 3)]
+    assert worker.run_pending(now=start + timedelta(days=1))['failed'] == 0
+    assert len(calls) == 3
+
+    # A new copy can be queued while the failed one stays for inspection
+    with facade.transaction():
+        assert facade.enqueue('test_flaky', fail_times=5) is True
+
+
+def test_successful_jobs_leave_the_table(setup):
+    app, facade, place_id = setup
+    with facade.transaction():
+        facade.enqueue('test_flaky', fail_times=1)
+    # Without backoff the retry is due again within the same run
+    assert Worker(backoff_base=0).run_pending() == {'done': 1, 'retried': 1, 'failed': 0}
+    assert calls == [1, 1]
+    assert jobs() == []
+
+
+def test_orphaned_jobs_are_taken_over(setup):
+    app, facade, place_id = setup
+    with facade.transaction():
+        facade.enqueue('test_flaky')
+    now = datetime.utcnow()
+    db.session.execute(db.update(Job).values(status=Job.RUNNING, locked_at=now, attempts=1))
+    db.session.commit()
+
+    worker = Worker(lock_timeout=60)
+    assert worker.run_pending(now=now + timedelta(seconds=30))['done'] == 0
+    assert worker.run_pending(now=now + timedelta(seconds=60))['done'] == 1
+    assert calls == [0]
+
+
+def test_follow_up_jobs(setup):
+    app, facade, place_id = setup
+    db.session.execute(db.update(Place).values(review_count=7, rating_sum=35, geo_cell=None))
+    db.session.commit()
+
+    with facade.transaction():
+        facade.enqueue('recompute_ratings', place_ids=[place_id])
+        facade.enqueue('rebuild_geo_index')
+    assert Worker().run_pending() == {'done': 2, 'retried': 0, 'failed': 0}
+
+    db.session.expire_all()
+    place = db.session.get(Place, place_id)
+    assert (place.review_count, place.rating_sum, place.avg_rating) == (0, 0, None)
+    assert place.geo_cell is not None
+
+
+def test_in_process_runner_and_cli(setup):
+    app, facade, place_id = setup
+    assert {'purge_deleted', 'recompute_ratings', 'rebuild_geo_index'} <= set(JOBS)
+    assert BackgroundWorker.from_config(app.config) is None
+
+    with facade.transaction():
+        facade.enqueue('test_flaky')
+    runner = BackgroundWorker(Worker())
+    assert runner.request(app).result(timeout=10) == {'done': 1, 'retried': 0, 'failed': 0}
+    assert calls == [0]
+
+    cli = app.test_cli_runner()
+    assert "queued" in cli.invoke(args=['jobs-enqueue', 'test_flaky', '--payload', '{"fail_times": 0}']).output
+    assert "already waiting" in cli.invoke(args=['jobs-enqueue', 'test_flaky', '--payload', '{"fail_times": 0}']).output
+    assert cli.invoke(args=['jobs-enqueue', 'nope']).exit_code != 0
+    assert "1 job(s) done" in cli.invoke(args=['jobs-worker', '--once']).output
+
+    assert "queued" in cli.invoke(args=['geo-reindex', '--missing-only']).output
+    assert "already waiting" in cli.invoke(args=['geo-reindex', '--missing-only']).output
+    assert [(queued.name, queued.payload) for queued in jobs()] == [('rebuild_geo_index', {'missing_only': True})]
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for the schema migrations: no DDL at startup, and migrations, models
+and app/schema.sql describing the same schema
+Run from project root: python -m pytest app/test/test_migrations.py
+"""
+
+import importlib
+import os
+import sqlite3
+
+from sqlalchemy import create_engine, inspect
+
+from app import create_app
+from app.extensions import db
+from app.migrations import discover, status, upgrade, schema_migrations
+from app.services.geo import geo_cell
+from config import TestingConfig
+
+SCHEMA_SQL = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'schema.sql')
+
+
+def describe(engine):
+    """Tables with their columns, keys and indexes, as seen by the database."""
+    inspector = inspect(engine)
+    schema = {}
+    for table in inspector.get_table_names():
+        if table == schema_migrations.name:
+            continue
+        schema[table] = {
+            # Sorted: ALTER TABLE appends, migrated tables list added columns last
+            'columns': sorted((c['name'], str(c['type']), c['nullable']) for c in inspector.get_columns(table)),
+            'primary_key': inspector.get_pk_constraint(table)['constrained_columns'],
+            'foreign_keys': sorted((tuple(fk['constrained_columns']), fk['referred_table'])
+                                   for fk in inspector.get_foreign_keys(table)),
+            'indexes': sorted((i['name'], tuple(i['column_names']), bool(i['unique']))
+                              for i in inspector.get_indexes(table)),
+            'unique': sorted((u['name'], tuple(u['column_names']))
+                             for u in inspector.get_unique_constraints(table)),
+        }
+    return schema
+
+
+def file_config(path):
+    return type('FileConfig', (TestingConfig,), {'SQLALCHEMY_DATABASE_URI': f"sqlite:///{path}"})
+
+
+def test_create_app_runs_no_ddl(tmp_path):
+    app = create_app(file_config(tmp_path / 'empty.db'))
+    with app.app_context():
+        assert inspect(db.engine).get_table_names() == []
+        db.engine.dispose()
+
+
+def test_migrations_build_the_models_schema(tmp_path):
+    app = create_app(file_config(tmp_path / 'migrated.db'))
+    with app.app_context():
+        assert upgrade(db.engine) == [name for _, name in discover()]
+        assert all(applied for _, _, applied in status(db.engine))
+        migrated = describe(db.engine)
+        db.engine.dispose()
+
+    reference = create_engine(f"sqlite:///{tmp_path / 'models.db'}")
+    db.metadata.create_all(reference)
+    assert migrated == describe(reference)
+
+
+def test_schema_sql_matches_the_models(tmp_path):
+    path = tmp_path / 'script.db'
+    with sqlite3.connect(path) as connection, open(SCHEMA_SQL) as script:
+        connection.executescript(script.read())
+
+    reference = create_engine(f"sqlite:///{tmp_path / 'models.db'}")
+    db.metadata.create_all(reference)
+    assert describe(create_engine(f"sqlite:///{path}")) == describe(reference)
+
+
+def test_upgrade_brings_a_baseline_database_up_to_date(tmp_path):
+    # Built by the former db.create_all(), before the listing columns existed
+    path = tmp_path / 'baseline.db'
+    engine = create_engine(f"sqlite:///{path}")
+    importlib.import_module('app.migrations.0000_initial_schema').metadata.create_all(engine)
+    with engine.begin() as connection:
+        for statement in (
+            "INSERT INTO users (id, first_name, last_name, email, password_hash, is_admin, created_at, updated_at) "
+            "VALUES ('u1', 'Host', 'Test', 'host@hbnb.com', 'x', 0, '2024-01-01', '2024-01-01')",
+            "INSERT INTO users (id, first_name, last_name, email, password_hash, is_admin, created_at, updated_at) "
+            "VALUES ('u2', 'Guest', 'Test', 'guest@hbnb.com', 'x', 0, '2024-01-01', '2024-01-01')",
+            "INSERT INTO places (id, title, price, latitude, longitude, owner_id, created_at, updated_at) "
+            "VALUES ('p1', 'Loft', 80.0, 48.8, 2.3, 'u1', '2024-01-01', '2024-01-01')",
+            "INSERT INTO reviews (id, text, rating, place_id, user_id, created_at, updated_at) "
+            "VALUES ('r1', 'Nice', 4, 'p1', 'u2', '2024-01-01', '2024-01-01')",
+        ):
+            connection.exec_driver_sql(statement)
+    assert 'review_count' not in {c['name'] for c in inspect(engine).get_columns('places')}
+    engine.dispose()
+
+    app = create_app(file_config(path))
+    with app.app_context():
+        upgrade(db.engine)
+        response = app.test_client().get('/api/v2/places/')
+        assert response.status_code == 200
+        [place] = response.get_json()
+        assert (place['review_count'], place['avg_rating']) == (1, 4.0)
+        assert db.session.execute(db.text("SELECT geo_cell FROM places")).scalar() == geo_cell(48.8, 2.3)
+        assert app.test_client().get('/api/v2/places/nearby?lat=48.8&lng=2.3&radius_km=5') \
+            .get_json()[0]['id'] == 'p1'
+        db.session.remove()
+        db.engine.dispose()
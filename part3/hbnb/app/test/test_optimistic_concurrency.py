@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for optimistic concurrency: entity versions and If-Match on PUT/DELETE
+Run from project root: python -m pytest app/test/test_optimistic_concurrency.py
+"""
+
+import pytest
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.extensions import db
+from app.models import Place, Review
+from app.test.query_counter import fresh_request
+
+
+@pytest.fixture
+def setup(client, facade, host, guest, seeded_place, auth_headers):
+    for name in ("WiFi", "Pool"):
+        facade.create_amenity({'name': name})
+    review = facade.create_review({'text': "Nice", 'rating': 4, 'user_id': guest.id, 'place_id': seeded_place.id})
+    headers = {'host': auth_headers(host), 'guest': auth_headers(guest)}
+    ids = {'place': seeded_place.id, 'review': review.id, 'guest': guest.id}
+    return client, facade, ids, headers
+
+
+def version_of(model, entity_id):
+    return db.session.scalar(db.select(model.version).where(model.id == entity_id))
+
+
+def test_every_write_bumps_the_version(setup):
+    client, facade, ids, headers = setup
+    # Creating the review already updated the place's rating aggregates
+    assert version_of(Place, ids['place']) == 2
+    assert version_of(Review, ids['review']) == 1
+
+    facade.update_place(ids['place'], {'title': "Attic"})
+    assert version_of(Place, ids['place']) == 3
+    # Its reviews embed the title
+    assert version_of(Review, ids['review']) == 2
+    # Only the amenity links change: the place is still a new version
+    facade.update_place(ids['place'], {'amenities': ["WiFi"]})
+    assert version_of(Place, ids['place']) == 4
+    facade.update_review(ids['review'], {'rating': 2})
+    assert version_of(Review, ids['review']) == 3
+    assert version_of(Place, ids['place']) == 5
+
+    # Flushes of loaded entities go through version_id_col
+    fresh_request(facade)
+    place = db.session.get(Place, ids['place'])
+    place.price = 90.0
+    db.session.commit()
+    assert version_of(Place, ids['place']) == 6
+
+
+def test_if_match_guards_updates(setup):
+    client, facade, ids, headers = setup
+    url = f"/api/v2/places/{ids['place']}"
+    etag = client.get(url).headers['ETag']
+
+    response = client.put(url, json={'title': "Attic"}, headers={**headers['host'], 'If-Match': etag})
+    assert response.status_code == 200
+    fresh_etag = client.get(url).headers['ETag']
+    assert fresh_etag != etag
+
+    # A second writer holding the old copy is refused and changes nothing
+    response = client.put(url, json={'title': "Studio"}, headers={**headers['host'], 'If-Match': etag})
+    assert response.status_code == 412
+    assert client.get(url).get_json()['title'] == "Attic"
+
+    # It fetches the new version and retries
+    response = client.put(url, json={'title': "Studio"}, headers={**headers['host'], 'If-Match': fresh_etag})
+    assert response.status_code == 200
+    assert response.get_json()['title'] == "Studio"
+
+    # Without If-Match the last writer still wins
+    assert client.put(url, json={'price': 70.0}, headers=headers['host']).status_code == 200
+
+    review_url = f"/api/v2/reviews/{ids['review']}"
+    etag = client.get(review_url).headers['ETag']
+    assert client.put(review_url, json={'rating': 5},
+                      headers={**headers['guest'], 'If-Match': '"stale"'}).status_code == 412
+    assert client.put(review_url, json={'rating': 5},
+                      headers={**headers['guest'], 'If-Match': etag}).status_code == 200
+
+    user_url = f"/api/v2/users/{ids['guest']}"
+    assert client.put(user_url, json={'first_name': "Gus"},
+                      headers={**headers['guest'], 'If-Match': '"stale"'}).status_code == 412
+    assert client.put(user_url, json={'first_name': "Gus"},
+                      headers={**headers['guest'], 'If-Match': '*'}).status_code == 200
+
+
+def test_if_match_guards_deletes(setup):
+    client, facade, ids, headers = setup
+    review_url = f"/api/v2/reviews/{ids['review']}"
+    etag = client.get(review_url).headers['ETag']
+    # Authentication comes first: no token is a 401 whatever the If-Match
+    assert client.delete(review_url, headers={'If-Match': '"stale"'}).status_code == 401
+    assert client.put(review_url, json={'rating': 5}, headers={'If-Match': '"stale"'}).status_code == 401
+    facade.update_review(ids['review'], {'text': "Changed meanwhile"})
+
+    assert client.delete(review_url, headers={**headers['guest'], 'If-Match': etag}).status_code == 412
+    assert db.session.get(Review, ids['review']) is not None
+
+    etag = client.get(review_url).headers['ETag']
+    assert client.delete(review_url, headers={**headers['guest'], 'If-Match': etag}).status_code == 204
+    # Nothing left to match, even with a wildcard
+    assert client.delete(review_url, headers={**headers['guest'], 'If-Match': '*'}).status_code == 412
+
+
+def test_write_between_check_and_update_is_refused(setup):
+    client, facade, ids, headers = setup
+    version = version_of(Place, ids['place'])
+    facade.update_place(ids['place'], {'title': "Concurrent"})
+
+    # The UPDATE only matches the version the client read
+    with pytest.raises(StaleDataError):
+        facade.update_place(ids['place'], {'title': "Late"}, expected_version=version)
+    with pytest.raises(StaleDataError):
+        facade.update_place(ids['place'], {'amenities': ["Pool"]}, expected_version=version)
+    with pytest.raises(StaleDataError):
+        facade.delete_place(ids['place'], expected_version=version)
+    fresh_request(facade)
+    assert db.session.get(Place, ids['place']).title == "Concurrent"
+
+    # A loaded entity changed behind the session's back fails on flush
+    place = db.session.get(Place, ids['place'])
+    db.session.execute(db.update(Place).where(Place.id == ids['place'])
+                       .values(version=Place.version + 1).execution_options(synchronize_session=False))
+    place.title = "Stale"
+    with pytest.raises(StaleDataError):
+        db.session.flush()
+    db.session.rollback()
+
+
+def test_review_delete_racing_a_write_is_refused(setup, monkeypatch):
+    client, facade, ids, headers = setup
+    review_url = f"/api/v2/reviews/{ids['review']}"
+    etag = client.get(review_url).headers['ETag']
+    get_review = facade.get_review
+
+    def get_then_concurrent_write(review_id):
+        # Another request updates the review right after this one loaded it
+        review = get_review(review_id)
+        db.session.execute(db.update(Review).where(Review.id == review_id)
+                           .values(version=Review.version + 1).execution_options(synchronize_session=False))
+        return review
+
+    monkeypatch.setattr(facade, 'get_review', get_then_concurrent_write)
+    response = client.delete(review_url, headers={**headers['guest'], 'If-Match': etag})
+    assert response.status_code == 412
+    monkeypatch.undo()
+    fresh_request(facade)
+    assert facade.get_review(ids['review']) is not None
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests for the paginated place listing (GET /api/v2/places/)
+Run from project root: python -m pytest app/test/test_places_listing.py
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.extensions import db
+from app.models import User, Place, Amenity, Review
+
+PLACES_URL = '/api/v2/places/'
+
+
+@pytest.fixture
+def client(app, facade):
+    owner = User(first_name="Host", last_name="Test", email="host@hbnb.com", password="host123")
+    guest = User(first_name="Guest", last_name="Test", email="guest@hbnb.com", password="guest123")
+    wifi = Amenity(name="WiFi")
+    pool = Amenity(name="Pool")
+    db.session.add_all([owner, guest, wifi, pool])
+
+    start = datetime(2025, 1, 1)
+    for i in range(7):
+        place = Place(
+            title=f"Place {i}",
+            price=10.0 * (i + 1),
+            latitude=48.0,
+            longitude=2.0,
+            owner=owner,
+            # Two places share each timestamp to exercise the id tie-break
+            created_at=start + timedelta(days=i // 2)
+        )
+        # Every place has WiFi, odd places also have a pool
+        place.amenities.append(wifi)
+        if i % 2:
+            place.amenities.append(pool)
+        place.reviews.append(Review(text="Stay", rating=i % 5 + 1, user=guest))
+        db.session.add(place)
+    db.session.commit()
+    # Reviews were inserted directly, rebuild the stored rating aggregates
+    facade.recompute_rating_aggregates()
+    return app.test_client()
+
+
+def test_pages_cover_every_place_once(client):
+    seen = []
+    cursor = None
+    while True:
+        url = f"{PLACES_URL}?limit=3" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url)
+        assert response.status_code == 200
+        page = response.get_json()
+        assert len(page) <= 3
+        seen.extend(place['id'] for place in page)
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            break
+
+    assert len(seen) == 7
+    assert len(set(seen)) == 7
+
+
+def test_default_limit_and_last_page(client):
+    response = client.get(PLACES_URL)
+    assert response.status_code == 200
+    assert len(response.get_json()) == 7
+    assert 'X-Next-Cursor' not in response.headers
+
+
+def test_invalid_cursor_and_limit_are_rejected(client):
+    assert client.get(f"{PLACES_URL}?cursor=not-a-cursor").status_code == 400
+    assert client.get(f"{PLACES_URL}?limit=0").status_code == 400
+
+
+def titles(response):
+    assert response.status_code == 200
+    return sorted(place['title'] for place in response.get_json())
+
+
+def test_price_range_filter(client):
+    response = client.get(f"{PLACES_URL}?min_price=20&max_price=40")
+    assert titles(response) == ["Place 1", "Place 2", "Place 3"]
+
+
+def test_amenities_filter_requires_all(client):
+    response = client.get(f"{PLACES_URL}?amenities=WiFi,Pool")
+    assert titles(response) == ["Place 1", "Place 3", "Place 5"]
+    assert titles(client.get(f"{PLACES_URL}?amenities=Sauna")) == []
+
+
+def test_min_rating_filter(client):
+    response = client.get(f"{PLACES_URL}?min_rating=4")
+    assert titles(response) == ["Place 3", "Place 4"]
+
+
+def test_filters_combine_with_pagination(client):
+    first = client.get(f"{PLACES_URL}?amenities=WiFi&max_price=50&limit=2")
+    cursor = first.headers['X-Next-Cursor']
+    rest = client.get(f"{PLACES_URL}?amenities=WiFi&max_price=50&limit=5&cursor={cursor}")
+    assert len(first.get_json()) + len(rest.get_json()) == 5
+    assert 'X-Next-Cursor' not in rest.headers
+
+
+def test_inverted_price_range_is_rejected(client):
+    assert client.get(f"{PLACES_URL}?min_price=50&max_price=10").status_code == 400
+
+
+@pytest.mark.parametrize('query', ["min_price=cheap", "max_price=", "min_rating=nan",
+                                   "max_price=1e999", "limit=2.5", "limit=ten"])
+def test_malformed_filters_are_rejected(client, query):
+    response = client.get(f"{PLACES_URL}?{query}")
+    assert response.status_code == 400
+    assert query.split('=')[0] in response.get_json()['message']
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for the geospatial place search (GET /api/v2/places/nearby)
+Run from project root: python -m pytest app/test/test_places_nearby.py
+"""
+
+import pytest
+
+from app import get_facade
+from app.extensions import db
+from app.models import Place
+from app.services.geo import geo_cell
+from app.test.query_counter import count_queries
+
+NEARBY_URL = '/api/v2/places/nearby'
+
+PLACES = {
+    "Paris": (48.8566, 2.3522),
+    "Versailles": (48.8049, 2.1204),
+    "Lyon": (45.7640, 4.8357),
+    "Fiji East": (-17.0, 179.9),
+    "Fiji West": (-17.0, -179.9),
+}
+
+
+@pytest.fixture
+def client(app, facade, host):
+    for title, (latitude, longitude) in PLACES.items():
+        facade.create_place({
+            'title': title, 'price': 50.0, 'owner_id': host.id,
+            'latitude': latitude, 'longitude': longitude
+        })
+    return app.test_client()
+
+
+def test_radius_search_sorted_by_distance(client):
+    response = client.get(f"{NEARBY_URL}?lat=48.8566&lng=2.3522&radius_km=30")
+    assert response.status_code == 200
+    places = response.get_json()
+    assert [place['title'] for place in places] == ["Paris", "Versailles"]
+    assert places[0]['distance_km'] == 0
+    assert 15 < places[1]['distance_km'] < 20
+
+
+def test_radius_search_across_antimeridian(client):
+    response = client.get(f"{NEARBY_URL}?lat=-17.0&lng=179.95&radius_km=50")
+    assert sorted(place['title'] for place in response.get_json()) == ["Fiji East", "Fiji West"]
+
+
+def test_update_moves_place_to_new_cell(client):
+    facade = get_facade()
+    lyon = next(place for place in facade.get_all_places() if place.title == "Lyon")
+    facade.update_place(lyon.id, {'latitude': 48.86, 'longitude': 2.35})
+    assert lyon.geo_cell == geo_cell(48.86, 2.35)
+
+    response = client.get(f"{NEARBY_URL}?lat=48.8566&lng=2.3522&radius_km=5")
+    assert sorted(place['title'] for place in response.get_json()) == ["Lyon", "Paris"]
+
+
+def test_invalid_search_parameters(client):
+    assert client.get(f"{NEARBY_URL}?lat=48.8&lng=2.3").status_code == 400
+    assert client.get(f"{NEARBY_URL}?lat=95&lng=2.3&radius_km=5").status_code == 400
+    assert client.get(f"{NEARBY_URL}?lat=48.8&lng=2.3&radius_km=5000").status_code == 400
+
+
+def test_limit_keeps_the_closest(client):
+    response = client.get(f"{NEARBY_URL}?lat=48.80&lng=2.12&radius_km=500&limit=2")
+    assert [place['title'] for place in response.get_json()] == ["Versailles", "Paris"]
+
+
+def test_rebuild_geo_index_in_batches(client):
+    facade = get_facade()
+    db.session.execute(db.update(Place).where(Place.title.in_(["Paris", "Lyon"])).values(geo_cell=None))
+    db.session.execute(db.update(Place).where(Place.title == "Versailles").values(geo_cell=0))
+    db.session.commit()
+
+    with count_queries() as statements:
+        assert facade.rebuild_geo_index(missing_only=True, batch_size=1) == 2
+    assert len([statement for statement in statements if statement.startswith("UPDATE")]) == 2
+    assert db.session.scalar(db.select(Place.geo_cell).where(Place.title == "Versailles")) == 0
+
+    assert facade.rebuild_geo_index(batch_size=2) == len(PLACES)
+    db.session.expire_all()
+    assert all(place.geo_cell == geo_cell(place.latitude, place.longitude) for place in facade.get_all_places())
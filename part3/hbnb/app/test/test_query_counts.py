@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Query-count regression tests: pin the number of SQL statements per endpoint
+Run from project root: python -m pytest app/test/test_query_counts.py
+"""
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+from app import get_facade
+from app.api.v2.security import token_registry
+from app.test.query_counter import count_queries, fresh_request
+
+# (method, url, user allowed to call it, JSON body): SQL statements of a cold request.
+# Counts do not depend on the number of rows listed (no N+1).
+ENDPOINTS = [
+    (('get', '/api/v2/places/', None, None), 3),
+    (('get', '/api/v2/places/{place}', None, None), 3),
+    # Candidate coordinates, then only the places returned, with owner and amenities
+    (('get', '/api/v2/places/nearby?lat=48.8&lng=2.3&radius_km=5', None, None), 4),
+    (('get', '/api/v2/reviews/', None, None), 2),
+    (('get', '/api/v2/reviews/{review}', None, None), 2),
+    (('get', '/api/v2/reviews/places/{place}/reviews', None, None), 3),
+    (('get', '/api/v2/amenities/', None, None), 2),
+    (('get', '/api/v2/amenities/{amenity}', None, None), 2),
+    (('get', '/api/v2/users/', 'admin', None), 1),
+    (('get', '/api/v2/users/{guest}', 'guest', None), 1),
+    (('post', '/api/v2/places/', 'host', {'title': "New", 'price': 10.0,
+                                          'latitude': 1.0, 'longitude': 1.0}), 4),
+    # Updates: the permission check selects the owner id only, then one UPDATE ... RETURNING
+    # renders the response (plus the amenities of a place; a new rating reads the old one
+    # and updates the place's aggregates)
+    (('put', '/api/v2/places/{place}', 'host', {'price': 60.0}), 3),
+    (('put', '/api/v2/reviews/{review}', 'guest', {'text': "Fine", 'rating': 5}), 5),
+    (('put', '/api/v2/reviews/{review}', 'guest', {'text': "Fine"}), 2),
+    # A new name also bumps the rows embedding it (see HBnBFacade._touch_rows): the
+    # user's places and reviews, the amenity's places (the place ids selected for the cache)
+    (('put', '/api/v2/users/{guest}', 'guest', {'first_name': "Gus"}), 4),
+    (('put', '/api/v2/amenities/{amenity}', 'admin', {'name': "Spa"}), 5),
+    # SAVEPOINT, INSERT, RELEASE: the unique index is the duplicate check
+    (('post', '/api/v2/amenities/', 'admin', {'name': "Sauna"}), 3),
+]
+
+
+@pytest.fixture
+def setup(client, facade, host, admin):
+    amenity = None
+    for name in ("WiFi", "Pool"):
+        amenity = facade.create_amenity({'name': name})
+    guests = [
+        facade.create_user({'first_name': f"Guest{i}", 'last_name': "Test",
+                            'email': f"guest{i}@hbnb.com", 'password': "guest123"})
+        for i in range(3)
+    ]
+    place_ids = []
+    review_ids = []
+    for i in range(5):
+        place = facade.create_place({'title': f"Place {i}", 'price': 50.0, 'owner_id': host.id,
+                                     'latitude': 48.8, 'longitude': 2.3,
+                                     'amenities': ["WiFi", "Pool"]})
+        place_ids.append(place.id)
+        for guest in guests:
+            review_ids.append(facade.create_review({'text': "Nice", 'rating': 4,
+                                                    'user_id': guest.id, 'place_id': place.id}).id)
+
+    ids = {'place': place_ids[0], 'review': review_ids[0], 'amenity': amenity.id,
+           'host': host.id, 'guest': guests[0].id, 'admin': admin.id}
+    return client, place_ids, ids
+
+
+def reads_reviews(statements):
+    return any('FROM reviews' in statement for statement in statements)
+
+
+def test_place_list_query_count(setup):
+    client, place_ids, ids = setup
+    with count_queries() as statements:
+        response = client.get('/api/v2/places/')
+    assert response.status_code == 200
+    # ETag version, places joined with owner, then amenities
+    assert len(statements) == 3
+    assert not reads_reviews(statements)
+
+
+def test_place_detail_query_count(setup):
+    client, place_ids, ids = setup
+    with count_queries() as statements:
+        response = client.get(f'/api/v2/places/{place_ids[0]}')
+    assert response.status_code == 200
+    assert len(statements) == 3
+    assert not reads_reviews(statements)
+
+
+def test_place_nearby_query_count(setup):
+    client, place_ids, ids = setup
+    with count_queries() as statements:
+        response = client.get('/api/v2/places/nearby?lat=48.8&lng=2.3&radius_km=5')
+    assert response.status_code == 200
+    assert len(response.get_json()) == 5
+    assert len(statements) == 4
+    assert not reads_reviews(statements)
+
+
+def test_not_modified_skips_loading(setup):
+    client, place_ids, ids = setup
+    etag = client.get(f'/api/v2/places/{place_ids[0]}').headers['ETag']
+    with count_queries() as statements:
+        response = client.get(f'/api/v2/places/{place_ids[0]}', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert len(statements) == 1
+
+
+@pytest.mark.parametrize('request_spec,expected', ENDPOINTS,
+                         ids=[f"{spec[0].upper()} {spec[1]}" for spec, _ in ENDPOINTS])
+def test_endpoint_query_count(setup, request_spec, expected):
+    client, place_ids, ids = setup
+    method, url, caller, body = request_spec
+    headers = None
+    if caller:
+        token = create_access_token(identity=ids[caller], additional_claims={'is_admin': caller == 'admin'})
+        headers = {'Authorization': f'Bearer {token}'}
+
+    fresh_request(get_facade())
+    token_registry.clear()
+    with count_queries() as statements:
+        response = getattr(client, method)(url.format(**ids), headers=headers, json=body)
+    assert response.status_code in (200, 201)
+    assert len(statements) == expected, statements
+
+
+def test_review_queries_load_relations_in_one_step(setup):
+    client, place_ids, ids = setup
+    facade = get_facade()
+    for fetch, expected in ((facade.get_all_reviews, 1),
+                            (lambda: facade.get_reviews_by_place(place_ids[0]), 2)):
+        fresh_request(facade)
+        with count_queries() as statements:
+            reviews = fetch()
+            # Serializing touches review.user and review.place: nothing left to lazy-load
+            [review.to_dict() for review in reviews]
+        assert reviews and len(statements) == expected
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-place rating aggregates (review_count, rating_sum, avg_rating)
+Run from project root: python -m pytest app/test/test_rating_aggregates.py
+"""
+
+import pytest
+
+from app.extensions import db
+from app.models import Place
+
+
+@pytest.fixture
+def setup(app, facade, seeded_place):
+    guests = [
+        facade.create_user({'first_name': f"Guest{i}", 'last_name': "Test",
+                            'email': f"guest{i}@hbnb.com", 'password': "guest123"})
+        for i in range(2)
+    ]
+    return app, facade, seeded_place.id, [guest.id for guest in guests]
+
+
+def aggregates(place_id):
+    place = db.session.get(Place, place_id)
+    db.session.refresh(place)
+    return place.review_count, place.rating_sum, place.avg_rating
+
+
+def test_new_place_has_empty_aggregates(setup):
+    app, facade, place_id, guest_ids = setup
+    assert aggregates(place_id) == (0, 0, None)
+
+
+def test_review_lifecycle_updates_aggregates(setup):
+    app, facade, place_id, guest_ids = setup
+    first = facade.create_review({'text': "Great", 'rating': 5, 'user_id': guest_ids[0], 'place_id': place_id})
+    facade.create_review({'text': "Fine", 'rating': 2, 'user_id': guest_ids[1], 'place_id': place_id})
+    assert aggregates(place_id) == (2, 7, 3.5)
+
+    facade.update_review(first.id, {'rating': 3})
+    assert aggregates(place_id) == (2, 5, 2.5)
+
+    facade.delete_review(first.id)
+    assert aggregates(place_id) == (1, 2, 2.0)
+
+    facade.delete_user(guest_ids[1])
+    assert aggregates(place_id) == (0, 0, None)
+
+
+def test_repair_command_recomputes_aggregates(setup):
+    app, facade, place_id, guest_ids = setup
+    facade.create_review({'text': "Great", 'rating': 4, 'user_id': guest_ids[0], 'place_id': place_id})
+    db.session.execute(db.update(Place).values(review_count=9, rating_sum=1, avg_rating=0.1))
+    db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=['repair-ratings'])
+    assert "1 place(s)" in result.output
+    assert aggregates(place_id) == (1, 4, 4.0)
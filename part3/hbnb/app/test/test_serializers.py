@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled row serializers of the list endpoints
+Run from project root: python -m pytest app/test/test_serializers.py
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+from flask_restx import Model, fields, marshal
+
+from app.models import Amenity, Place, User
+
+
+@pytest.fixture
+def setup(client, facade, host, guest):
+    for name in ("WiFi", "Pool"):
+        facade.create_amenity({'name': name})
+    places = [facade.create_place({'title': f"Place {i}", 'price': 50 + i, 'owner_id': host.id,
+                                   'latitude': 48.8, 'longitude': 2.3,
+                                   'amenities': ["WiFi", "Pool"][:i]}) for i in range(3)]
+    for place in places:
+        facade.create_review({'text': "Nice", 'rating': 4, 'user_id': guest.id, 'place_id': place.id})
+    return client, facade
+
+
+def by_id(items):
+    return sorted(items, key=lambda item: item['id'])
+
+
+def test_lists_match_marshal(setup):
+    client, facade = setup
+    from app.api.v2.places import place_response_model
+    from app.api.v2.reviews import review_response_model
+    from app.api.v2.amenities import amenity_response_model
+
+    places, _ = facade.get_places_page()
+    # Same shape (and ISO 8601 dates) as place details
+    expected = marshal([place.to_dict() for place in places], place_response_model)
+    for place in expected:
+        place['amenities'].sort(key=lambda amenity: amenity['id'])
+    listed = client.get('/api/v2/places/').get_json()
+    for place in listed:
+        place['amenities'].sort(key=lambda amenity: amenity['id'])
+    assert listed == expected
+
+    expected = marshal([review.to_dict() for review in facade.get_all_reviews()], review_response_model)
+    assert by_id(client.get('/api/v2/reviews/').get_json()) == by_id(expected)
+
+    expected = marshal([amenity.to_dict() for amenity in facade.get_all_amenities()], amenity_response_model)
+    assert by_id(client.get('/api/v2/amenities/').get_json()) == by_id(expected)
+
+
+def test_compiled_conversions():
+    from app.api.v2.serializers import RowSerializer
+
+    model = Model('Row', {
+        'id': fields.String(),
+        'price': fields.Float(),
+        'count': fields.Integer(),
+        'label': fields.String(),
+        'created_at': fields.String(),
+        'owner': fields.Nested(Model('Owner', {'email': fields.String()})),
+    })
+    serializer = RowSerializer(model, {
+        'id': Place.id, 'price': Place.price, 'count': Place.review_count,
+        'label': Place.price, 'created_at': Place.created_at, 'owner.email': User.email,
+    })
+    rows = [('p1', 10.5, 2, 10.5, datetime(2025, 1, 2, 3, 4, 5), None),
+            ('p2', None, None, None, None, "a@b.c")]
+    assert json.loads(serializer.dumps(rows)) == marshal([
+        {'id': 'p1', 'price': 10.5, 'count': 2, 'label': 10.5,
+         'created_at': '2025-01-02T03:04:05', 'owner': None},
+        {'id': 'p2', 'price': None, 'count': None, 'label': None, 'created_at': None,
+         'owner': {'email': "a@b.c"}},
+    ], model)
+
+
+def test_missing_column_fails_at_build_time():
+    from app.api.v2.serializers import RowSerializer
+
+    model = Model('Partial', {'id': fields.String(), 'name': fields.String(),
+                              'tags': fields.List(fields.Nested(Model('Tag', {'id': fields.String()})))})
+    with pytest.raises(ValueError, match="no column for field 'name'"):
+        RowSerializer(model, {'id': Amenity.id})
+    with pytest.raises(ValueError, match="no serializer for the items of 'tags'"):
+        RowSerializer(model, {'id': Amenity.id, 'name': Amenity.name})
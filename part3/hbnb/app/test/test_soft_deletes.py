@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tests for soft deletes of users and places and the chunked purge of the deleted rows
+Run from project root: python -m pytest app/test/test_soft_deletes.py
+"""
+
+import pytest
+from sqlalchemy.orm.exc import ObjectDeletedError
+
+from app.extensions import db
+from app.models import Place, Review, User
+from app.models.place import place_amenity
+from app.persistence.repository import DuplicateValueError
+from app.persistence.soft_delete import INCLUDE_DELETED
+from app.jobs import Worker
+from app.models import Job
+from app.test.query_counter import count_queries, fresh_request
+
+
+@pytest.fixture
+def setup(app, facade, admin, host, auth_headers):
+    facade.create_amenity({'name': "WiFi"})
+    other = facade.create_user({'first_name': "Other", 'last_name': "Host",
+                                'email': "other@hbnb.com", 'password': "other123"})
+    places = [facade.create_place({'title': f"Loft {i}", 'price': 80.0, 'owner_id': host.id,
+                                   'latitude': 48.8, 'longitude': 2.3, 'amenities': ["WiFi"]})
+              for i in range(3)]
+    kept = facade.create_place({'title': "Cabin", 'price': 60.0, 'owner_id': other.id,
+                                'latitude': 45.0, 'longitude': 6.0})
+    guests = [facade.create_user({'first_name': "Guest", 'last_name': str(i),
+                                  'email': f"guest{i}@hbnb.com", 'password': "guest123"})
+              for i in range(4)]
+    for guest in guests:
+        for place in places:
+            facade.create_review({'text': "Nice", 'rating': 4, 'user_id': guest.id, 'place_id': place.id})
+    facade.create_review({'text': "Cosy", 'rating': 5, 'user_id': guests[0].id, 'place_id': kept.id})
+    # The host's own review elsewhere goes with them
+    facade.create_review({'text': "Meh", 'rating': 1, 'user_id': host.id, 'place_id': kept.id})
+
+    ids = {'host': host.id, 'kept': kept.id, 'places': [place.id for place in places]}
+    return app, facade, ids, auth_headers(admin)
+
+
+def count(model, include_deleted=False):
+    query = db.select(db.func.count(model.id)).execution_options(**{INCLUDE_DELETED: include_deleted})
+    return db.session.scalar(query)
+
+
+def test_deleted_rows_are_hidden_at_once(setup):
+    app, facade, ids, headers = setup
+    client = app.test_client()
+    place_url = f"/api/v2/places/{ids['places'][0]}"
+    assert client.get(place_url).status_code == 200
+
+    assert client.delete(f"/api/v2/users/{ids['host']}", headers=headers).status_code == 204
+    fresh_request(facade)
+
+    assert facade.get_user(ids['host']) is None
+    assert facade.get_user_by_email("host@hbnb.com") is None
+    assert client.get(place_url).status_code == 404
+    assert [place['id'] for place in client.get("/api/v2/places/").get_json()] == [ids['kept']]
+    assert [review.text for review in facade.get_all_reviews()] == ["Cosy"]
+    assert [row['id'] for row in facade.export_rows('places')] == [ids['kept']]
+
+    # Flagged, not removed yet
+    assert (count(Place), count(Place, include_deleted=True)) == (1, 4)
+    assert (count(Review), count(Review, include_deleted=True)) == (1, 14)
+
+    # The host's review no longer counts in the remaining place's rating
+    kept = client.get(f"/api/v2/places/{ids['kept']}").get_json()
+    assert (kept['review_count'], kept['avg_rating']) == (1, 5.0)
+    facade.recompute_rating_aggregates()
+    fresh_request(facade)
+    assert facade.get_place_details(ids['kept'])['avg_rating'] == 5.0
+
+
+def test_delete_loads_no_children(setup):
+    app, facade, ids, headers = setup
+    fresh_request(facade)
+    with count_queries() as statements:
+        assert facade.delete_user(ids['host']) is True
+    # The user, their reviews per place and the two UPDATEs of that place's rating,
+    # their place ids, three bulk UPDATEs whatever the number of children, and the purge job
+    assert not [statement for statement in statements if statement.startswith("SELECT reviews.id")]
+    updates = [statement for statement in statements if statement.startswith("UPDATE")]
+    assert [statement.split()[1] for statement in updates[-4:]] == ['users', 'jobs', 'places', 'reviews']
+    assert len(statements) == 10
+
+    fresh_request(facade)
+    with count_queries() as statements:
+        assert facade.delete_place(ids['kept']) is True
+    # The purge job of the first delete still waits: it is reused
+    assert len(statements) == 4
+    assert db.session.scalar(db.select(db.func.count(Job.id))) == 1
+    assert count(Place) == 0
+
+
+def test_purge_removes_children_in_chunks(setup):
+    app, facade, ids, headers = setup
+    facade.delete_user(ids['host'])
+    with count_queries() as statements:
+        purged = facade.purge_deleted(batch_size=5)
+    assert purged == {'place_amenity': 3, 'reviews': 13, 'places': 3, 'users': 1}
+    # 13 reviews in chunks of 5: three DELETEs
+    assert len([statement for statement in statements if statement.startswith("DELETE FROM reviews")]) == 3
+
+    assert count(Review, include_deleted=True) == 1
+    assert count(Place, include_deleted=True) == 1
+    assert count(User, include_deleted=True) == 6
+    assert db.session.scalar(db.select(db.func.count()).select_from(place_amenity)) == 0
+
+    # Nothing left to do
+    assert facade.purge_deleted() == {'place_amenity': 0, 'reviews': 0, 'places': 0, 'users': 0}
+
+
+def test_email_is_held_until_purge(setup):
+    app, facade, ids, headers = setup
+    facade.delete_user(ids['host'])
+    new_host = {'first_name': "New", 'last_name': "Host", 'email': "host@hbnb.com", 'password': "new123"}
+    with pytest.raises(DuplicateValueError):
+        facade.create_user(new_host)
+
+    facade.purge_deleted()
+    assert facade.create_user(new_host).email == "host@hbnb.com"
+
+
+def test_delete_queues_the_purge(setup):
+    app, facade, ids, headers = setup
+    facade.delete_place(ids['places'][0])
+    job = db.session.scalars(db.select(Job)).one()
+    assert (job.name, job.status) == ('purge_deleted', Job.QUEUED)
+
+    assert Worker().run_pending() == {'done': 1, 'retried': 0, 'failed': 0}
+    assert count(Place, include_deleted=True) == 3
+    assert count(Review, include_deleted=True) == 10
+    assert db.session.scalar(db.select(db.func.count(Job.id))) == 0
+
+
+def test_deleted_rows_are_not_written_or_refreshed(setup):
+    app, facade, ids, headers = setup
+    client = app.test_client()
+    user = facade.get_user(ids['host'])
+    place = db.session.get(Place, ids['places'][0])
+    assert client.delete(f"/api/v2/users/{ids['host']}", headers=headers).status_code == 204
+
+    # Writes by id do not match the flagged rows
+    assert client.put(f"/api/v2/users/{ids['host']}/admin", json={'first_name': "Ghost"},
+                      headers=headers).status_code == 404
+    assert facade.update_place(ids['places'][0], {'title': "Ghost"}) is None
+    facade._apply_rating_delta(ids['places'][0], 1, 5)
+    db.session.commit()
+    assert db.session.execute(db.select(Place.review_count, Place.title).where(Place.id == ids['places'][0])
+                              .execution_options(**{INCLUDE_DELETED: True})).one() == (4, "Loft 0")
+
+    # Instances loaded before the delete are not brought back by a refresh
+    db.session.expire_all()
+    with pytest.raises(ObjectDeletedError):
+        user.first_name
+    with pytest.raises(ObjectDeletedError):
+        place.title
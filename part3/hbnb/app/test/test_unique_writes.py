@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the uniqueness of user emails and amenity names, enforced by the unique indexes
+Run from project root: python -m pytest app/test/test_unique_writes.py
+"""
+
+import pytest
+
+from app.extensions import db
+from app.models import Amenity, User
+from app.persistence.repository import DuplicateValueError
+from app.test.query_counter import count_queries, fresh_request
+
+
+@pytest.fixture
+def setup(client, facade, admin, auth_headers):
+    facade.create_amenity({'name': "WiFi"})
+    return client, facade, auth_headers(admin)
+
+
+def count(model):
+    return db.session.scalar(db.select(db.func.count(model.id)))
+
+
+def test_duplicates_raise_the_same_error(setup):
+    client, facade, headers = setup
+    with pytest.raises(ValueError, match="Amenity with name 'WiFi' already exists."):
+        facade.create_amenity({'name': "WiFi"})
+    with pytest.raises(DuplicateValueError, match="User with email 'admin@hbnb.com' already exists."):
+        facade.create_user({'first_name': "Other", 'last_name': "Test",
+                            'email': "admin@hbnb.com", 'password': "other123"})
+    assert count(Amenity) == 1
+    assert count(User) == 1
+
+    response = client.post('/api/v2/amenities/', json={'name': "WiFi"}, headers=headers)
+    assert response.status_code == 409
+    assert response.get_json()['message'] == "Amenity with name 'WiFi' already exists."
+
+    pool = facade.create_amenity({'name': "Pool"})
+    with pytest.raises(ValueError, match="already exists"):
+        facade.update_amenity(pool.id, {'name': "WiFi"})
+    assert db.session.get(Amenity, pool.id).name == "Pool"
+
+
+def test_conflict_keeps_the_enclosing_transaction(setup):
+    client, facade, headers = setup
+    with facade.transaction():
+        facade.create_amenity({'name': "Sauna"})
+        with pytest.raises(ValueError, match="already exists"):
+            facade.create_amenity({'name': "WiFi"})
+        facade.create_amenity({'name': "Garden"})
+    db.session.expunge_all()
+    assert sorted(amenity.name for amenity in facade.get_all_amenities()) == ["Garden", "Sauna", "WiFi"]
+
+    # A rolled back block leaves nothing behind, conflict or not
+    with pytest.raises(ValueError):
+        with facade.transaction():
+            facade.create_amenity({'name': "Spa"})
+            facade.create_amenity({'name': "WiFi"})
+    assert count(Amenity) == 3
+
+
+def test_other_integrity_errors_are_not_duplicates(setup):
+    client, facade, headers = setup
+    from sqlalchemy.exc import IntegrityError
+    with pytest.raises(IntegrityError):
+        facade.create_user({'first_name': "No", 'last_name': "Password", 'email': "nopass@hbnb.com"})
+
+
+def test_create_does_not_look_up_first(setup):
+    client, facade, headers = setup
+    fresh_request(facade)
+    with count_queries() as statements:
+        facade.create_amenity({'name': "Sauna"})
+    assert [statement.split()[0] for statement in statements] == ['SAVEPOINT', 'INSERT', 'RELEASE']
+
+    # The existence query only runs on a conflict
+    with count_queries() as statements:
+        with pytest.raises(ValueError):
+            facade.create_amenity({'name': "Sauna"})
+    assert [statement.split()[0] for statement in statements] == ['SAVEPOINT', 'INSERT', 'ROLLBACK', 'SELECT']
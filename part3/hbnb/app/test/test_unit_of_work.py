@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the unit of work: one commit per write request or facade.transaction() block
+Run from project root: python -m pytest app/test/test_unit_of_work.py
+"""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app.extensions import db
+from app.models import Amenity, Place, Review
+
+
+@contextmanager
+def count_commits():
+    """Collect the COMMITs sent to the database inside the block."""
+    commits = []
+
+    def commit(conn):
+        commits.append(conn)
+
+    event.listen(db.engine, 'commit', commit)
+    try:
+        yield commits
+    finally:
+        event.remove(db.engine, 'commit', commit)
+
+
+@pytest.fixture
+def setup(client, facade, host, guest, seeded_place, access_token):
+    for name in ("WiFi", "Pool"):
+        facade.create_amenity({'name': name})
+    tokens = {'host': access_token(host), 'guest': access_token(guest)}
+    return client, facade, tokens, {'guest': guest.id, 'place': seeded_place.id}
+
+
+def auth(token):
+    return {'Authorization': f'Bearer {token}'}
+
+
+def count(model):
+    return db.session.scalar(db.select(db.func.count(model.id)))
+
+
+def test_write_request_commits_once(setup):
+    client, facade, tokens, ids = setup
+    place = {'title': "Hut", 'price': 20.0, 'latitude': 45.1, 'longitude': 6.0,
+             'amenities': ["WiFi", "Pool"]}
+    with count_commits() as commits:
+        response = client.post('/api/v2/places/', json=place, headers=auth(tokens['host']))
+    assert response.status_code == 201
+    assert response.get_json()['created_at'] is not None
+    assert len(commits) == 1
+
+    review = {'text': "Great", 'rating': 5, 'user_id': ids['guest'], 'place_id': ids['place']}
+    with count_commits() as commits:
+        assert client.post('/api/v2/reviews/', json=review, headers=auth(tokens['guest'])).status_code == 201
+    assert len(commits) == 1
+
+
+def test_read_and_failed_requests_do_not_commit(setup):
+    client, facade, tokens, ids = setup
+    with count_commits() as commits:
+        assert client.get('/api/v2/places/').status_code == 200
+        place = {'title': "Hut", 'price': 20.0, 'latitude': 45.1, 'longitude': 6.0,
+                 'amenities': ["Sauna"]}
+        assert client.post('/api/v2/places/', json=place, headers=auth(tokens['host'])).status_code == 400
+    assert commits == []
+    assert count(Place) == 1
+
+
+def test_transaction_block_is_atomic(setup):
+    client, facade, tokens, ids = setup
+    with count_commits() as commits:
+        with facade.transaction():
+            facade.create_amenity({'name': "Sauna"})
+            facade.create_review({'text': "Great", 'rating': 5,
+                                  'user_id': ids['guest'], 'place_id': ids['place']})
+    assert len(commits) == 1
+
+    with pytest.raises(ValueError):
+        with facade.transaction():
+            facade.create_amenity({'name': "Garden"})
+            facade.create_review({'text': "Again", 'rating': 1,
+                                  'user_id': ids['guest'], 'place_id': ids['place']})
+    assert count(Amenity) == 3
+    assert count(Review) == 1
+    assert db.session.get(Place, ids['place']).review_count == 1
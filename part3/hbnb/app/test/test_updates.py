@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-statement update path (UPDATE ... RETURNING) of the facade
+Run from project root: python -m pytest app/test/test_updates.py
+"""
+
+import pytest
+
+from app.extensions import db
+from app.models import Place, User
+from app.services.geo import geo_cell
+from app.test.query_counter import count_queries, fresh_request
+
+
+@pytest.fixture
+def setup(client, facade, host, guest, admin, auth_headers):
+    wifi = facade.create_amenity({'name': "WiFi"})
+    facade.create_amenity({'name': "Pool"})
+    place = facade.create_place({'title': "Loft", 'price': 80.0, 'owner_id': host.id,
+                                 'latitude': 48.8, 'longitude': 2.3, 'amenities': ["WiFi"]})
+    review = facade.create_review({'text': "Nice", 'rating': 4, 'user_id': guest.id, 'place_id': place.id})
+
+    ids = {'host': host.id, 'guest': guest.id, 'admin': admin.id, 'place': place.id,
+           'review': review.id, 'wifi': wifi.id}
+    headers = {name: auth_headers(user) for name, user in (('host', host), ('guest', guest), ('admin', admin))}
+    return client, facade, ids, headers
+
+
+def test_update_is_one_statement(setup):
+    client, facade, ids, headers = setup
+    fresh_request(facade)
+    with count_queries() as statements:
+        row = facade.update_user(ids['guest'], {'first_name': "Gus", 'email': "ignored@hbnb.com"})
+    # Then the user's places (ids selected for the cache) and reviews, which embed the name
+    assert len(statements) == 4
+    assert statements[0].startswith("UPDATE users SET first_name=?, updated_at=?")
+    assert "RETURNING" in statements[0]
+    assert [statement.split()[0] for statement in statements[1:]] == ['SELECT', 'UPDATE', 'UPDATE']
+    assert (row.first_name, row.email) == ("Gus", "guest@hbnb.com")
+    assert row.updated_at > row.created_at
+
+    assert facade.update_user("unknown", {'first_name': "Nobody"}) is None
+    assert facade.update_amenity("unknown", {'name': "Spa"}) is None
+    assert facade.update_place("unknown", {'price': 1.0}) is None
+    assert facade.update_review("unknown", {'rating': 1}) is None
+
+
+def test_responses_match_reads(setup):
+    client, facade, ids, headers = setup
+    response = client.put(f"/api/v2/users/{ids['guest']}", json={'first_name': "Gus"}, headers=headers['guest'])
+    assert response.status_code == 200
+    fresh_request(facade)
+    assert response.get_json() == facade.get_user(ids['guest']).to_dict()
+
+    response = client.put(f"/api/v2/amenities/{ids['wifi']}", json={'name': "Fiber"}, headers=headers['admin'])
+    assert response.status_code == 200
+    fresh_request(facade)
+    assert response.get_json() == facade.get_amenity(ids['wifi']).to_dict()
+
+    response = client.put(f"/api/v2/reviews/{ids['review']}", json={'text': "Great", 'rating': 5},
+                          headers=headers['guest'])
+    assert response.status_code == 200
+    fresh_request(facade)
+    review = client.get(f"/api/v2/reviews/{ids['review']}").get_json()
+    assert response.get_json() == review
+    assert review['text'] == "Great"
+
+    response = client.put(f"/api/v2/places/{ids['place']}", json={'price': 95.0}, headers=headers['host'])
+    assert response.status_code == 200
+    assert response.get_json()['price'] == 95.0
+    assert response.get_json()['owner']['id'] == ids['host']
+    assert [amenity['name'] for amenity in response.get_json()['amenities']] == ["Fiber"]
+    assert response.get_json()['avg_rating'] == 5.0
+    fresh_request(facade)
+    assert response.get_data() == client.get(f"/api/v2/places/{ids['place']}").get_data()
+
+    assert client.put("/api/v2/amenities/unknown", json={'name': "Spa"},
+                      headers=headers['admin']).status_code == 404
+
+
+def test_admin_update_hashes_the_password(setup):
+    client, facade, ids, headers = setup
+    response = client.put(f"/api/v2/users/{ids['guest']}/admin",
+                          json={'email': "gus@hbnb.com", 'password': "new-secret"}, headers=headers['admin'])
+    assert response.status_code == 200
+    assert response.get_json()['email'] == "gus@hbnb.com"
+    assert 'password' not in response.get_json()
+    fresh_request(facade)
+    user = db.session.get(User, ids['guest'])
+    assert user.verify_password("new-secret")
+
+    with pytest.raises(ValueError, match="already exists"):
+        facade.update_user_by_admin(ids['guest'], {'email': "host@hbnb.com"})
+    assert db.session.get(User, ids['guest']).email == "gus@hbnb.com"
+
+
+def test_place_update_keeps_derived_columns(setup):
+    client, facade, ids, headers = setup
+    # Only one coordinate: the grid cell still follows both
+    facade.update_place(ids['place'], {'latitude': 45.76})
+    fresh_request(facade)
+    place = db.session.get(Place, ids['place'])
+    assert place.geo_cell == geo_cell(45.76, 2.3)
+
+    with pytest.raises(ValueError):
+        facade.update_place(ids['place'], {'longitude': 500.0})
+
+    # Relationships still go through the ORM, scalars with the same UPDATE
+    facade.update_place(ids['place'], {'amenities': ["Pool"], 'title': "Attic"})
+    fresh_request(facade)
+    details = facade.get_place_details(ids['place'])
+    assert details['title'] == "Attic"
+    assert [amenity['name'] for amenity in details['amenities']] == ["Pool"]
+
+
+def test_server_maintained_columns_are_not_written(setup):
+    client, facade, ids, headers = setup
+    forged = {'avg_rating': 5.0, 'review_count': 999, 'rating_sum': 4995, 'geo_cell': "0:0",
+              'id': "forged", 'created_at': "2020-01-01", 'deleted_at': "2020-01-01", 'title': "Studio"}
+    response = client.put(f"/api/v2/places/{ids['place']}", json=forged, headers=headers['host'])
+    assert response.status_code == 200
+    assert (response.get_json()['id'], response.get_json()['title']) == (ids['place'], "Studio")
+    fresh_request(facade)
+    place = db.session.get(Place, ids['place'])
+    assert (place.avg_rating, place.review_count, place.rating_sum) == (4.0, 1, 4)
+    assert place.geo_cell == geo_cell(48.8, 2.3)
+    assert client.get("/api/v2/places/", query_string={'min_rating': 4.9}).get_json() == []
+
+    response = client.put(f"/api/v2/users/{ids['guest']}/admin",
+                          json={'first_name': "Gus", 'deleted_at': "2020-01-01", 'id': "forged"},
+                          headers=headers['admin'])
+    assert response.status_code == 200
+    assert response.get_json()['id'] == ids['guest']
+    assert client.put(f"/api/v2/reviews/{ids['review']}", json={'text': "Good", 'place_id': "forged"},
+                      headers=headers['guest']).status_code == 200
+    assert facade.get_review(ids['review']).place_id == ids['place']
+
+
+def test_update_evicts_cached_details(setup):
+    client, facade, ids, headers = setup
+    assert client.get(f"/api/v2/places/{ids['place']}").get_json()['title'] == "Loft"
+    assert client.put(f"/api/v2/places/{ids['place']}", json={'title': "Studio"},
+                      headers=headers['host']).status_code == 200
+    assert client.get(f"/api/v2/places/{ids['place']}").get_json()['title'] == "Studio"
@@ -0,0 +1,5 @@
+import os
+from app.asgi import create_asgi_app
+
+# Experimental, see the README: uvicorn asgi:app --workers 4 (async read routes, Flask for the rest)
+app = create_asgi_app(os.getenv('HBNB_CONFIG', 'config.DevelopmentConfig'))
@@ -1,6 +1,8 @@
+import os
 from app import create_app
 
-app = create_app()
+# e.g. HBNB_CONFIG=config.ProductionConfig DATABASE_URL=mysql://...
+app = create_app(os.getenv('HBNB_CONFIG', 'config.DevelopmentConfig'))
 
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
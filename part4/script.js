@@ -4,9 +4,6 @@ const API_LOGIN_URL = `${API_BASE_URL}/api/v2/auth/login`;
 const API_PLACES_URL = `${API_BASE_URL}/api/v2/places/`;
 const API_REVIEWS_URL = `${API_BASE_URL}/api/v2/reviews/`;
 
-// Global variable to store all places for filtering
-let allPlaces = [];
-
 // ==================== COOKIE & TOKEN MANAGEMENT ====================
 
 function getCookie(name) {
@@ -51,14 +48,14 @@ function deleteToken() {
 
 /**
  * Abstract function for all Fetch requests.
- * Handles Authorization header, 401 errors, and JSON parsing.
+ * Handles Authorization header, 401 errors and HTTP errors.
  * @param {string} url - API endpoint URL.
  * @param {string} method - HTTP method (GET, POST, etc.).
  * @param {Object | null} body - Request body object.
  * @param {string | null} token - JWT token for Authorization header.
- * @returns {Promise<Object>} The parsed JSON response data.
+ * @returns {Promise<Response>} The successful fetch Response.
  */
-async function apiFetch(url, method = 'GET', body = null, token = null) {
+async function apiRequest(url, method = 'GET', body = null, token = null) {
     const headers = {
         'Content-Type': 'application/json'
     };
@@ -94,9 +91,31 @@ async function apiFetch(url, method = 'GET', body = null, token = null) {
         throw new Error(errorData.message || response.statusText);
     }
 
+    return response;
+}
+
+/**
+ * Performs a request and parses the JSON response.
+ * @returns {Promise<Object>} The parsed JSON response data.
+ */
+async function apiFetch(url, method = 'GET', body = null, token = null) {
+    const response = await apiRequest(url, method, body, token);
     return response.json();
 }
 
+/**
+ * Fetches one page of a cursor-paginated list endpoint.
+ * @param {string|null} cursor - X-Next-Cursor of the previous page, null for the first one.
+ * @returns {Promise<{items: Array, nextCursor: string|null}>} The page and the cursor of the next one.
+ */
+async function apiFetchPage(url, cursor = null, token = null) {
+    const pageUrl = new URL(url);
+    if (cursor) pageUrl.searchParams.set('cursor', cursor);
+
+    const response = await apiRequest(pageUrl.toString(), 'GET', null, token);
+    return { items: await response.json(), nextCursor: response.headers.get('X-Next-Cursor') };
+}
+
 // ==================== AUTHENTICATION & UI ====================
 
 function checkAuthentication() {
@@ -143,33 +162,78 @@ function getPlaceIdFromURL() {
 
 // ==================== FETCH PLACES (UNIFIED) ====================
 
-async function fetchPlaces(token = null) {
+// Listing being shown: its URL (filters included) and the cursor of its next page
+let placesPageUrl = null;
+let placesNextCursor = null;
+
+/**
+ * Loads the first page of places; the next ones are fetched on demand
+ * with the "Load more" button (see loadMorePlaces).
+ */
+async function fetchPlaces(token = null, filters = {}) {
     const placesList = document.getElementById('places-list');
     if (!placesList) return;
     
     placesList.innerHTML = '<p>Loading places...</p>';
     
     try {
-        const places = await apiFetch(API_PLACES_URL, 'GET', null, token);
-        allPlaces = places;
-        displayPlaces(places);
+        const placesUrl = new URL(API_PLACES_URL);
+        Object.entries(filters).forEach(([key, value]) => placesUrl.searchParams.set(key, value));
+        placesPageUrl = placesUrl.toString();
+
+        const page = await apiFetchPage(placesPageUrl, null, token);
+        placesNextCursor = page.nextCursor;
+        displayPlaces(page.items);
     } catch (error) {
         console.error('Error fetching places:', error);
+        placesNextCursor = null;
         placesList.innerHTML = `<p>Failed to load places: ${error.message || 'Network error'}.</p>`;
     }
+    updateLoadMoreButton();
+}
+
+/**
+ * Appends the next page of the current listing.
+ */
+async function loadMorePlaces() {
+    if (!placesNextCursor) return;
+    const loadMoreButton = document.getElementById('load-more');
+    if (loadMoreButton) loadMoreButton.disabled = true;
+
+    try {
+        const page = await apiFetchPage(placesPageUrl, placesNextCursor, getToken());
+        placesNextCursor = page.nextCursor;
+        displayPlaces(page.items, true);
+    } catch (error) {
+        console.error('Error fetching more places:', error);
+        alert(`Failed to load more places: ${error.message || 'Network error'}.`);
+    }
+    if (loadMoreButton) loadMoreButton.disabled = false;
+    updateLoadMoreButton();
+}
+
+function updateLoadMoreButton() {
+    const loadMoreButton = document.getElementById('load-more');
+    if (loadMoreButton) loadMoreButton.style.display = placesNextCursor ? 'block' : 'none';
 }
 
 // ==================== DISPLAY PLACES ====================
 
-function displayPlaces(places) {
+/**
+ * Renders places as cards.
+ * @param {boolean} append - Add them after the cards shown instead of replacing them.
+ */
+function displayPlaces(places, append = false) {
     const placesList = document.getElementById('places-list');
     if (!placesList) return;
 
-    placesList.innerHTML = '';
+    if (!append) {
+        placesList.innerHTML = '';
 
-    if (!places || places.length === 0) {
-        placesList.innerHTML = '<p>No places available.</p>';
-        return;
+        if (!places || places.length === 0) {
+            placesList.innerHTML = '<p>No places available.</p>';
+            return;
+        }
     }
 
     places.forEach(place => {
@@ -189,21 +253,19 @@ function displayPlaces(places) {
     });
 }
 
-// ==================== CLIENT-SIDE FILTER ====================
+// ==================== SERVER-SIDE FILTER ====================
 
+/**
+ * Reloads the place list with a max_price filter applied by the API,
+ * so only matching places are downloaded.
+ * @param {string} maxPrice - Selected maximum price or 'all'.
+ */
 function filterPlacesByPrice(maxPrice) {
-    const placeCards = document.querySelectorAll('.place-card');
-    
-    placeCards.forEach(card => {
-        const price = parseFloat(card.dataset.price) || 0;
-        
-        if (maxPrice === 'all') {
-            card.style.display = 'block';
-        } else {
-            const priceLimit = parseFloat(maxPrice);
-            card.style.display = price <= priceLimit ? 'block' : 'none';
-        }
-    });
+    const filters = {};
+    if (maxPrice !== 'all') {
+        filters.max_price = maxPrice;
+    }
+    fetchPlaces(getToken(), filters);
 }
 
 // ==================== FETCH PLACE DETAILS (UNIFIED) ====================
@@ -347,6 +409,12 @@ document.addEventListener('DOMContentLoaded', () => {
         });
     }
 
+    // ========== LOAD MORE PLACES ==========
+    const loadMoreButton = document.getElementById('load-more');
+    if (loadMoreButton) {
+        loadMoreButton.addEventListener('click', loadMorePlaces);
+    }
+
     // ========== LOGIN FORM ==========
     const loginForm = document.getElementById('login-form');
     if (loginForm) {